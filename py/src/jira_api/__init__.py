@@ -2,20 +2,44 @@
 
 A comprehensive Python package for interacting with Jira Cloud REST API v3.
 Provides multiple interfaces: Direct Import, CLI, FastAPI Server, and SDK Client.
+
+Public names are imported on first access (PEP 562), so importing a light
+submodule such as ``jira_api.exceptions`` does not load httpx or pydantic.
 """
 
-from jira_api.core.client import JiraClient
-from jira_api.exceptions import JiraAPIError, JiraAuthenticationError, JiraNotFoundError
-from jira_api.models.issue import Issue, IssueCreate, IssueUpdate
-from jira_api.models.project import Project, ProjectVersion
-from jira_api.models.user import User
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from jira_api.core.async_client import JiraAsyncClient
+    from jira_api.core.client import JiraClient
+    from jira_api.exceptions import JiraAPIError, JiraAuthenticationError, JiraNotFoundError
+    from jira_api.models.issue import Issue, IssueCreate, IssueUpdate
+    from jira_api.models.project import Project, ProjectVersion
+    from jira_api.models.user import User
 
 __version__ = "0.1.0"
 __author__ = "Carlos Marte"
 __email__ = "carlos@example.com"
 
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    "JiraClient": "jira_api.core.client",
+    "JiraAsyncClient": "jira_api.core.async_client",
+    "JiraAPIError": "jira_api.exceptions",
+    "JiraAuthenticationError": "jira_api.exceptions",
+    "JiraNotFoundError": "jira_api.exceptions",
+    "Issue": "jira_api.models.issue",
+    "IssueCreate": "jira_api.models.issue",
+    "IssueUpdate": "jira_api.models.issue",
+    "Project": "jira_api.models.project",
+    "ProjectVersion": "jira_api.models.project",
+    "User": "jira_api.models.user",
+}
+
 __all__ = [
     "JiraClient",
+    "JiraAsyncClient",
     "JiraAPIError",
     "JiraAuthenticationError", 
     "JiraNotFoundError",
@@ -25,4 +49,20 @@ __all__ = [
     "Project",
     "ProjectVersion",
     "User",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access and cache it on the package."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the lazily imported public names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,156 @@
+"""Command-line interface for JIRA API operations.
+
+The ``issue``, ``user`` and ``project`` command groups live in their own
+modules, which ``LazyGroup`` imports only when a command from that group is
+requested.
+"""
+
+import importlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import click
+import typer
+from rich import print as rprint
+from typer.core import TyperGroup
+
+from jira_api.exceptions import JiraAPIError
+
+# Command group name -> (module, attribute holding its Typer app)
+LAZY_SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    "issue": ("jira_api.cli.issue", "issue_app"),
+    "user": ("jira_api.cli.user", "user_app"),
+    "project": ("jira_api.cli.project", "project_app"),
+}
+
+
+@lru_cache(maxsize=None)
+def _load_subcommand(cmd_name: str) -> click.Command:
+    """Import a lazy command group and build its Click command, once per process.
+
+    Click asks for the same group several times during one invocation (name
+    resolution, help listing, shell completion), and converting a Typer app
+    into Click parameters is the expensive part of startup.
+
+    Args:
+        cmd_name: Name of a group in ``LAZY_SUBCOMMANDS``
+
+    Returns:
+        Click command for the group
+    """
+    module_name, attr = LAZY_SUBCOMMANDS[cmd_name]
+    sub_app = getattr(importlib.import_module(module_name), attr)
+    command = typer.main.get_command(sub_app)
+    command.name = cmd_name
+    return command
+
+
+class LazyGroup(TyperGroup):
+    """Click group that loads the sub-command groups on demand."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eager commands together with the lazily loaded groups."""
+        return sorted([*super().list_commands(ctx), *LAZY_SUBCOMMANDS])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return a command, importing its module first if it is a lazy group."""
+        if cmd_name not in LAZY_SUBCOMMANDS:
+            return super().get_command(ctx, cmd_name)
+        return _load_subcommand(cmd_name)
+
+
+app = typer.Typer(cls=LazyGroup, help="JIRA API Command Line Interface")
+
+
+@app.command()
+def configure() -> None:
+    """Configure JIRA API credentials interactively."""
+    from rich.prompt import Confirm, Prompt
+
+    from jira_api.config import JiraConfig, get_config_from_env, save_config
+    from jira_api.core.client import JiraClient
+    from jira_api.services.user_service import UserService
+
+    rprint("[bold]JIRA API Configuration[/bold]")
+    
+    # Check if environment variables are already set; the .env file is only
+    # parsed when os.environ alone does not hold all three values
+    env_config = get_config_from_env()
+    
+    if env_config:
+        rprint("[green]Found existing environment variable configuration:[/green]")
+        rprint(f"  JIRA_BASE_URL: {env_config.base_url}")
+        rprint(f"  JIRA_EMAIL: {env_config.email}")
+        rprint(f"  JIRA_API_TOKEN: {'*' * len(env_config.api_token)}")
+        
+        if Confirm.ask("Use existing environment variable configuration?"):
+            base_url = env_config.base_url
+            email = env_config.email
+            api_token = env_config.api_token
+        else:
+            rprint("Please provide new JIRA instance details:")
+            base_url = Prompt.ask("JIRA base URL (e.g., https://company.atlassian.net)")
+            email = Prompt.ask("Your email address")
+            api_token = Prompt.ask("API token", password=True)
+    else:
+        rprint("Please provide your JIRA instance details:")
+        base_url = Prompt.ask("JIRA base URL (e.g., https://company.atlassian.net)")
+        email = Prompt.ask("Your email address")
+        api_token = Prompt.ask("API token", password=True)
+
+    # Validate the configuration by testing connection
+    rprint("\n[yellow]Testing connection...[/yellow]")
+    
+    try:
+        with JiraClient(base_url, email, api_token) as client:
+            # Try to get user info to verify credentials
+            user_service = UserService(client)
+            user = user_service.get_user_by_email(email)
+            
+            if user:
+                rprint(f"[green]✓ Connection successful! Welcome, {user.display_name}[/green]")
+            else:
+                rprint("[green]✓ Connection successful![/green]")
+    
+    except JiraAPIError as e:
+        rprint(f"[red]✗ Connection failed: {e}[/red]")
+        if not Confirm.ask("Save configuration anyway?"):
+            rprint("Configuration cancelled.")
+            raise typer.Exit(1)
+
+    config = JiraConfig(base_url=base_url, email=email, api_token=api_token)
+    save_config(config)
+    
+    rprint("[green]Configuration saved successfully![/green]")
+
+
+@app.command()
+def server(
+    host: str = typer.Option("0.0.0.0", "--host", help="Host to bind to"),
+    port: int = typer.Option(8000, "--port", help="Port to bind to"),
+    reload: bool = typer.Option(False, "--reload", help="Enable auto-reload"),
+    workers: int = typer.Option(
+        1, "--workers", min=1, help="Worker processes (ignored with --reload)"
+    ),
+) -> None:
+    """Start the FastAPI server."""
+    try:
+        import uvicorn
+        
+        rprint(f"[green]Starting JIRA API server on {host}:{port}[/green]")
+        # An import string lets uvicorn start workers and reload the app
+        uvicorn.run(
+            "jira_api.server:app",
+            host=host,
+            port=port,
+            reload=reload,
+            workers=None if reload else workers,
+        )
+    except ImportError:
+        rprint("[red]Error: uvicorn not installed. Install with 'pip install uvicorn'[/red]")
+        raise typer.Exit(1)
+
+
+def main() -> None:
+    """Main entry point for the CLI."""
+    app()
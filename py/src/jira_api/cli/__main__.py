@@ -0,0 +1,5 @@
+"""Allow running the CLI with ``python -m jira_api.cli``."""
+
+from jira_api.cli import main
+
+main()
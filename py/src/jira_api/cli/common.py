@@ -0,0 +1,109 @@
+"""Helpers shared by the CLI command modules."""
+
+import atexit
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import typer
+from rich import print as rprint
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from rich.console import Console
+
+    from jira_api.core.client import JiraClient
+    from jira_api.services.issue_service import IssueService
+    from jira_api.services.project_service import ProjectService
+    from jira_api.services.user_service import UserService
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Get the console used to render tables, creating it on first use.
+
+    Creating a ``Console`` probes the terminal, so commands that never print
+    a table (``configure``, ``server``, errors) skip that work.
+
+    Returns:
+        Shared rich Console instance
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def dump_json(model: "BaseModel") -> str:
+    """Serialize a model for ``--json`` output.
+
+    Encodes with orjson rather than pydantic's JSON serializer, which is
+    noticeably faster for large, deeply nested issues.
+
+    Args:
+        model: Model to serialize
+
+    Returns:
+        Indented JSON text
+    """
+    import orjson
+
+    return orjson.dumps(model.model_dump(mode="json"), option=orjson.OPT_INDENT_2).decode()
+
+
+@lru_cache(maxsize=1)
+def get_client() -> "JiraClient":
+    """Get the configured JIRA client, shared by every command in the process.
+
+    The client is created on first use and closed at interpreter exit, so
+    commands invoked repeatedly in one process reuse its connection pool.
+
+    Returns:
+        JiraClient instance
+
+    Raises:
+        typer.Exit: If configuration is not available
+    """
+    from jira_api.config import get_config
+    from jira_api.core.client import JiraClient
+
+    config = get_config()
+    if not config:
+        rprint("[red]Error: JIRA configuration not found.[/red]")
+        rprint("Run 'jira-api configure' to set up your credentials.")
+        raise typer.Exit(1)
+
+    try:
+        client = JiraClient(
+            base_url=config.base_url,
+            email=config.email,
+            api_token=config.api_token,
+        )
+    except Exception as e:
+        rprint(f"[red]Error creating JIRA client: {e}[/red]")
+        raise typer.Exit(1)
+
+    atexit.register(client.close)
+    return client
+
+
+@lru_cache(maxsize=1)
+def get_issue_service() -> "IssueService":
+    """Get the issue service for the shared client."""
+    from jira_api.services.issue_service import IssueService
+
+    return IssueService(get_client())
+
+
+@lru_cache(maxsize=1)
+def get_project_service() -> "ProjectService":
+    """Get the project service for the shared client."""
+    from jira_api.services.project_service import ProjectService
+
+    return ProjectService(get_client())
+
+
+@lru_cache(maxsize=1)
+def get_user_service() -> "UserService":
+    """Get the user service for the shared client."""
+    from jira_api.services.user_service import UserService
+
+    return UserService(get_client())
@@ -0,0 +1,312 @@
+"""Issue commands for the CLI."""
+
+import re
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+import typer
+from rich import print as rprint
+
+from jira_api.cli.common import dump_json, get_console, get_client, get_issue_service
+from jira_api.exceptions import JiraAPIError
+
+issue_app = typer.Typer(help="Issue operations")
+
+# Splits comma-separated option values, dropping whitespace around the commas
+_CSV = re.compile(r"\s*,\s*")
+
+
+# JIRA fields read by _display_issue_table
+_DISPLAY_FIELDS = (
+    "summary",
+    "status",
+    "issuetype",
+    "project",
+    "assignee",
+    "reporter",
+    "priority",
+    "labels",
+    "created",
+    "updated",
+)
+
+
+def _parse_labels(labels: Optional[str]) -> List[str]:
+    """Split a comma-separated labels option into a list of labels."""
+    return _CSV.split(labels.strip()) if labels else []
+
+
+@issue_app.command("get")
+def get_issue(
+    key: str = typer.Argument(..., help="Issue key (e.g., PROJ-123)"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+) -> None:
+    """Get details of an issue."""
+    try:
+        issue_service = get_issue_service()
+        # The table shows only a few fields, so request just those
+        issue = issue_service.get_issue(key, fields=None if json_output else _DISPLAY_FIELDS)
+
+        if json_output:
+            print(dump_json(issue))
+        else:
+            _display_issue_table(issue)
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@issue_app.command("create")
+def create_issue(
+    project: str = typer.Option(..., "--project", "-p", help="Project key"),
+    summary: str = typer.Option(..., "--summary", "-s", help="Issue summary"),
+    issue_type: str = typer.Option(..., "--type", "-t", help="Issue type ID"),
+    description: Optional[str] = typer.Option(None, "--description", "-d", help="Issue description"),
+    assignee: Optional[str] = typer.Option(None, "--assignee", "-a", help="Assignee email"),
+    labels: Optional[str] = typer.Option(None, "--labels", "-l", help="Comma-separated labels"),
+) -> None:
+    """Create a new issue."""
+    try:
+        issue_service = get_issue_service()
+            
+        label_list = _parse_labels(labels)
+            
+        # JIRA validates the project key itself, so it is not fetched first
+        issue = issue_service.create_issue(
+            project_id=None,
+            project_key=project,
+            summary=summary,
+            issue_type_id=issue_type,
+            description=description,
+            assignee_email=assignee,
+            labels=label_list,
+        )
+
+        rprint(f"[green]✓ Issue created successfully: {issue.key}[/green]")
+        _display_issue_table(issue)
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@issue_app.command("create-by-name")
+def create_issue_by_type_name(
+    project: str = typer.Option(..., "--project", "-p", help="Project key"),
+    summary: str = typer.Option(..., "--summary", "-s", help="Issue summary"),
+    issue_type_name: str = typer.Option(..., "--type-name", "-t", help="Issue type name (e.g., 'Bug', 'Story', 'Task')"),
+    description: Optional[str] = typer.Option(None, "--description", "-d", help="Issue description"),
+    assignee: Optional[str] = typer.Option(None, "--assignee", "-a", help="Assignee email"),
+    labels: Optional[str] = typer.Option(None, "--labels", "-l", help="Comma-separated labels"),
+) -> None:
+    """Create a new issue using issue type name instead of ID."""
+    try:
+        issue_service = get_issue_service()
+            
+        label_list = _parse_labels(labels)
+            
+        issue = issue_service.create_issue_by_type_name(
+            project_key=project,
+            summary=summary,
+            issue_type_name=issue_type_name,
+            description=description,
+            assignee_email=assignee,
+            labels=label_list,
+        )
+
+        rprint(f"[green]✓ Issue created successfully: {issue.key}[/green]")
+        _display_issue_table(issue)
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@issue_app.command("list-types")
+def list_issue_types(
+    project: str = typer.Argument(..., help="Project key"),
+) -> None:
+    """List available issue types for a project."""
+    from rich.table import Table
+
+    try:
+        issue_types = get_client().get_project_issue_types(project)
+
+        if not issue_types:
+            rprint(f"[yellow]No issue types found for project {project}[/yellow]")
+            return
+
+        table = Table(title=f"Issue Types for Project {project}")
+        table.add_column("ID", style="cyan")
+        table.add_column("Name", style="green")
+        table.add_column("Description", style="white")
+        table.add_column("Subtask", style="yellow")
+
+        for issue_type in issue_types:
+            description = issue_type.get("description") or ""
+            if len(description) > 50:
+                description = description[:50] + "..."
+            table.add_row(
+                issue_type.get("id", ""),
+                issue_type.get("name", ""),
+                description,
+                "✓" if issue_type.get("subtask", False) else "✗",
+            )
+
+        get_console().print(table)
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@issue_app.command("update")
+def update_issue(
+    key: str = typer.Argument(..., help="Issue key (e.g., PROJ-123)"),
+    summary: Optional[str] = typer.Option(None, "--summary", "-s", help="New summary"),
+    add_labels: Optional[str] = typer.Option(None, "--add-labels", help="Labels to add (comma-separated)"),
+    remove_labels: Optional[str] = typer.Option(None, "--remove-labels", help="Labels to remove (comma-separated)"),
+) -> None:
+    """Update an existing issue."""
+    if not any([summary, add_labels, remove_labels]):
+        rprint("[red]Error: At least one update option must be provided[/red]")
+        raise typer.Exit(1)
+
+    try:
+        labels_to_add = _parse_labels(add_labels)
+        labels_to_remove = _parse_labels(remove_labels)
+
+        # Send every change in a single update request
+        issue_service = get_issue_service()
+        issue_service.update_issue_fields(
+            key,
+            summary=summary,
+            labels_add=labels_to_add,
+            labels_remove=labels_to_remove,
+        )
+
+        if summary:
+            rprint(f"[green]✓ Updated summary for {key}[/green]")
+        if labels_to_add:
+            rprint(f"[green]✓ Added labels to {key}: {', '.join(labels_to_add)}[/green]")
+        if labels_to_remove:
+            rprint(f"[green]✓ Removed labels from {key}: {', '.join(labels_to_remove)}[/green]")
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@issue_app.command("assign")
+def assign_issue(
+    key: str = typer.Argument(..., help="Issue key (e.g., PROJ-123)"),
+    email: str = typer.Argument(..., help="Assignee email address"),
+) -> None:
+    """Assign an issue to a user."""
+    try:
+        issue_service = get_issue_service()
+        issue_service.assign_issue_by_email(key, email)
+
+        rprint(f"[green]✓ Assigned {key} to {email}[/green]")
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@issue_app.command("transitions")
+def get_issue_transitions(
+    key: str = typer.Argument(..., help="Issue key (e.g., PROJ-123)"),
+) -> None:
+    """List available transitions for an issue."""
+    from rich.table import Table
+
+    try:
+        issue_service = get_issue_service()
+        transitions = issue_service.get_available_transitions(key)
+
+        if not transitions:
+            rprint(f"[yellow]No transitions available for {key}[/yellow]")
+            return
+
+        table = Table(title=f"Available Transitions for {key}")
+        table.add_column("ID", style="cyan")
+        table.add_column("Name", style="green")
+        table.add_column("To Status", style="yellow")
+
+        for transition in transitions:
+            table.add_row(transition.id, transition.name, transition.to.name)
+
+        get_console().print(table)
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@issue_app.command("transition")
+def transition_issue(
+    key: str = typer.Argument(..., help="Issue key (e.g., PROJ-123)"),
+    name: str = typer.Argument(..., help="Transition name"),
+    comment: Optional[str] = typer.Option(None, "--comment", "-c", help="Transition comment"),
+    resolution: Optional[str] = typer.Option(None, "--resolution", "-r", help="Resolution name"),
+) -> None:
+    """Transition an issue to a new status."""
+    try:
+        issue_service = get_issue_service()
+        issue_service.transition_issue_by_name(key, name, comment, resolution)
+
+        rprint(f"[green]✓ Transitioned {key} using '{name}'[/green]")
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+# Helper functions for displaying data
+
+def _format_timestamp(value: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp as ``YYYY-MM-DD HH:MM:SS``, dropping any UTC offset.
+
+    ``isoformat`` is used because it is much faster than ``strftime``.
+    """
+    if value is None:
+        return None
+    return value.replace(tzinfo=None).isoformat(" ", "seconds")
+
+
+# (row label, formatter) for the issue table; rows whose formatter returns
+# None are left out. Kept at module level so each render is a single loop.
+_ISSUE_ROWS: Tuple[Tuple[str, Callable[[Any], Optional[str]]], ...] = (
+    ("Key", lambda issue: issue.key),
+    ("Summary", lambda issue: issue.fields.summary),
+    ("Status", lambda issue: issue.fields.status.name),
+    ("Type", lambda issue: issue.fields.issue_type.name),
+    ("Project", lambda issue: f"{issue.fields.project.name} ({issue.fields.project.key})"),
+    (
+        "Assignee",
+        lambda issue: issue.fields.assignee.display_name if issue.fields.assignee else "Unassigned",
+    ),
+    ("Reporter", lambda issue: issue.fields.reporter and issue.fields.reporter.display_name),
+    ("Priority", lambda issue: issue.fields.priority and issue.fields.priority.name),
+    ("Labels", lambda issue: ", ".join(issue.fields.labels) if issue.fields.labels else None),
+    ("Created", lambda issue: _format_timestamp(issue.fields.created)),
+    ("Updated", lambda issue: _format_timestamp(issue.fields.updated)),
+)
+
+
+def _display_issue_table(issue) -> None:
+    """Display issue information in a formatted table."""
+    from rich.table import Table
+
+    table = Table(title=f"Issue: {issue.key}")
+    table.add_column("Field", style="cyan")
+    table.add_column("Value", style="white")
+
+    for label, format_value in _ISSUE_ROWS:
+        value = format_value(issue)
+        if value is not None:
+            table.add_row(label, value)
+
+    get_console().print(table)
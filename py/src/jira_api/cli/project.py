@@ -0,0 +1,101 @@
+"""Project commands for the CLI."""
+
+from typing import List, Optional
+
+import typer
+from rich import print as rprint
+
+from jira_api.cli.common import get_console, get_project_service
+from jira_api.exceptions import JiraAPIError
+
+project_app = typer.Typer(help="Project operations")
+
+
+@project_app.command("get")
+def get_project(
+    key: str = typer.Argument(..., help="Project key"),
+    versions: bool = typer.Option(False, "--versions", help="Show project versions"),
+) -> None:
+    """Get details of a project."""
+    try:
+        project_service = get_project_service()
+        project = project_service.get_project(key)
+
+        _display_project_table(project)
+
+        if versions:
+            project_versions = project_service.get_project_versions(key)
+            if project_versions:
+                rprint("\n")
+                _display_versions_table(project_versions, f"Versions for {key}")
+            else:
+                rprint(f"[yellow]No versions found for project {key}[/yellow]")
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@project_app.command("create-version")
+def create_version(
+    project_key: str = typer.Argument(..., help="Project key"),
+    name: str = typer.Argument(..., help="Version name"),
+    description: Optional[str] = typer.Option(None, "--description", "-d", help="Version description"),
+) -> None:
+    """Create a new version for a project."""
+    try:
+        project_service = get_project_service()
+        version = project_service.create_version(project_key, name, description)
+
+        rprint(f"[green]✓ Version '{name}' created for project {project_key}[/green]")
+        _display_versions_table([version], f"Created Version")
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+# Helper functions for displaying data
+
+def _display_project_table(project) -> None:
+    """Display project information in a formatted table."""
+    from rich.table import Table
+
+    table = Table(title=f"Project: {project.key}")
+    table.add_column("Field", style="cyan")
+    table.add_column("Value", style="white")
+
+    table.add_row("Key", project.key)
+    table.add_row("Name", project.name)
+    table.add_row("ID", project.id)
+    
+    if project.description:
+        table.add_row("Description", project.description)
+    
+    table.add_row("Type", project.project_type_key)
+    
+    if project.lead:
+        table.add_row("Lead", project.lead.get("displayName", "N/A"))
+
+    get_console().print(table)
+
+
+def _display_versions_table(versions: List, title: str) -> None:
+    """Display versions information in a formatted table."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    table.add_column("Name", style="green")
+    table.add_column("Released", style="cyan")
+    table.add_column("Archived", style="yellow")
+    table.add_column("Description", style="white")
+
+    for version in versions:
+        table.add_row(
+            version.name,
+            "✓" if version.released else "✗",
+            "✓" if version.archived else "✗",
+            version.description or "N/A",
+        )
+
+    get_console().print(table)
@@ -0,0 +1,81 @@
+"""User commands for the CLI."""
+
+from itertools import chain
+from typing import Iterable
+
+import typer
+from rich import print as rprint
+
+from jira_api.cli.common import get_console, get_user_service
+from jira_api.exceptions import JiraAPIError
+
+user_app = typer.Typer(help="User operations")
+
+
+@user_app.command("search")
+def search_users(
+    query: str = typer.Argument(..., help="Search query"),
+    max_results: int = typer.Option(50, "--max", "-m", help="Maximum results"),
+) -> None:
+    """Search for users."""
+    try:
+        user_service = get_user_service()
+        users = user_service.search_users_iter(query, max_results)
+
+        first = next(users, None)
+        if first is None:
+            rprint(f"[yellow]No users found matching '{query}'[/yellow]")
+            return
+
+        _display_users_table(chain([first], users), f"Users matching '{query}'")
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@user_app.command("get")
+def get_user(
+    identifier: str = typer.Argument(..., help="User account ID or email"),
+) -> None:
+    """Get details of a specific user."""
+    try:
+        user_service = get_user_service()
+        user = user_service.get_user_by_identifier(identifier)
+
+        if not user:
+            rprint(f"[yellow]User '{identifier}' not found[/yellow]")
+            return
+
+        _display_users_table([user], f"User Details: {identifier}")
+
+    except JiraAPIError as e:
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+# Helper functions for displaying data
+
+def _display_users_table(users: Iterable, title: str) -> None:
+    """Display users information in a table that fills in as rows arrive.
+
+    ``users`` may be a lazy iterator over paged results; each row is shown
+    as soon as its page has been fetched.
+    """
+    from rich.live import Live
+    from rich.table import Table
+
+    table = Table(title=title)
+    table.add_column("Display Name", style="green")
+    table.add_column("Email", style="cyan")
+    table.add_column("Account ID", style="yellow")
+    table.add_column("Active", style="white")
+
+    with Live(table, console=get_console(), refresh_per_second=10):
+        for user in users:
+            table.add_row(
+                user.display_name,
+                user.email_address or "N/A",
+                user.account_id,
+                "✓" if user.active else "✗",
+            )
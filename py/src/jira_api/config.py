@@ -1,10 +1,11 @@
 """Configuration management for JIRA API client."""
 
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
+import orjson
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
@@ -34,6 +35,12 @@ class Settings(BaseSettings):
     server_host: str = Field("0.0.0.0", env="SERVER_HOST")
     server_port: int = Field(8000, env="SERVER_PORT")
     server_reload: bool = Field(False, env="SERVER_RELOAD")
+    # Worker processes for start_server; ignored when reload is enabled
+    server_workers: int = Field(1, env="SERVER_WORKERS")
+    # Threads used by POST /issues:batch to create issues concurrently
+    server_batch_workers: int = Field(5, env="SERVER_BATCH_WORKERS")
+    # Browser origins allowed to call the server, as a JSON list; none by default
+    cors_origins: List[str] = Field(default_factory=list, env="CORS_ORIGINS")
     
     # Optional API key for server authentication
     server_api_key: Optional[str] = Field(None, env="SERVER_API_KEY")
@@ -45,16 +52,46 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
+# (inode, mtime in ns, size) of the config file, or None if it is missing
+_FileKey = Optional[Tuple[int, int, int]]
+
+# (JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN, config file key)
+_ConfigKey = Tuple[Optional[str], Optional[str], Optional[str], _FileKey]
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get application settings.
+
+    Settings are built once per process; use ``clear_config_cache`` to reload.
+
+    Returns:
+        Settings object
+    """
+    return Settings()
+
+
+# Resolved once at import; the directory itself is only created on demand
+_CONFIG_DIR = Path.home() / ".jira-api"
+_CONFIG_FILE = _CONFIG_DIR / "config.json"
+_config_dir_created = False
+
+
 def get_config_dir() -> Path:
-    """Get the configuration directory path."""
-    config_dir = Path.home() / ".jira-api"
-    config_dir.mkdir(exist_ok=True)
-    return config_dir
+    """Get the configuration directory path, creating it if needed."""
+    global _config_dir_created
+    if not _config_dir_created:
+        _CONFIG_DIR.mkdir(exist_ok=True)
+        _config_dir_created = True
+    return _CONFIG_DIR
 
 
 def get_config_file() -> Path:
-    """Get the configuration file path."""
-    return get_config_dir() / "config.json"
+    """Get the configuration file path.
+
+    The file (and its directory) may not exist yet.
+    """
+    return _CONFIG_FILE
 
 
 def save_config(config: JiraConfig) -> None:
@@ -63,43 +100,80 @@ def save_config(config: JiraConfig) -> None:
     Args:
         config: JIRA configuration to save
     """
+    get_config_dir()
     config_file = get_config_file()
     
-    with open(config_file, "w") as f:
-        json.dump(config.model_dump(), f, indent=2)
-    
-    # Set file permissions to be readable only by owner
+    # Create the file readable only by owner so it is never briefly exposed.
+    # The mode only applies on creation, so tighten an existing file too
+    # (os.fchmod is not available on Windows before Python 3.13).
+    fd = os.open(config_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
     os.chmod(config_file, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(
+            orjson.dumps(
+                config.model_dump(), option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            )
+        )
+
+
+def _config_file_key() -> _FileKey:
+    """Stat the config file once and return a key identifying its version."""
+    try:
+        st = os.stat(_CONFIG_FILE)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+# Last (file key, result) returned by load_config, including "missing"
+_loaded_config: Optional[Tuple[_FileKey, Optional[JiraConfig]]] = None
 
 
 def load_config() -> Optional[JiraConfig]:
     """Load configuration from file.
 
+    The parsed result, including a missing or invalid file, is reused until
+    the file's inode, mtime or size changes.
+
     Returns:
         JiraConfig object if configuration exists, None otherwise
     """
-    config_file = get_config_file()
-    
-    if not config_file.exists():
-        return None
-    
-    try:
-        with open(config_file, "r") as f:
-            data = json.load(f)
-        
-        return JiraConfig(**data)
-    except (json.JSONDecodeError, ValueError):
-        return None
+    global _loaded_config
+    key = _config_file_key()
+    if _loaded_config is not None and _loaded_config[0] == key:
+        return _loaded_config[1]
 
+    config: Optional[JiraConfig] = None
+    if key is not None:
+        try:
+            with open(_CONFIG_FILE, "rb") as f:
+                data = orjson.loads(f.read())
 
-def get_config_from_env() -> Optional[JiraConfig]:
-    """Get configuration from environment variables.
+            config = JiraConfig(**data)
+        except (orjson.JSONDecodeError, ValueError):
+            config = None
 
-    Returns:
-        JiraConfig object if all required env vars are present, None otherwise
-    """
-    settings = Settings()
-    
+    _loaded_config = (key, config)
+    return config
+
+
+_EnvCredentials = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+def _read_env_credentials() -> _EnvCredentials:
+    """Read JIRA_BASE_URL, JIRA_EMAIL and JIRA_API_TOKEN in one pass."""
+    env = os.environ
+    return env.get("JIRA_BASE_URL"), env.get("JIRA_EMAIL"), env.get("JIRA_API_TOKEN")
+
+
+def _config_from_env(credentials: _EnvCredentials) -> Optional[JiraConfig]:
+    """Build configuration from an environment snapshot, falling back to .env."""
+    base_url, email, api_token = credentials
+    if base_url and email and api_token:
+        return JiraConfig(base_url=base_url, email=email, api_token=api_token)
+
+    # Values may also come from a .env file, which only Settings reads
+    settings = get_settings()
     if settings.jira_base_url and settings.jira_email and settings.jira_api_token:
         return JiraConfig(
             base_url=settings.jira_base_url,
@@ -110,18 +184,43 @@ def get_config_from_env() -> Optional[JiraConfig]:
     return None
 
 
+def get_config_from_env() -> Optional[JiraConfig]:
+    """Get configuration from environment variables.
+
+    Returns:
+        JiraConfig object if all required env vars are present, None otherwise
+    """
+    return _config_from_env(_read_env_credentials())
+
+
 def get_config() -> Optional[JiraConfig]:
     """Get configuration from environment variables or file.
 
-    Environment variables take precedence over file configuration.
+    Environment variables take precedence over file configuration. The result
+    is cached until one of the JIRA_* environment variables or the config
+    file changes.
 
     Returns:
         JiraConfig object if configuration is available, None otherwise
     """
-    # First try environment variables
-    config = get_config_from_env()
+    return _get_config_cached((*_read_env_credentials(), _config_file_key()))
+
+
+@lru_cache(maxsize=4)
+def _get_config_cached(key: _ConfigKey) -> Optional[JiraConfig]:
+    """Resolve configuration for a cache key built by ``get_config``."""
+    # First try the environment snapshot the key was built from
+    config = _config_from_env(key[:3])
     if config:
         return config
     
     # Fall back to file configuration
-    return load_config()
\ No newline at end of file
+    return load_config()
+
+
+def clear_config_cache() -> None:
+    """Clear cached configuration and settings."""
+    global _loaded_config
+    _loaded_config = None
+    _get_config_cached.cache_clear()
+    get_settings.cache_clear()
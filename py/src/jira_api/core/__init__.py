@@ -1,5 +1,6 @@
 """Core JIRA API client functionality."""
 
+from jira_api.core.async_client import JiraAsyncClient
 from jira_api.core.client import JiraClient
 
-__all__ = ["JiraClient"]
\ No newline at end of file
+__all__ = ["JiraClient", "JiraAsyncClient"]
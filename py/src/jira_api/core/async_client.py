@@ -0,0 +1,566 @@
+"""Asynchronous JIRA API client using HTTPX."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union, overload
+
+import httpx
+from pydantic import TypeAdapter, ValidationError
+
+from jira_api.core.http import (
+    RETRY_STATUS_CODES,
+    api_root_url,
+    basic_auth_headers,
+    parse_response,
+    response_content,
+    retry_delay,
+)
+from jira_api.exceptions import JiraAPIError, JiraValidationError
+from jira_api.models.issue import (
+    CreatedIssue,
+    Issue,
+    IssueAssignment,
+    IssueCreate,
+    IssueSearchResult,
+    IssueTransition,
+    IssueTransitionRequest,
+    IssueUpdate,
+)
+from jira_api.models.project import Project, ProjectVersion, ProjectVersionCreate
+from jira_api.models.user import USER_LIST_ADAPTER, User
+
+logger = logging.getLogger(__name__)
+
+# List adapters are built once; validating raw JSON with them parses and
+# constructs models in a single pass inside pydantic-core.
+_VERSION_LIST_ADAPTER = TypeAdapter(List[ProjectVersion])
+_TRANSITION_LIST_ADAPTER = TypeAdapter(List[IssueTransition])
+
+# Seconds a project's issue types are reused before being fetched again
+ISSUE_TYPES_CACHE_TTL = 300.0
+
+
+class JiraAsyncClient:
+    """Asynchronous JIRA API client for Jira Cloud REST API v3.
+
+    Mirrors ``JiraClient`` but every API method is a coroutine, so many
+    requests can be in flight at once over a shared HTTP/2 connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        email: str,
+        api_token: str,
+        timeout: float = 30.0,
+        max_connections: int = 20,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+    ) -> None:
+        """Initialize the asynchronous JIRA client.
+
+        Args:
+            base_url: Base URL of the JIRA instance (e.g., https://company.atlassian.net)
+            email: Email address for authentication
+            api_token: API token for authentication
+            timeout: Request timeout in seconds
+            max_retries: Times to retry a request that got a 429 or 503 response
+            backoff_factor: Base delay in seconds between retries when the
+                response has no Retry-After header
+            max_connections: Maximum number of concurrent connections
+
+        Raises:
+            JiraValidationError: If base_url is invalid
+        """
+        self.base_url = api_root_url(base_url)
+        self.email = email
+        self.api_token = api_token
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # project_key -> (fetched_at, issue types, {lowercased name: id})
+        self._issue_types_cache: Dict[
+            str, Tuple[float, List[Dict[str, Any]], Dict[str, str]]
+        ] = {}
+
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            headers=basic_auth_headers(email, api_token),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=60.0,
+                ),
+                retries=2,
+            ),
+        )
+
+    async def __aenter__(self) -> "JiraAsyncClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Send an HTTP request to the JIRA API.
+
+        Requests answered with 429 or 503 are retried up to ``max_retries``
+        times, waiting as long as the Retry-After header asks.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to base_url)
+            params: Query parameters
+            json_data: JSON data for request body
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            JiraAPIError: If the request could not be sent
+        """
+        # base_url always ends with "/" and endpoints are relative
+        url = self.base_url + endpoint.lstrip("/")
+
+        # Build once so retries resend the same encoded request
+        request = self._client.build_request(method, url, params=params, json=json_data)
+
+        attempt = 0
+        while True:
+            try:
+                logger.debug(f"Making {method} request to {url}")
+                response = await self._client.send(request)
+            except httpx.RequestError as e:
+                raise JiraAPIError(f"Request failed: {e}")
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                return response
+
+            delay = retry_delay(response, attempt, self.backoff_factor)
+            logger.debug(f"Got {response.status_code} from {url}, retrying in {delay:.2f}s")
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make an HTTP request to the JIRA API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to base_url)
+            params: Query parameters
+            json_data: JSON data for request body
+
+        Returns:
+            Decoded response data
+
+        Raises:
+            JiraAuthenticationError: For 401 responses
+            JiraPermissionError: For 403 responses
+            JiraNotFoundError: For 404 responses
+            JiraValidationError: For 400 responses
+            JiraRateLimitError: For 429 responses
+            JiraServerError: For 5xx responses
+            JiraAPIError: For other error responses
+        """
+        return parse_response(await self._send(method, endpoint, params, json_data))
+
+    async def _make_request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """Make an HTTP request and return the undecoded response body.
+
+        Used where the body is handed straight to a pydantic JSON validator.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to base_url)
+            params: Query parameters
+            json_data: JSON data for request body
+
+        Returns:
+            Raw response body
+
+        Raises:
+            JiraAPIError: For error responses, as in ``_make_request``
+        """
+        return response_content(await self._send(method, endpoint, params, json_data))
+
+    # User Management Methods
+
+    async def get_user(self, account_id: str) -> User:
+        """Get a user by account ID.
+
+        Args:
+            account_id: The account ID of the user
+
+        Returns:
+            User object
+        """
+        data = await self._make_request_raw("GET", "user", params={"accountId": account_id})
+
+        try:
+            return User.model_validate_json(data)
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse user data: {e}")
+
+    async def search_users(
+        self, query: str, max_results: int = 50, start_at: int = 0
+    ) -> List[User]:
+        """Search for users.
+
+        Args:
+            query: Query string to search for users
+            max_results: Maximum number of results to return
+            start_at: Index of the first result, for paging
+
+        Returns:
+            List of User objects
+        """
+        params = {"query": query, "maxResults": max_results}
+        if start_at:
+            params["startAt"] = start_at
+        data = await self._make_request_raw("GET", "user/search", params=params)
+
+        try:
+            return USER_LIST_ADAPTER.validate_json(data)
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse user search results: {e}")
+
+    async def find_assignable_users(
+        self, project_keys: List[str], query: Optional[str] = None, max_results: int = 50
+    ) -> List[User]:
+        """Find users assignable to projects.
+
+        Args:
+            project_keys: List of project keys
+            query: Optional query string to filter users
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of User objects
+        """
+        params: Dict[str, Any] = {
+            "projectKeys": ",".join(project_keys),
+            "maxResults": max_results,
+        }
+        if query:
+            params["query"] = query
+
+        data = await self._make_request_raw("GET", "user/assignable/multiProjectSearch", params=params)
+
+        try:
+            return USER_LIST_ADAPTER.validate_json(data)
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse assignable users: {e}")
+
+    # Issue Management Methods
+
+    @overload
+    async def create_issue(
+        self, issue_data: IssueCreate, fetch_full: Literal[True] = ...
+    ) -> Issue: ...
+
+    @overload
+    async def create_issue(
+        self, issue_data: IssueCreate, fetch_full: Literal[False]
+    ) -> CreatedIssue: ...
+
+    async def create_issue(
+        self, issue_data: IssueCreate, fetch_full: bool = True
+    ) -> Union[Issue, CreatedIssue]:
+        """Create a new issue.
+
+        Args:
+            issue_data: Issue creation data
+            fetch_full: Fetch the full issue after creating it. When False, the
+                id/key/self reference returned by the create call is returned
+                instead, saving a round-trip.
+
+        Returns:
+            Created Issue object, or a CreatedIssue reference if fetch_full is False
+        """
+        json_data = issue_data.to_jira_format()
+        data = await self._make_request("POST", "issue", json_data=json_data)
+
+        issue_key = data.get("key")
+        if not issue_key:
+            raise JiraAPIError("Issue created but key not returned")
+
+        if not fetch_full:
+            try:
+                return CreatedIssue.model_validate(data)
+            except ValidationError as e:
+                raise JiraAPIError(f"Failed to parse created issue data: {e}")
+
+        # Get the full issue details
+        return await self.get_issue(issue_key)
+
+    async def get_issue(self, issue_key: str, fields: Optional[Sequence[str]] = None) -> Issue:
+        """Get an issue by key.
+
+        Args:
+            issue_key: The issue key (e.g., PROJ-123)
+            fields: Issue fields to return; all navigable fields if omitted
+
+        Returns:
+            Issue object
+        """
+        params = {"fields": ",".join(fields)} if fields else None
+        data = await self._make_request_raw("GET", f"issue/{issue_key}", params=params)
+
+        try:
+            return Issue.model_validate_json(data)
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse issue data: {e}")
+
+    async def get_issues(self, issue_keys: List[str]) -> List[Issue]:
+        """Get several issues concurrently.
+
+        Args:
+            issue_keys: Issue keys to fetch
+
+        Returns:
+            Issue objects in the same order as ``issue_keys``
+        """
+        return list(await asyncio.gather(*(self.get_issue(key) for key in issue_keys)))
+
+    async def search_issues(
+        self,
+        jql: str,
+        start_at: int = 0,
+        max_results: int = 50,
+        fields: Optional[List[str]] = None,
+    ) -> IssueSearchResult:
+        """Search for issues using JQL.
+
+        Args:
+            jql: JQL query string
+            start_at: Index of the first result to return
+            max_results: Maximum number of results to return
+            fields: Issue fields to return; JIRA's default set if omitted
+
+        Returns:
+            IssueSearchResult with the matching page of issues
+        """
+        params: Dict[str, Any] = {"jql": jql, "startAt": start_at, "maxResults": max_results}
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        data = await self._make_request_raw("GET", "search", params=params)
+
+        try:
+            return IssueSearchResult.model_validate_json(data)
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse issue search results: {e}")
+
+    async def update_issue(self, issue_key: str, update_data: IssueUpdate) -> None:
+        """Update an existing issue.
+
+        Args:
+            issue_key: The issue key (e.g., PROJ-123)
+            update_data: Issue update data
+        """
+        await self._make_request("PUT", f"issue/{issue_key}", json_data=update_data.to_jira_format())
+
+    async def assign_issue(self, issue_key: str, assignment: IssueAssignment) -> None:
+        """Assign an issue to a user.
+
+        Args:
+            issue_key: The issue key (e.g., PROJ-123)
+            assignment: Assignment data
+        """
+        await self._make_request(
+            "PUT", f"issue/{issue_key}/assignee", json_data=assignment.to_jira_format()
+        )
+
+    async def get_issue_transitions(self, issue_key: str) -> List[IssueTransition]:
+        """Get available transitions for an issue.
+
+        Args:
+            issue_key: The issue key (e.g., PROJ-123)
+
+        Returns:
+            List of available transitions
+        """
+        data = await self._make_request("GET", f"issue/{issue_key}/transitions")
+
+        try:
+            return _TRANSITION_LIST_ADAPTER.validate_python(data.get("transitions", []))
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse transitions data: {e}")
+
+    async def transition_issue(
+        self, issue_key: str, transition_request: IssueTransitionRequest
+    ) -> None:
+        """Transition an issue to a new status.
+
+        Args:
+            issue_key: The issue key (e.g., PROJ-123)
+            transition_request: Transition request data
+        """
+        await self._make_request(
+            "POST", f"issue/{issue_key}/transitions", json_data=transition_request.to_jira_format()
+        )
+
+    # Project Management Methods
+
+    async def get_project(self, project_key: str) -> Project:
+        """Get a project by key.
+
+        Args:
+            project_key: The project key
+
+        Returns:
+            Project object
+        """
+        data = await self._make_request_raw("GET", f"project/{project_key}")
+
+        try:
+            return Project.model_validate_json(data)
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse project data: {e}")
+
+    async def get_project_versions(self, project_key: str) -> List[ProjectVersion]:
+        """Get all versions for a project.
+
+        Args:
+            project_key: The project key
+
+        Returns:
+            List of ProjectVersion objects
+        """
+        data = await self._make_request_raw("GET", f"project/{project_key}/versions")
+
+        try:
+            return _VERSION_LIST_ADAPTER.validate_json(data)
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse project versions: {e}")
+
+    async def create_project_version(self, version_data: ProjectVersionCreate) -> ProjectVersion:
+        """Create a new project version.
+
+        Args:
+            version_data: Version creation data
+
+        Returns:
+            Created ProjectVersion object
+        """
+        json_data = version_data.model_dump(exclude_unset=True)
+        data = await self._make_request_raw("POST", "version", json_data=json_data)
+
+        try:
+            return ProjectVersion.model_validate_json(data)
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse created version data: {e}")
+
+    async def get_issue_types(self) -> List[Dict[str, Any]]:
+        """Get all issue types.
+
+        Returns:
+            List of issue type data
+        """
+        result: List[Dict[str, Any]] = await self._make_request("GET", "issuetype")
+        return result
+
+    async def _get_cached_issue_types(
+        self, project_key: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """Return a project's issue types and name index, fetching when stale.
+
+        Args:
+            project_key: The project key
+
+        Returns:
+            Tuple of (issue type data, mapping of lowercased name to ID)
+        """
+        now = time.monotonic()
+        cached = self._issue_types_cache.get(project_key)
+        if cached is not None and now - cached[0] < ISSUE_TYPES_CACHE_TTL:
+            return cached[1], cached[2]
+
+        project_data = await self._make_request("GET", f"project/{project_key}")
+        issue_types: List[Dict[str, Any]] = project_data.get("issueTypes", [])
+        by_name = {str(it.get("name", "")).lower(): str(it["id"]) for it in issue_types}
+        self._issue_types_cache[project_key] = (now, issue_types, by_name)
+        return issue_types, by_name
+
+    def invalidate_issue_types(self, project_key: Optional[str] = None) -> None:
+        """Drop cached issue types so the next lookup fetches them again.
+
+        Args:
+            project_key: Project whose issue types to drop; all projects if omitted
+        """
+        if project_key is None:
+            self._issue_types_cache.clear()
+        else:
+            self._issue_types_cache.pop(project_key, None)
+
+    async def get_project_issue_types(self, project_key: str) -> List[Dict[str, Any]]:
+        """Get issue types for a specific project.
+
+        Results are cached per project for ``ISSUE_TYPES_CACHE_TTL`` seconds.
+
+        Args:
+            project_key: The project key
+
+        Returns:
+            List of issue type data for the project
+
+        Raises:
+            JiraNotFoundError: If project is not found
+        """
+        issue_types, _ = await self._get_cached_issue_types(project_key)
+        return issue_types
+
+    async def get_issue_type_id_by_name(self, project_key: str, issue_type_name: str) -> str:
+        """Get issue type ID by name for a specific project.
+
+        Args:
+            project_key: The project key
+            issue_type_name: The name of the issue type (e.g., 'Bug', 'Story', 'Task')
+
+        Returns:
+            Issue type ID
+
+        Raises:
+            JiraNotFoundError: If project or issue type is not found
+            JiraValidationError: If issue type name is not found in project
+        """
+        issue_types, by_name = await self._get_cached_issue_types(project_key)
+
+        issue_type_id = by_name.get(issue_type_name.lower())
+        if issue_type_id is not None:
+            return issue_type_id
+
+        available_types = sorted(str(it.get("name", "")) for it in issue_types)
+        raise JiraValidationError(
+            f"Issue type '{issue_type_name}' not found in project '{project_key}'. "
+            f"Available types: {', '.join(available_types)}"
+        )
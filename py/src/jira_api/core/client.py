@@ -1,34 +1,44 @@
 """Core JIRA API client using HTTPX."""
 
 import logging
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+import time
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union, overload
 
 import httpx
-from pydantic import ValidationError
-
-from jira_api.exceptions import (
-    JiraAPIError,
-    JiraAuthenticationError,
-    JiraNotFoundError,
-    JiraPermissionError,
-    JiraRateLimitError,
-    JiraServerError,
-    JiraValidationError,
+from pydantic import TypeAdapter, ValidationError
+
+from jira_api.core.http import (
+    RETRY_STATUS_CODES,
+    api_root_url,
+    basic_auth_headers,
+    parse_response,
+    response_content,
+    retry_delay,
 )
+from jira_api.exceptions import JiraAPIError, JiraValidationError
 from jira_api.models.issue import (
+    CreatedIssue,
     Issue,
     IssueAssignment,
     IssueCreate,
+    IssueSearchResult,
     IssueTransition,
     IssueTransitionRequest,
     IssueUpdate,
 )
 from jira_api.models.project import Project, ProjectVersion, ProjectVersionCreate
-from jira_api.models.user import User
+from jira_api.models.user import USER_LIST_ADAPTER, User
 
 logger = logging.getLogger(__name__)
 
+# List adapters are built once; validating raw JSON with them parses and
+# constructs models in a single pass inside pydantic-core.
+_VERSION_LIST_ADAPTER = TypeAdapter(List[ProjectVersion])
+_TRANSITION_LIST_ADAPTER = TypeAdapter(List[IssueTransition])
+
+# Seconds a project's issue types are reused before being fetched again
+ISSUE_TYPES_CACHE_TTL = 300.0
+
 
 class JiraClient:
     """Core JIRA API client for interacting with Jira Cloud REST API v3."""
@@ -39,6 +49,8 @@ class JiraClient:
         email: str,
         api_token: str,
         timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
     ) -> None:
         """Initialize the JIRA client.
 
@@ -47,28 +59,39 @@ class JiraClient:
             email: Email address for authentication
             api_token: API token for authentication
             timeout: Request timeout in seconds
+            max_retries: Times to retry a request that got a 429 or 503 response
+            backoff_factor: Base delay in seconds between retries when the
+                response has no Retry-After header
 
         Raises:
             JiraValidationError: If base_url is invalid
         """
-        if not base_url.startswith(("http://", "https://")):
-            raise JiraValidationError("Base URL must start with http:// or https://")
-
-        if not base_url.endswith("/"):
-            base_url += "/"
-
-        self.base_url = urljoin(base_url, "rest/api/3/")
+        self.base_url = api_root_url(base_url)
         self.email = email
         self.api_token = api_token
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # project_key -> (fetched_at, issue types, {lowercased name: id})
+        self._issue_types_cache: Dict[
+            str, Tuple[float, List[Dict[str, Any]], Dict[str, str]]
+        ] = {}
 
+        # Pool settings live on the transport: httpx ignores the Client's
+        # http2/limits arguments once a custom transport is supplied.
         self._client = httpx.Client(
-            auth=(email, api_token),
             timeout=timeout,
-            headers={
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            },
+            headers=basic_auth_headers(email, api_token),
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=40,
+                    keepalive_expiry=60.0,
+                ),
+                retries=2,
+            ),
         )
 
     def __enter__(self) -> "JiraClient":
@@ -83,13 +106,60 @@ class JiraClient:
         """Close the HTTP client."""
         self._client.close()
 
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Send an HTTP request to the JIRA API.
+
+        Requests answered with 429 or 503 are retried up to ``max_retries``
+        times, waiting as long as the Retry-After header asks.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to base_url)
+            params: Query parameters
+            json_data: JSON data for request body
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            JiraAPIError: If the request could not be sent
+        """
+        # base_url always ends with "/" and endpoints are relative
+        url = self.base_url + endpoint.lstrip("/")
+        
+        # Build once so retries resend the same encoded request
+        request = self._client.build_request(method, url, params=params, json=json_data)
+
+        attempt = 0
+        while True:
+            try:
+                logger.debug(f"Making {method} request to {url}")
+                response = self._client.send(request)
+            except httpx.RequestError as e:
+                raise JiraAPIError(f"Request failed: {e}")
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                return response
+
+            delay = retry_delay(response, attempt, self.backoff_factor)
+            logger.debug(f"Got {response.status_code} from {url}, retrying in {delay:.2f}s")
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
     def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+    ) -> Any:
         """Make an HTTP request to the JIRA API.
 
         Args:
@@ -99,7 +169,7 @@ class JiraClient:
             json_data: JSON data for request body
 
         Returns:
-            Response data as dictionary
+            Decoded response data
 
         Raises:
             JiraAuthenticationError: For 401 responses
@@ -110,58 +180,32 @@ class JiraClient:
             JiraServerError: For 5xx responses
             JiraAPIError: For other error responses
         """
-        url = urljoin(self.base_url, endpoint)
-        
-        try:
-            logger.debug(f"Making {method} request to {url}")
-            response = self._client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-            )
-
-            # Handle different status codes
-            if response.status_code == 401:
-                raise JiraAuthenticationError("Invalid credentials or expired token")
-            elif response.status_code == 403:
-                raise JiraPermissionError("Insufficient permissions for this operation")
-            elif response.status_code == 404:
-                raise JiraNotFoundError("Resource not found")
-            elif response.status_code == 400:
-                error_msg = "Bad request"
-                try:
-                    error_data = response.json()
-                    if "errorMessages" in error_data:
-                        error_msg = "; ".join(error_data["errorMessages"])
-                except Exception:
-                    pass
-                raise JiraValidationError(error_msg)
-            elif response.status_code == 429:
-                raise JiraRateLimitError("Rate limit exceeded")
-            elif response.status_code >= 500:
-                raise JiraServerError(f"Server error: {response.status_code}")
-            elif response.status_code >= 400:
-                error_msg = f"HTTP {response.status_code}"
-                try:
-                    error_data = response.json()
-                    if "errorMessages" in error_data:
-                        error_msg = "; ".join(error_data["errorMessages"])
-                except Exception:
-                    pass
-                raise JiraAPIError(error_msg, status_code=response.status_code)
-
-            # For successful responses that don't return JSON (like 204 No Content)
-            if response.status_code == 204 or not response.content:
-                return {}
+        return parse_response(self._send(method, endpoint, params, json_data))
 
-            try:
-                return response.json()
-            except Exception as e:
-                raise JiraAPIError(f"Failed to parse response JSON: {e}")
+    def _make_request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """Make an HTTP request and return the undecoded response body.
 
-        except httpx.RequestError as e:
-            raise JiraAPIError(f"Request failed: {e}")
+        Used where the body is handed straight to a pydantic JSON validator.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (relative to base_url)
+            params: Query parameters
+            json_data: JSON data for request body
+
+        Returns:
+            Raw response body
+
+        Raises:
+            JiraAPIError: For error responses, as in ``_make_request``
+        """
+        return response_content(self._send(method, endpoint, params, json_data))
 
     # User Management Methods
 
@@ -178,28 +222,33 @@ class JiraClient:
             JiraNotFoundError: If user is not found
         """
         params = {"accountId": account_id}
-        data = self._make_request("GET", "user", params=params)
+        data = self._make_request_raw("GET", "user", params=params)
         
         try:
-            return User(**data)
+            return User.model_validate_json(data)
         except ValidationError as e:
             raise JiraAPIError(f"Failed to parse user data: {e}")
 
-    def search_users(self, query: str, max_results: int = 50) -> List[User]:
+    def search_users(
+        self, query: str, max_results: int = 50, start_at: int = 0
+    ) -> List[User]:
         """Search for users.
 
         Args:
             query: Query string to search for users
             max_results: Maximum number of results to return
+            start_at: Index of the first result, for paging
 
         Returns:
             List of User objects
         """
         params = {"query": query, "maxResults": max_results}
-        data = self._make_request("GET", "user/search", params=params)
+        if start_at:
+            params["startAt"] = start_at
+        data = self._make_request_raw("GET", "user/search", params=params)
         
         try:
-            return [User(**user_data) for user_data in data]
+            return USER_LIST_ADAPTER.validate_json(data)
         except ValidationError as e:
             raise JiraAPIError(f"Failed to parse user search results: {e}")
 
@@ -223,39 +272,61 @@ class JiraClient:
         if query:
             params["query"] = query
 
-        data = self._make_request("GET", "user/assignable/multiProjectSearch", params=params)
+        data = self._make_request_raw("GET", "user/assignable/multiProjectSearch", params=params)
         
         try:
-            return [User(**user_data) for user_data in data]
+            return USER_LIST_ADAPTER.validate_json(data)
         except ValidationError as e:
             raise JiraAPIError(f"Failed to parse assignable users: {e}")
 
     # Issue Management Methods
 
-    def create_issue(self, issue_data: IssueCreate) -> Issue:
+    @overload
+    def create_issue(
+        self, issue_data: IssueCreate, fetch_full: Literal[True] = ...
+    ) -> Issue: ...
+
+    @overload
+    def create_issue(
+        self, issue_data: IssueCreate, fetch_full: Literal[False]
+    ) -> CreatedIssue: ...
+
+    def create_issue(
+        self, issue_data: IssueCreate, fetch_full: bool = True
+    ) -> Union[Issue, CreatedIssue]:
         """Create a new issue.
 
         Args:
             issue_data: Issue creation data
+            fetch_full: Fetch the full issue after creating it. When False, the
+                id/key/self reference returned by the create call is returned
+                instead, saving a round-trip.
 
         Returns:
-            Created Issue object
+            Created Issue object, or a CreatedIssue reference if fetch_full is False
         """
         json_data = issue_data.to_jira_format()
         data = self._make_request("POST", "issue", json_data=json_data)
-        
-        # Get the full issue details
+
         issue_key = data.get("key")
         if not issue_key:
             raise JiraAPIError("Issue created but key not returned")
-            
+
+        if not fetch_full:
+            try:
+                return CreatedIssue.model_validate(data)
+            except ValidationError as e:
+                raise JiraAPIError(f"Failed to parse created issue data: {e}")
+
+        # Get the full issue details
         return self.get_issue(issue_key)
 
-    def get_issue(self, issue_key: str) -> Issue:
+    def get_issue(self, issue_key: str, fields: Optional[Sequence[str]] = None) -> Issue:
         """Get an issue by key.
 
         Args:
             issue_key: The issue key (e.g., PROJ-123)
+            fields: Issue fields to return; all navigable fields if omitted
 
         Returns:
             Issue object
@@ -263,13 +334,43 @@ class JiraClient:
         Raises:
             JiraNotFoundError: If issue is not found
         """
-        data = self._make_request("GET", f"issue/{issue_key}")
+        params = {"fields": ",".join(fields)} if fields else None
+        data = self._make_request_raw("GET", f"issue/{issue_key}", params=params)
         
         try:
-            return Issue(**data)
+            return Issue.model_validate_json(data)
         except ValidationError as e:
             raise JiraAPIError(f"Failed to parse issue data: {e}")
 
+    def search_issues(
+        self,
+        jql: str,
+        start_at: int = 0,
+        max_results: int = 50,
+        fields: Optional[List[str]] = None,
+    ) -> IssueSearchResult:
+        """Search for issues using JQL.
+
+        Args:
+            jql: JQL query string
+            start_at: Index of the first result to return
+            max_results: Maximum number of results to return
+            fields: Issue fields to return; JIRA's default set if omitted
+
+        Returns:
+            IssueSearchResult with the matching page of issues
+        """
+        params: Dict[str, Any] = {"jql": jql, "startAt": start_at, "maxResults": max_results}
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        data = self._make_request_raw("GET", "search", params=params)
+
+        try:
+            return IssueSearchResult.model_validate_json(data)
+        except ValidationError as e:
+            raise JiraAPIError(f"Failed to parse issue search results: {e}")
+
     def update_issue(self, issue_key: str, update_data: IssueUpdate) -> None:
         """Update an existing issue.
 
@@ -302,8 +403,7 @@ class JiraClient:
         data = self._make_request("GET", f"issue/{issue_key}/transitions")
         
         try:
-            transitions_data = data.get("transitions", [])
-            return [IssueTransition(**transition) for transition in transitions_data]
+            return _TRANSITION_LIST_ADAPTER.validate_python(data.get("transitions", []))
         except ValidationError as e:
             raise JiraAPIError(f"Failed to parse transitions data: {e}")
 
@@ -331,10 +431,10 @@ class JiraClient:
         Raises:
             JiraNotFoundError: If project is not found
         """
-        data = self._make_request("GET", f"project/{project_key}")
+        data = self._make_request_raw("GET", f"project/{project_key}")
         
         try:
-            return Project(**data)
+            return Project.model_validate_json(data)
         except ValidationError as e:
             raise JiraAPIError(f"Failed to parse project data: {e}")
 
@@ -347,10 +447,10 @@ class JiraClient:
         Returns:
             List of ProjectVersion objects
         """
-        data = self._make_request("GET", f"project/{project_key}/versions")
+        data = self._make_request_raw("GET", f"project/{project_key}/versions")
         
         try:
-            return [ProjectVersion(**version_data) for version_data in data]
+            return _VERSION_LIST_ADAPTER.validate_json(data)
         except ValidationError as e:
             raise JiraAPIError(f"Failed to parse project versions: {e}")
 
@@ -364,10 +464,10 @@ class JiraClient:
             Created ProjectVersion object
         """
         json_data = version_data.model_dump(exclude_unset=True)
-        data = self._make_request("POST", "version", json_data=json_data)
+        data = self._make_request_raw("POST", "version", json_data=json_data)
         
         try:
-            return ProjectVersion(**data)
+            return ProjectVersion.model_validate_json(data)
         except ValidationError as e:
             raise JiraAPIError(f"Failed to parse created version data: {e}")
 
@@ -379,9 +479,44 @@ class JiraClient:
         """
         return self._make_request("GET", "issuetype")
 
+    def _get_cached_issue_types(
+        self, project_key: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """Return a project's issue types and name index, fetching when stale.
+
+        Args:
+            project_key: The project key
+
+        Returns:
+            Tuple of (issue type data, mapping of lowercased name to ID)
+        """
+        now = time.monotonic()
+        cached = self._issue_types_cache.get(project_key)
+        if cached is not None and now - cached[0] < ISSUE_TYPES_CACHE_TTL:
+            return cached[1], cached[2]
+
+        project_data = self._make_request("GET", f"project/{project_key}")
+        issue_types: List[Dict[str, Any]] = project_data.get("issueTypes", [])
+        by_name = {str(it.get("name", "")).lower(): str(it["id"]) for it in issue_types}
+        self._issue_types_cache[project_key] = (now, issue_types, by_name)
+        return issue_types, by_name
+
+    def invalidate_issue_types(self, project_key: Optional[str] = None) -> None:
+        """Drop cached issue types so the next lookup fetches them again.
+
+        Args:
+            project_key: Project whose issue types to drop; all projects if omitted
+        """
+        if project_key is None:
+            self._issue_types_cache.clear()
+        else:
+            self._issue_types_cache.pop(project_key, None)
+
     def get_project_issue_types(self, project_key: str) -> List[Dict[str, Any]]:
         """Get issue types for a specific project.
 
+        Results are cached per project for ``ISSUE_TYPES_CACHE_TTL`` seconds.
+
         Args:
             project_key: The project key
 
@@ -391,8 +526,8 @@ class JiraClient:
         Raises:
             JiraNotFoundError: If project is not found
         """
-        project_data = self._make_request("GET", f"project/{project_key}")
-        return project_data.get("issueTypes", [])
+        issue_types, _ = self._get_cached_issue_types(project_key)
+        return issue_types
 
     def get_issue_type_id_by_name(self, project_key: str, issue_type_name: str) -> str:
         """Get issue type ID by name for a specific project.
@@ -408,14 +543,14 @@ class JiraClient:
             JiraNotFoundError: If project or issue type is not found
             JiraValidationError: If issue type name is not found in project
         """
-        issue_types = self.get_project_issue_types(project_key)
-        
-        for issue_type in issue_types:
-            if issue_type.get("name", "").lower() == issue_type_name.lower():
-                return issue_type["id"]
-        
-        available_types = [it.get("name", "") for it in issue_types]
+        issue_types, by_name = self._get_cached_issue_types(project_key)
+
+        issue_type_id = by_name.get(issue_type_name.lower())
+        if issue_type_id is not None:
+            return issue_type_id
+
+        available_types = sorted(str(it.get("name", "")) for it in issue_types)
         raise JiraValidationError(
             f"Issue type '{issue_type_name}' not found in project '{project_key}'. "
             f"Available types: {', '.join(available_types)}"
-        )
\ No newline at end of file
+        )
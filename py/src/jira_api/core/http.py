@@ -0,0 +1,193 @@
+"""HTTP helpers shared by the synchronous and asynchronous JIRA clients."""
+
+import base64
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple, Type
+
+import httpx
+import orjson
+
+from jira_api.exceptions import (
+    JiraAPIError,
+    JiraAuthenticationError,
+    JiraNotFoundError,
+    JiraPermissionError,
+    JiraRateLimitError,
+    JiraServerError,
+    JiraValidationError,
+)
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
+
+# Responses that mean "try again later" and are safe to resend as-is
+RETRY_STATUS_CODES = frozenset({429, 503})
+
+# Upper bound on a single retry wait, whatever Retry-After asks for
+MAX_RETRY_DELAY = 60.0
+
+
+def retry_delay(response: httpx.Response, attempt: int, backoff_factor: float) -> float:
+    """Work out how long to wait before retrying a throttled request.
+
+    Honours a ``Retry-After`` header (seconds or HTTP date) and otherwise
+    backs off exponentially.
+
+    Args:
+        response: The 429/503 response being retried
+        attempt: Zero-based number of retries already made
+        backoff_factor: Base delay in seconds for exponential backoff
+
+    Returns:
+        Delay in seconds, between 0 and ``MAX_RETRY_DELAY``
+    """
+    delay: Optional[float] = None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+
+    if delay is None:
+        delay = backoff_factor * (2**attempt)
+
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+def api_root_url(base_url: str) -> str:
+    """Validate an instance URL and return its REST API v3 root.
+
+    The result always ends with ``/`` so endpoints can be appended with
+    plain string concatenation.
+
+    Args:
+        base_url: Base URL of the JIRA instance (e.g., https://company.atlassian.net)
+
+    Returns:
+        REST API root URL
+
+    Raises:
+        JiraValidationError: If base_url is invalid
+    """
+    if not base_url.startswith(("http://", "https://")):
+        raise JiraValidationError("Base URL must start with http:// or https://")
+
+    if not base_url.endswith("/"):
+        base_url += "/"
+
+    return base_url + "rest/api/3/"
+
+
+def basic_auth_headers(username: str, password: str) -> Dict[str, str]:
+    """Build the default headers with a precomputed Basic ``Authorization``.
+
+    Sending the header statically avoids running httpx's auth flow on
+    every request.
+
+    Args:
+        username: Username (the account email for JIRA Cloud)
+        password: Password or API token
+
+    Returns:
+        New header dict including ``DEFAULT_HEADERS``
+    """
+    token = base64.b64encode(f"{username}:{password}".encode()).decode("ascii")
+    return {**DEFAULT_HEADERS, "Authorization": f"Basic {token}"}
+
+
+# Status codes with a dedicated exception and a fixed message
+_STATUS_ERRORS: Dict[int, Tuple[Type[JiraAPIError], str]] = {
+    401: (JiraAuthenticationError, "Invalid credentials or expired token"),
+    403: (JiraPermissionError, "Insufficient permissions for this operation"),
+    404: (JiraNotFoundError, "Resource not found"),
+    429: (JiraRateLimitError, "Rate limit exceeded"),
+}
+
+
+def _error_message(response: httpx.Response, default: str) -> str:
+    """Extract JIRA's ``errorMessages`` from an error body, if present."""
+    try:
+        error_data = orjson.loads(response.content)
+        if "errorMessages" in error_data:
+            return "; ".join(error_data["errorMessages"])
+    except Exception:
+        pass
+    return default
+
+
+def raise_for_status(response: httpx.Response) -> None:
+    """Raise the matching JiraAPIError for an error response.
+
+    Args:
+        response: Response returned by the JIRA API
+
+    Raises:
+        JiraAuthenticationError: For 401 responses
+        JiraPermissionError: For 403 responses
+        JiraNotFoundError: For 404 responses
+        JiraValidationError: For 400 responses
+        JiraRateLimitError: For 429 responses
+        JiraServerError: For 5xx responses
+        JiraAPIError: For other error responses
+    """
+    status_code = response.status_code
+    if status_code < 400:
+        return
+
+    known = _STATUS_ERRORS.get(status_code)
+    if known is not None:
+        exc_cls, message = known
+        raise exc_cls(message)
+    if status_code >= 500:
+        raise JiraServerError(f"Server error: {status_code}")
+    if status_code == 400:
+        raise JiraValidationError(_error_message(response, "Bad request"))
+    raise JiraAPIError(_error_message(response, f"HTTP {status_code}"), status_code=status_code)
+
+
+def response_content(response: httpx.Response) -> bytes:
+    """Check a response for errors and return its raw body.
+
+    Args:
+        response: Response returned by the JIRA API
+
+    Returns:
+        Raw response body
+
+    Raises:
+        JiraAPIError: For error responses
+    """
+    if response.status_code >= 300:
+        raise_for_status(response)
+    return response.content
+
+
+def parse_response(response: httpx.Response) -> Any:
+    """Check a response for errors and decode its JSON body.
+
+    Args:
+        response: Response returned by the JIRA API
+
+    Returns:
+        Decoded response data, or an empty dict for empty responses
+
+    Raises:
+        JiraAPIError: For error responses or undecodable bodies
+    """
+    content = response_content(response)
+    # For successful responses that don't return JSON (like 204 No Content)
+    if not content:
+        return {}
+
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        raise JiraAPIError(f"Failed to parse response JSON: {e}")
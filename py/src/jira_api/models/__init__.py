@@ -1,15 +1,63 @@
-"""Pydantic models for JIRA API entities."""
+"""Pydantic models for JIRA API entities.
 
-from jira_api.models.issue import Issue, IssueCreate, IssueUpdate, IssueTransition
-from jira_api.models.project import Project, ProjectVersion
-from jira_api.models.user import User
+Models are imported on first access (PEP 562), so importing one model
+module, e.g. ``jira_api.models.user``, does not load the others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from jira_api.models.issue import (
+        CreatedIssue,
+        Issue,
+        IssueCreate,
+        IssueSearchResult,
+        IssueTransition,
+        IssueUpdate,
+    )
+    from jira_api.models.project import Project, ProjectVersion
+    from jira_api.models.user import USER_LIST_ADAPTER, User
+
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    "CreatedIssue": "jira_api.models.issue",
+    "Issue": "jira_api.models.issue",
+    "IssueCreate": "jira_api.models.issue",
+    "IssueSearchResult": "jira_api.models.issue",
+    "IssueTransition": "jira_api.models.issue",
+    "IssueUpdate": "jira_api.models.issue",
+    "Project": "jira_api.models.project",
+    "ProjectVersion": "jira_api.models.project",
+    "User": "jira_api.models.user",
+    "USER_LIST_ADAPTER": "jira_api.models.user",
+}
 
 __all__ = [
+    "CreatedIssue",
     "Issue",
-    "IssueCreate", 
+    "IssueCreate",
     "IssueUpdate",
+    "IssueSearchResult",
     "IssueTransition",
     "Project",
     "ProjectVersion",
     "User",
-]
\ No newline at end of file
+    "USER_LIST_ADAPTER",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model on first access and cache it on the package."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the lazily imported models alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
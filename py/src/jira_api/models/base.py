@@ -0,0 +1,13 @@
+"""Shared base classes for JIRA API models."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class JiraResponseModel(BaseModel):
+    """Base class for read-only models parsed from JIRA API responses.
+
+    Instances are immutable, unknown response fields are dropped,
+    and fields with an alias can be populated by either name.
+    """
+
+    model_config = ConfigDict(frozen=True, populate_by_name=True, extra="ignore")
@@ -3,13 +3,30 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from jira_api.models.base import JiraResponseModel
 from jira_api.models.project import IssueType, Project
 from jira_api.models.user import User
 
 
-class IssueStatus(BaseModel):
+def _adf(text: str) -> Dict[str, Any]:
+    """Wrap plain text in a single-paragraph Atlassian Document Format (ADF) doc.
+
+    Args:
+        text: Plain text content
+
+    Returns:
+        ADF document as expected by JIRA Cloud for rich-text fields
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
+
+class IssueStatus(JiraResponseModel):
     """JIRA Issue Status model."""
 
     id: str = Field(..., description="The ID of the status")
@@ -18,7 +35,7 @@ class IssueStatus(BaseModel):
     category: Optional[Dict[str, Any]] = Field(None, description="Status category")
 
 
-class IssuePriority(BaseModel):
+class IssuePriority(JiraResponseModel):
     """JIRA Issue Priority model."""
 
     id: str = Field(..., description="The ID of the priority")
@@ -27,7 +44,7 @@ class IssuePriority(BaseModel):
     icon_url: Optional[str] = Field(None, description="URL to the priority icon")
 
 
-class IssueTransition(BaseModel):
+class IssueTransition(JiraResponseModel):
     """JIRA Issue Transition model."""
 
     id: str = Field(..., description="The ID of the transition")
@@ -36,7 +53,7 @@ class IssueTransition(BaseModel):
     has_screen: bool = Field(False, description="Whether this transition has a screen")
 
 
-class IssueFields(BaseModel):
+class IssueFields(JiraResponseModel):
     """JIRA Issue Fields model."""
 
     summary: str = Field(..., description="Summary of the issue")
@@ -54,7 +71,7 @@ class IssueFields(BaseModel):
     resolution_date: Optional[datetime] = Field(None, alias="resolutiondate", description="When the issue was resolved")
 
 
-class Issue(BaseModel):
+class Issue(JiraResponseModel):
     """JIRA Issue model."""
 
     id: str = Field(..., description="The ID of the issue")
@@ -64,10 +81,23 @@ class Issue(BaseModel):
     changelog: Optional[Dict[str, Any]] = Field(None, description="Issue changelog")
 
 
+class CreatedIssue(JiraResponseModel):
+    """Reference to a newly created issue, as returned by ``POST /issue``."""
+
+    id: str = Field(..., description="The ID of the issue")
+    key: str = Field(..., description="The key of the issue")
+    self: str = Field(..., description="URL to the issue")
+
+
 class IssueCreate(BaseModel):
-    """Model for creating a new issue."""
+    """Model for creating a new issue.
 
-    project_id: str = Field(..., description="ID of the project")
+    The project is given by ``project_id`` or ``project_key``; JIRA accepts
+    either, so callers holding only a key need not look the project up first.
+    """
+
+    project_id: Optional[str] = Field(None, description="ID of the project")
+    project_key: Optional[str] = Field(None, description="Key of the project, used when no ID is given")
     summary: str = Field(..., description="Summary of the issue")
     description: Optional[str] = Field(None, description="Description of the issue")
     issue_type_id: str = Field(..., description="ID of the issue type")
@@ -76,26 +106,25 @@ class IssueCreate(BaseModel):
     reporter_account_id: Optional[str] = Field(None, description="Account ID of the reporter")
     labels: List[str] = Field(default_factory=list, description="Labels to attach to the issue")
 
+    @model_validator(mode="after")
+    def _require_project(self) -> "IssueCreate":
+        """Ensure the project is identified by ID or key."""
+        if not self.project_id and not self.project_key:
+            raise ValueError("Either project_id or project_key is required")
+        return self
+
     def to_jira_format(self) -> Dict[str, Any]:
         """Convert to JIRA API format."""
+        project = {"id": self.project_id} if self.project_id else {"key": self.project_key}
         fields: Dict[str, Any] = {
-            "project": {"id": self.project_id},
+            "project": project,
             "summary": self.summary,
             "issuetype": {"id": self.issue_type_id},
         }
 
         if self.description:
             # JIRA Cloud uses Atlassian Document Format (ADF)
-            fields["description"] = {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": self.description}],
-                    }
-                ],
-            }
+            fields["description"] = _adf(self.description)
 
         if self.priority_id:
             fields["priority"] = {"id": self.priority_id}
@@ -130,26 +159,11 @@ class IssueUpdate(BaseModel):
 
         if self.description:
             # JIRA Cloud uses Atlassian Document Format (ADF)
-            update["description"] = [
-                {
-                    "set": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [{"type": "text", "text": self.description}],
-                            }
-                        ],
-                    }
-                }
-            ]
-
-        label_operations = []
-        for label in self.labels_add:
-            label_operations.append({"add": label})
-        for label in self.labels_remove:
-            label_operations.append({"remove": label})
+            update["description"] = [{"set": _adf(self.description)}]
+
+        label_operations = [{"add": label} for label in self.labels_add] + [
+            {"remove": label} for label in self.labels_remove
+        ]
 
         if label_operations:
             update["labels"] = label_operations
@@ -182,24 +196,7 @@ class IssueTransitionRequest(BaseModel):
             data["fields"] = fields
 
         if self.comment:
-            data["update"] = {
-                "comment": [
-                    {
-                        "add": {
-                            "body": {
-                                "type": "doc",
-                                "version": 1,
-                                "content": [
-                                    {
-                                        "type": "paragraph",
-                                        "content": [{"type": "text", "text": self.comment}],
-                                    }
-                                ],
-                            }
-                        }
-                    }
-                ]
-            }
+            data["update"] = {"comment": [{"add": {"body": _adf(self.comment)}}]}
 
         return data
 
@@ -216,10 +213,10 @@ class IssueAssignment(BaseModel):
         return {"accountId": None}  # Unassign
 
 
-class IssueSearchResult(BaseModel):
+class IssueSearchResult(JiraResponseModel):
     """Model for issue search results."""
 
     issues: List[Issue] = Field(default_factory=list, description="List of issues")
     total: int = Field(0, description="Total number of issues found")
-    start_at: int = Field(0, description="Starting index of results")
-    max_results: int = Field(50, description="Maximum results requested")
\ No newline at end of file
+    start_at: int = Field(0, alias="startAt", description="Starting index of results")
+    max_results: int = Field(50, alias="maxResults", description="Maximum results requested")
\ No newline at end of file
@@ -5,8 +5,10 @@ from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from jira_api.models.base import JiraResponseModel
 
-class ProjectVersion(BaseModel):
+
+class ProjectVersion(JiraResponseModel):
     """JIRA Project Version model."""
 
     id: str = Field(..., description="The ID of the version")
@@ -34,7 +36,7 @@ class ProjectVersionCreate(BaseModel):
     release_date: Optional[str] = Field(None, description="Release date (YYYY-MM-DD)")
 
 
-class IssueType(BaseModel):
+class IssueType(JiraResponseModel):
     """JIRA Issue Type model."""
 
     id: str = Field(..., description="The ID of the issue type")
@@ -44,19 +46,16 @@ class IssueType(BaseModel):
     subtask: bool = Field(False, description="Whether this is a subtask type")
 
 
-class ProjectLead(BaseModel):
+class ProjectLead(JiraResponseModel):
     """JIRA Project Lead model."""
     
     account_id: Optional[str] = Field(None, alias="accountId", description="Account ID of the lead")
     display_name: Optional[str] = Field(None, alias="displayName", description="Display name of the lead")
     active: Optional[bool] = Field(None, description="Whether the lead is active")
     avatar_urls: Optional[Dict[str, str]] = Field(None, alias="avatarUrls", description="Avatar URLs")
-    
-    class Config:
-        populate_by_name = True
 
 
-class Project(BaseModel):
+class Project(JiraResponseModel):
     """JIRA Project model."""
 
     id: str = Field(..., description="The ID of the project")
@@ -69,12 +68,9 @@ class Project(BaseModel):
     url: Optional[str] = Field(None, description="URL to the project")
     issue_types: Optional[List[IssueType]] = Field(None, alias="issueTypes", description="Available issue types")
     versions: Optional[List[ProjectVersion]] = Field(None, description="Project versions")
-    
-    class Config:
-        populate_by_name = True
 
 
-class ProjectDetails(BaseModel):
+class ProjectDetails(JiraResponseModel):
     """Extended project details model."""
 
     project: Project = Field(..., description="Project information")
@@ -1,11 +1,13 @@
 """Pydantic models for JIRA user entities."""
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from jira_api.models.base import JiraResponseModel
 
-class User(BaseModel):
+
+class User(JiraResponseModel):
     """JIRA User model."""
 
     account_id: str = Field(..., alias="accountId", description="The account ID of the user")
@@ -16,13 +18,9 @@ class User(BaseModel):
     time_zone: Optional[str] = Field(None, alias="timeZone", description="User's time zone")
     locale: Optional[str] = Field(None, description="User's locale")
 
-    class Config:
-        """Pydantic model configuration."""
-        
-        populate_by_name = True
-        json_encoders = {
-            # Add any custom encoders if needed
-        }
+
+# Validates a whole JSON array of users in one call into pydantic-core
+USER_LIST_ADAPTER = TypeAdapter(List[User])
 
 
 class UserSearch(BaseModel):
@@ -1,5 +1,6 @@
 """SDK client for interacting with JIRA API server."""
 
+from jira_api.sdk.async_client import AsyncJiraSDKClient
 from jira_api.sdk.client import JiraSDKClient
 
-__all__ = ["JiraSDKClient"]
\ No newline at end of file
+__all__ = ["JiraSDKClient", "AsyncJiraSDKClient"]
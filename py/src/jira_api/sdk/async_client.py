@@ -0,0 +1,514 @@
+"""Asynchronous SDK client for interacting with the JIRA API server."""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+import httpx
+import orjson
+from pydantic import BaseModel, ValidationError
+
+from jira_api.exceptions import SDKError
+from jira_api.models.issue import Issue, IssueCreate, IssueTransition, IssueUpdate
+from jira_api.models.project import Project, ProjectVersion
+from jira_api.models.user import User
+from jira_api.sdk.construct import construct, construct_list, list_adapter
+from jira_api.sdk.dump import dump_set_fields
+from jira_api.sdk.http import parse_response, request_headers, response_content
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class AsyncJiraSDKClient:
+    """Asynchronous SDK client for interacting with the JIRA API server.
+
+    Mirrors ``JiraSDKClient`` with coroutine methods over a pooled HTTP/2
+    connection, so independent calls can run concurrently with
+    ``asyncio.gather``.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        trust_server: Optional[bool] = None,
+    ) -> None:
+        """Initialize the asynchronous SDK client.
+
+        Args:
+            base_url: Base URL of the JIRA API server
+            api_key: Optional API key for authentication
+            timeout: Request timeout in seconds
+            trust_server: Build read responses with ``model_construct`` instead
+                of validating them. Defaults to the ``JIRA_SDK_TRUST_SERVER``
+                environment variable being ``1``.
+        """
+        if not base_url.endswith("/"):
+            base_url += "/"
+
+        self.base_url = base_url
+        self.timeout = timeout
+        if trust_server is None:
+            trust_server = os.environ.get("JIRA_SDK_TRUST_SERVER") == "1"
+        self.trust_server = trust_server
+
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            headers=request_headers(api_key),
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+        )
+
+    async def __aenter__(self) -> "AsyncJiraSDKClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Send an HTTP request to the API server.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
+            json_data: JSON data for request body
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            SDKError: If the request could not be sent
+        """
+        url = self.base_url + endpoint.lstrip("/")
+
+        try:
+            logger.debug(f"Making {method} request to {url}")
+            return await self._client.request(
+                method=method,
+                url=url,
+                params=params,
+                content=orjson.dumps(json_data) if json_data is not None else None,
+            )
+        except httpx.RequestError as e:
+            raise SDKError(f"Request failed: {e}")
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make an HTTP request to the API server.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
+            json_data: JSON data for request body
+
+        Returns:
+            Response data
+
+        Raises:
+            SDKError: For any error responses
+        """
+        return parse_response(await self._send(method, endpoint, params, json_data))
+
+    async def _make_request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """Make an HTTP request and return the undecoded response body.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
+            json_data: JSON data for request body
+
+        Returns:
+            Raw response body
+
+        Raises:
+            SDKError: For any error responses
+        """
+        return response_content(await self._send(method, endpoint, params, json_data))
+
+    def _parse(self, model_cls: Type[M], content: bytes, what: str) -> M:
+        """Build a model from a raw read response.
+
+        Validates straight from the JSON bytes, or skips validation entirely
+        when the server is trusted.
+
+        Args:
+            model_cls: Model class to build
+            content: Raw response body
+            what: Description used in the error message
+
+        Returns:
+            Model instance
+
+        Raises:
+            SDKError: If the data fails validation
+        """
+        try:
+            if self.trust_server:
+                return construct(model_cls, orjson.loads(content))
+            return model_cls.model_validate_json(content)
+        except ValueError as e:
+            raise SDKError(f"Failed to parse {what}: {e}")
+
+    def _parse_list(self, model_cls: Type[M], content: bytes, what: str) -> List[M]:
+        """Build a list of models from a raw read response.
+
+        Args:
+            model_cls: Model class to build
+            content: Raw response body (a JSON array)
+            what: Description used in the error message
+
+        Returns:
+            List of model instances
+
+        Raises:
+            SDKError: If the data fails validation
+        """
+        try:
+            if self.trust_server:
+                return construct_list(model_cls, orjson.loads(content))
+            return list_adapter(model_cls).validate_json(content)
+        except ValueError as e:
+            raise SDKError(f"Failed to parse {what}: {e}")
+
+    # Health Check
+
+    async def health_check(self) -> Dict[str, str]:
+        """Check server health.
+
+        Returns:
+            Health status information
+        """
+        return await self._make_request("GET", "health")
+
+    # User Methods
+
+    async def search_users(self, query: str, max_results: int = 50) -> List[User]:
+        """Search for users.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+
+        Returns:
+            List of User objects
+        """
+        params = {"query": query, "max_results": max_results}
+        data = await self._make_request_raw("GET", "users/search", params=params)
+
+        return self._parse_list(User, data, "user search results")
+
+    async def get_user(self, identifier: str) -> User:
+        """Get a user by account ID or email.
+
+        Args:
+            identifier: User account ID or email
+
+        Returns:
+            User object
+        """
+        data = await self._make_request_raw("GET", f"users/{identifier}")
+
+        return self._parse(User, data, "user data")
+
+    # Issue Methods
+
+    async def create_issue(self, issue_data: IssueCreate) -> Issue:
+        """Create a new issue.
+
+        Args:
+            issue_data: Issue creation data
+
+        Returns:
+            Created Issue object
+        """
+        json_data = dump_set_fields(issue_data)
+        data = await self._make_request("POST", "issues", json_data=json_data)
+
+        try:
+            return Issue(**data)
+        except ValidationError as e:
+            raise SDKError(f"Failed to parse created issue data: {e}")
+
+    async def get_issue(self, issue_key: str) -> Issue:
+        """Get an issue by key.
+
+        Args:
+            issue_key: Issue key
+
+        Returns:
+            Issue object
+        """
+        data = await self._make_request_raw("GET", f"issues/{issue_key}")
+
+        return self._parse(Issue, data, "issue data")
+
+    async def get_issues(self, issue_keys: List[str], concurrency: int = 32) -> List[Issue]:
+        """Get several issues concurrently.
+
+        Args:
+            issue_keys: Issue keys
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Issue objects in the same order as ``issue_keys``
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(key: str) -> Issue:
+            async with semaphore:
+                return await self.get_issue(key)
+
+        return list(await asyncio.gather(*(fetch(key) for key in issue_keys)))
+
+    async def update_issue(self, issue_key: str, update_data: IssueUpdate) -> None:
+        """Update an issue.
+
+        Args:
+            issue_key: Issue key
+            update_data: Update data
+        """
+        json_data = dump_set_fields(update_data)
+        await self._make_request_raw("PATCH", f"issues/{issue_key}", json_data=json_data)
+
+    async def assign_issue(self, issue_key: str, email: str) -> None:
+        """Assign an issue to a user.
+
+        Args:
+            issue_key: Issue key
+            email: Assignee email
+        """
+        await self._make_request_raw("PUT", f"issues/{issue_key}/assign/{email}")
+
+    async def get_issue_transitions(self, issue_key: str) -> List[IssueTransition]:
+        """Get available transitions for an issue.
+
+        Args:
+            issue_key: Issue key
+
+        Returns:
+            List of available transitions
+        """
+        data = await self._make_request_raw("GET", f"issues/{issue_key}/transitions")
+
+        return self._parse_list(IssueTransition, data, "transitions data")
+
+    async def transition_issue(
+        self,
+        issue_key: str,
+        transition_name: str,
+        comment: Optional[str] = None,
+        resolution_name: Optional[str] = None,
+    ) -> None:
+        """Transition an issue.
+
+        Args:
+            issue_key: Issue key
+            transition_name: Transition name
+            comment: Optional comment
+            resolution_name: Optional resolution name
+        """
+        json_data = {
+            "transition_name": transition_name,
+            "comment": comment,
+            "resolution_name": resolution_name,
+        }
+        await self._make_request_raw("POST", f"issues/{issue_key}/transitions", json_data=json_data)
+
+    # Project Methods
+
+    async def get_project(self, project_key: str) -> Project:
+        """Get a project by key.
+
+        Args:
+            project_key: Project key
+
+        Returns:
+            Project object
+        """
+        data = await self._make_request_raw("GET", f"projects/{project_key}")
+
+        return self._parse(Project, data, "project data")
+
+    async def get_project_versions(
+        self, project_key: str, released: Optional[bool] = None
+    ) -> List[ProjectVersion]:
+        """Get project versions.
+
+        Args:
+            project_key: Project key
+            released: Filter by release status
+
+        Returns:
+            List of ProjectVersion objects
+        """
+        params = {}
+        if released is not None:
+            params["released"] = released
+
+        data = await self._make_request_raw("GET", f"projects/{project_key}/versions", params=params)
+
+        return self._parse_list(ProjectVersion, data, "project versions")
+
+    async def create_project_version(
+        self, project_key: str, name: str, description: Optional[str] = None
+    ) -> ProjectVersion:
+        """Create a new project version.
+
+        Args:
+            project_key: Project key
+            name: Version name
+            description: Optional description
+
+        Returns:
+            Created ProjectVersion object
+        """
+        json_data = {"name": name}
+        if description:
+            json_data["description"] = description
+
+        data = await self._make_request("POST", f"projects/{project_key}/versions", json_data=json_data)
+
+        try:
+            return ProjectVersion(**data)
+        except ValidationError as e:
+            raise SDKError(f"Failed to parse created version data: {e}")
+
+    async def get_project_issue_types(self, project_key: str) -> List[Dict[str, Any]]:
+        """Get issue types for a specific project.
+
+        Args:
+            project_key: Project key
+
+        Returns:
+            List of issue type data for the project
+        """
+        return await self._make_request("GET", f"projects/{project_key}/issue-types")
+
+    async def create_issue_by_type_name(
+        self,
+        project_key: str,
+        summary: str,
+        issue_type_name: str,
+        description: Optional[str] = None,
+        assignee_email: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+    ) -> Issue:
+        """Create an issue using issue type name instead of ID.
+
+        Args:
+            project_key: Project key
+            summary: Issue summary
+            issue_type_name: Name of the issue type (e.g., 'Bug', 'Story', 'Task')
+            description: Optional description
+            assignee_email: Optional assignee email
+            labels: Optional labels
+
+        Returns:
+            Created Issue object
+        """
+        json_data = {
+            "project_key": project_key,
+            "summary": summary,
+            "issue_type_name": issue_type_name,
+            "description": description,
+            "assignee_email": assignee_email,
+            "labels": labels or [],
+        }
+        data = await self._make_request("POST", "issues/by-type-name", json_data=json_data)
+
+        try:
+            return Issue(**data)
+        except ValidationError as e:
+            raise SDKError(f"Failed to parse created issue data: {e}")
+
+    # Convenience Methods
+
+    async def create_bug(
+        self,
+        project_id: str,
+        summary: str,
+        description: Optional[str] = None,
+        assignee_account_id: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+    ) -> Issue:
+        """Convenience method to create a bug issue.
+
+        Args:
+            project_id: Project ID
+            summary: Issue summary
+            description: Optional description
+            assignee_account_id: Optional assignee account ID
+            labels: Optional labels
+
+        Returns:
+            Created Issue object
+        """
+        issue_data = IssueCreate(
+            project_id=project_id,
+            summary=summary,
+            description=description,
+            issue_type_id="10004",  # Common bug issue type ID
+            assignee_account_id=assignee_account_id,
+            labels=labels or [],
+        )
+        return await self.create_issue(issue_data)
+
+    async def create_task(
+        self,
+        project_id: str,
+        summary: str,
+        description: Optional[str] = None,
+        assignee_account_id: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+    ) -> Issue:
+        """Convenience method to create a task issue.
+
+        Args:
+            project_id: Project ID
+            summary: Issue summary
+            description: Optional description
+            assignee_account_id: Optional assignee account ID
+            labels: Optional labels
+
+        Returns:
+            Created Issue object
+        """
+        issue_data = IssueCreate(
+            project_id=project_id,
+            summary=summary,
+            description=description,
+            issue_type_id="10003",  # Common task issue type ID
+            assignee_account_id=assignee_account_id,
+            labels=labels or [],
+        )
+        return await self.create_issue(issue_data)
\ No newline at end of file
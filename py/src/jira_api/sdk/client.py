@@ -1,19 +1,63 @@
 """SDK client for interacting with the JIRA API server."""
 
+import asyncio
+import atexit
 import logging
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 import httpx
-from pydantic import ValidationError
+import orjson
+from pydantic import BaseModel, ValidationError
 
 from jira_api.exceptions import SDKError
 from jira_api.models.issue import Issue, IssueCreate, IssueTransition, IssueUpdate
 from jira_api.models.project import Project, ProjectVersion
 from jira_api.models.user import User
+from jira_api.sdk.async_client import AsyncJiraSDKClient
+from jira_api.sdk.construct import construct, construct_list, list_adapter
+from jira_api.sdk.dump import dump_set_fields
+from jira_api.sdk.http import parse_response, request_headers, response_content
 
 logger = logging.getLogger(__name__)
 
+M = TypeVar("M", bound=BaseModel)
+T = TypeVar("T")
+
+# (endpoint, sorted query params) identifying a cacheable GET
+_CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+# Shared HTTP clients keyed by (base_url, api_key, timeout), so short-lived
+# JiraSDKClient instances reuse warm connections
+_CLIENT_POOL: Dict[Tuple[str, Optional[str], float], httpx.Client] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _new_http_client(api_key: Optional[str], timeout: float) -> httpx.Client:
+    """Create the underlying HTTP client for an SDK client."""
+    return httpx.Client(timeout=timeout, headers=request_headers(api_key))
+
+
+def _pooled_http_client(base_url: str, api_key: Optional[str], timeout: float) -> httpx.Client:
+    """Return the shared HTTP client for a configuration, creating it if needed."""
+    key = (base_url, api_key, timeout)
+    with _CLIENT_POOL_LOCK:
+        client = _CLIENT_POOL.get(key)
+        if client is None or client.is_closed:
+            client = _CLIENT_POOL[key] = _new_http_client(api_key, timeout)
+        return client
+
+
+@atexit.register
+def _close_pooled_clients() -> None:
+    """Close every pooled HTTP client at interpreter exit."""
+    with _CLIENT_POOL_LOCK:
+        clients = list(_CLIENT_POOL.values())
+        _CLIENT_POOL.clear()
+    for client in clients:
+        client.close()
+
 
 class JiraSDKClient:
     """SDK client for interacting with the JIRA API server."""
@@ -23,6 +67,8 @@ class JiraSDKClient:
         base_url: str,
         api_key: Optional[str] = None,
         timeout: float = 30.0,
+        trust_server: Optional[bool] = None,
+        pooled: bool = True,
     ) -> None:
         """Initialize the SDK client.
 
@@ -30,26 +76,31 @@ class JiraSDKClient:
             base_url: Base URL of the JIRA API server
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds
+            trust_server: Build read responses with ``model_construct`` instead
+                of validating them. Defaults to the ``JIRA_SDK_TRUST_SERVER``
+                environment variable being ``1``.
+            pooled: Share the HTTP connection pool with other clients created
+                with the same ``base_url``, ``api_key`` and ``timeout``. Pooled
+                connections are closed at interpreter exit rather than by
+                ``close()``.
         """
         if not base_url.endswith("/"):
             base_url += "/"
 
         self.base_url = base_url
         self.timeout = timeout
-
-        # Set up authentication if API key is provided
-        auth = None
-        if api_key:
-            auth = (api_key, "")  # Use API key as username, empty password
-
-        self._client = httpx.Client(
-            auth=auth,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            },
-        )
+        self._api_key = api_key
+        if trust_server is None:
+            trust_server = os.environ.get("JIRA_SDK_TRUST_SERVER") == "1"
+        self.trust_server = trust_server
+        # Parsed bodies of read-mostly GETs, revalidated with If-None-Match
+        self._etag_cache: Dict[_CacheKey, Tuple[str, Any]] = {}
+
+        self._owns_client = not pooled
+        if pooled:
+            self._client = _pooled_http_client(base_url, api_key, timeout)
+        else:
+            self._client = _new_http_client(api_key, timeout)
 
     def __enter__(self) -> "JiraSDKClient":
         """Context manager entry."""
@@ -60,64 +111,178 @@ class JiraSDKClient:
         self.close()
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client, unless it is shared through the pool."""
+        if self._owns_client:
+            self._client.close()
 
-    def _make_request(
+    def _send(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Any:
-        """Make an HTTP request to the API server.
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Send an HTTP request to the API server.
 
         Args:
             method: HTTP method
             endpoint: API endpoint
             params: Query parameters
             json_data: JSON data for request body
+            headers: Extra headers for this request
 
         Returns:
-            Response data
+            The HTTP response
 
         Raises:
-            SDKError: For any error responses
+            SDKError: If the request could not be sent
         """
-        url = urljoin(self.base_url, endpoint)
+        url = self.base_url + endpoint.lstrip("/")
 
         try:
             logger.debug(f"Making {method} request to {url}")
-            response = self._client.request(
+            return self._client.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json_data,
+                content=orjson.dumps(json_data) if json_data is not None else None,
+                headers=headers,
             )
+        except httpx.RequestError as e:
+            raise SDKError(f"Request failed: {e}")
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make an HTTP request to the API server.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
+            json_data: JSON data for request body
+
+        Returns:
+            Response data
+
+        Raises:
+            SDKError: For any error responses
+        """
+        return parse_response(self._send(method, endpoint, params, json_data))
+
+    def _make_request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """Make an HTTP request and return the undecoded response body.
 
-            if response.status_code >= 400:
-                error_msg = f"HTTP {response.status_code}"
-                try:
-                    error_data = response.json()
-                    if "detail" in error_data:
-                        error_msg = error_data["detail"]
-                except Exception:
-                    pass
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
+            json_data: JSON data for request body
 
-                raise SDKError(
-                    error_msg,
-                    status_code=response.status_code,
-                    response_data=error_data if 'error_data' in locals() else {},
-                )
+        Returns:
+            Raw response body
 
-            # Handle empty responses
-            if response.status_code == 204 or not response.content:
-                return {}
+        Raises:
+            SDKError: For any error responses
+        """
+        return response_content(self._send(method, endpoint, params, json_data))
 
-            return response.json()
+    def _get_conditional(
+        self,
+        endpoint: str,
+        parse: Callable[[bytes], T],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> T:
+        """Make a GET request, reusing the parsed result while its ETag is current.
 
-        except httpx.RequestError as e:
-            raise SDKError(f"Request failed: {e}")
+        Once a response carrying an ``ETag`` has been parsed, later calls send
+        ``If-None-Match`` and a ``304 Not Modified`` reply returns the cached
+        value without decoding or building models again.
+
+        Args:
+            endpoint: API endpoint
+            parse: Builds the return value from the raw response body
+            params: Query parameters
+
+        Returns:
+            Parsed response value
+
+        Raises:
+            SDKError: For any error responses
+        """
+        key: _CacheKey = (endpoint, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+
+        response = self._send("GET", endpoint, params, headers=headers)
+        if cached is not None and response.status_code == 304:
+            value = cached[1]
+        else:
+            value = parse(response_content(response))
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[key] = (etag, value)
+            else:
+                self._etag_cache.pop(key, None)
+
+        # Hand out a fresh list so callers cannot modify the cached one
+        return list(value) if isinstance(value, list) else value  # type: ignore[return-value]
+
+    def _parse(self, model_cls: Type[M], content: bytes, what: str) -> M:
+        """Build a model from a raw read response.
+
+        Validates straight from the JSON bytes, or skips validation entirely
+        when the server is trusted.
+
+        Args:
+            model_cls: Model class to build
+            content: Raw response body
+            what: Description used in the error message
+
+        Returns:
+            Model instance
+
+        Raises:
+            SDKError: If the data fails validation
+        """
+        try:
+            if self.trust_server:
+                return construct(model_cls, orjson.loads(content))
+            return model_cls.model_validate_json(content)
+        except ValueError as e:
+            raise SDKError(f"Failed to parse {what}: {e}")
+
+    def _parse_list(self, model_cls: Type[M], content: bytes, what: str) -> List[M]:
+        """Build a list of models from a raw read response.
+
+        Args:
+            model_cls: Model class to build
+            content: Raw response body (a JSON array)
+            what: Description used in the error message
+
+        Returns:
+            List of model instances
+
+        Raises:
+            SDKError: If the data fails validation
+        """
+        try:
+            if self.trust_server:
+                return construct_list(model_cls, orjson.loads(content))
+            return list_adapter(model_cls).validate_json(content)
+        except ValueError as e:
+            raise SDKError(f"Failed to parse {what}: {e}")
 
     # Health Check
 
@@ -142,12 +307,9 @@ class JiraSDKClient:
             List of User objects
         """
         params = {"query": query, "max_results": max_results}
-        data = self._make_request("GET", "users/search", params=params)
+        data = self._make_request_raw("GET", "users/search", params=params)
 
-        try:
-            return [User(**user_data) for user_data in data]
-        except ValidationError as e:
-            raise SDKError(f"Failed to parse user search results: {e}")
+        return self._parse_list(User, data, "user search results")
 
     def get_user(self, identifier: str) -> User:
         """Get a user by account ID or email.
@@ -158,12 +320,9 @@ class JiraSDKClient:
         Returns:
             User object
         """
-        data = self._make_request("GET", f"users/{identifier}")
+        data = self._make_request_raw("GET", f"users/{identifier}")
 
-        try:
-            return User(**data)
-        except ValidationError as e:
-            raise SDKError(f"Failed to parse user data: {e}")
+        return self._parse(User, data, "user data")
 
     # Issue Methods
 
@@ -176,7 +335,7 @@ class JiraSDKClient:
         Returns:
             Created Issue object
         """
-        json_data = issue_data.model_dump(exclude_unset=True)
+        json_data = dump_set_fields(issue_data)
         data = self._make_request("POST", "issues", json_data=json_data)
 
         try:
@@ -193,37 +352,54 @@ class JiraSDKClient:
         Returns:
             Issue object
         """
-        data = self._make_request("GET", f"issues/{issue_key}")
+        data = self._make_request_raw("GET", f"issues/{issue_key}")
 
-        try:
-            return Issue(**data)
-        except ValidationError as e:
-            raise SDKError(f"Failed to parse issue data: {e}")
+        return self._parse(Issue, data, "issue data")
+
+    def get_issues(self, issue_keys: List[str], concurrency: int = 32) -> List[Issue]:
+        """Get several issues concurrently instead of one round trip at a time.
+
+        Runs ``AsyncJiraSDKClient.get_issues`` on a private event loop, so it
+        must not be called from a running event loop; use the async client
+        there directly.
+
+        Args:
+            issue_keys: Issue keys
+            concurrency: Maximum number of requests in flight at once
 
-    def update_issue(self, issue_key: str, update_data: IssueUpdate) -> Dict[str, str]:
+        Returns:
+            Issue objects in the same order as ``issue_keys``
+        """
+
+        async def fetch() -> List[Issue]:
+            async with AsyncJiraSDKClient(
+                self.base_url,
+                api_key=self._api_key,
+                timeout=self.timeout,
+                trust_server=self.trust_server,
+            ) as client:
+                return await client.get_issues(issue_keys, concurrency=concurrency)
+
+        return asyncio.run(fetch())
+
+    def update_issue(self, issue_key: str, update_data: IssueUpdate) -> None:
         """Update an issue.
 
         Args:
             issue_key: Issue key
             update_data: Update data
-
-        Returns:
-            Success message
         """
-        json_data = update_data.model_dump(exclude_unset=True)
-        return self._make_request("PATCH", f"issues/{issue_key}", json_data=json_data)
+        json_data = dump_set_fields(update_data)
+        self._make_request_raw("PATCH", f"issues/{issue_key}", json_data=json_data)
 
-    def assign_issue(self, issue_key: str, email: str) -> Dict[str, str]:
+    def assign_issue(self, issue_key: str, email: str) -> None:
         """Assign an issue to a user.
 
         Args:
             issue_key: Issue key
             email: Assignee email
-
-        Returns:
-            Success message
         """
-        return self._make_request("PUT", f"issues/{issue_key}/assign/{email}")
+        self._make_request_raw("PUT", f"issues/{issue_key}/assign/{email}")
 
     def get_issue_transitions(self, issue_key: str) -> List[IssueTransition]:
         """Get available transitions for an issue.
@@ -234,12 +410,9 @@ class JiraSDKClient:
         Returns:
             List of available transitions
         """
-        data = self._make_request("GET", f"issues/{issue_key}/transitions")
+        data = self._make_request_raw("GET", f"issues/{issue_key}/transitions")
 
-        try:
-            return [IssueTransition(**transition) for transition in data]
-        except ValidationError as e:
-            raise SDKError(f"Failed to parse transitions data: {e}")
+        return self._parse_list(IssueTransition, data, "transitions data")
 
     def transition_issue(
         self,
@@ -247,7 +420,7 @@ class JiraSDKClient:
         transition_name: str,
         comment: Optional[str] = None,
         resolution_name: Optional[str] = None,
-    ) -> Dict[str, str]:
+    ) -> None:
         """Transition an issue.
 
         Args:
@@ -255,16 +428,13 @@ class JiraSDKClient:
             transition_name: Transition name
             comment: Optional comment
             resolution_name: Optional resolution name
-
-        Returns:
-            Success message
         """
         json_data = {
             "transition_name": transition_name,
             "comment": comment,
             "resolution_name": resolution_name,
         }
-        return self._make_request("POST", f"issues/{issue_key}/transitions", json_data=json_data)
+        self._make_request_raw("POST", f"issues/{issue_key}/transitions", json_data=json_data)
 
     # Project Methods
 
@@ -277,12 +447,10 @@ class JiraSDKClient:
         Returns:
             Project object
         """
-        data = self._make_request("GET", f"projects/{project_key}")
-
-        try:
-            return Project(**data)
-        except ValidationError as e:
-            raise SDKError(f"Failed to parse project data: {e}")
+        return self._get_conditional(
+            f"projects/{project_key}",
+            lambda data: self._parse(Project, data, "project data"),
+        )
 
     def get_project_versions(
         self, project_key: str, released: Optional[bool] = None
@@ -300,12 +468,11 @@ class JiraSDKClient:
         if released is not None:
             params["released"] = released
 
-        data = self._make_request("GET", f"projects/{project_key}/versions", params=params)
-
-        try:
-            return [ProjectVersion(**version_data) for version_data in data]
-        except ValidationError as e:
-            raise SDKError(f"Failed to parse project versions: {e}")
+        return self._get_conditional(
+            f"projects/{project_key}/versions",
+            lambda data: self._parse_list(ProjectVersion, data, "project versions"),
+            params=params,
+        )
 
     def create_project_version(
         self, project_key: str, name: str, description: Optional[str] = None
@@ -340,7 +507,9 @@ class JiraSDKClient:
         Returns:
             List of issue type data for the project
         """
-        return self._make_request("GET", f"projects/{project_key}/issue-types")
+        # Keep the raw body, so every call decodes dicts of its own
+        content = self._get_conditional(f"projects/{project_key}/issue-types", bytes)
+        return orjson.loads(content) if content else []
 
     def create_issue_by_type_name(
         self,
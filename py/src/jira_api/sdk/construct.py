@@ -0,0 +1,175 @@
+"""Build models from trusted API server responses without validation.
+
+The API server only ever emits data it has already validated against these
+same models, so re-validating it in the SDK is redundant work. ``construct``
+walks a model's fields and uses ``model_construct`` all the way down, only
+converting what ``model_construct`` would otherwise leave as raw JSON
+(nested models and datetimes). Alias lookup and the per-field conversion are
+resolved once per model class. ``list_adapter`` serves the validating path.
+"""
+
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+from jira_api.models.issue import IssuePriority, IssueStatus
+from jira_api.models.project import IssueType, Project
+
+M = TypeVar("M", bound=BaseModel)
+
+# Parses ISO 8601 strings exactly as validation would (incl. "Z" on any Python)
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+# Low-cardinality string fields ("Bug", "To Do", "software", ...) that are
+# interned so every constructed instance shares one str object per value
+_INTERNED_FIELDS: Dict[type, FrozenSet[str]] = {
+    IssuePriority: frozenset({"name"}),
+    IssueStatus: frozenset({"name"}),
+    IssueType: frozenset({"name"}),
+    Project: frozenset({"project_type_key"}),
+}
+
+# Converts a non-None JSON value for a field; None means use the value as-is
+_Converter = Optional[Callable[[Any], Any]]
+
+# model class -> {key as sent on the wire (alias or name): (field name, converter)}
+_PLANS: Dict[type, Dict[str, Tuple[str, _Converter]]] = {}
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string value, leaving anything else unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _parse_datetime(value: Any) -> Any:
+    """Parse an ISO 8601 string, leaving anything else unchanged."""
+    return _DATETIME_ADAPTER.validate_python(value) if isinstance(value, str) else value
+
+
+def _converter(annotation: Any) -> _Converter:
+    """Return the converter a field annotation needs, or None if it needs none."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _converter(args[0]) if len(args) == 1 else None
+    if origin is list:
+        (item_type,) = get_args(annotation)
+        if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+            return lambda value: construct_list(item_type, value)
+        convert_item = _converter(item_type)
+        if convert_item is None:
+            return None
+        return lambda value: [None if item is None else convert_item(item) for item in value]
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return lambda value: construct(annotation, value) if isinstance(value, dict) else value
+        if annotation is datetime:
+            return _parse_datetime
+
+    return None
+
+
+def _plan(model_cls: Type[BaseModel]) -> Dict[str, Tuple[str, _Converter]]:
+    """Return the wire-key to (field name, converter) map for a model, building it once."""
+    plan = _PLANS.get(model_cls)
+    if plan is None:
+        interned = _INTERNED_FIELDS.get(model_cls, frozenset())
+        plan = {}
+        for name, field in model_cls.model_fields.items():
+            convert = _intern if name in interned else _converter(field.annotation)
+            plan[name] = (name, convert)
+            if field.alias:
+                plan[field.alias] = (name, convert)
+        _PLANS[model_cls] = plan
+    return plan
+
+
+@lru_cache(maxsize=256)
+def _keyset_plan(
+    model_cls: Type[BaseModel], keys: Tuple[str, ...]
+) -> Tuple[Optional[Tuple[str, _Converter]], ...]:
+    """Return the plan entry for each key of an observed key order (None if unknown)."""
+    plan = _plan(model_cls)
+    return tuple(plan.get(key) for key in keys)
+
+
+def construct(model_cls: Type[M], data: Dict[str, Any]) -> M:
+    """Build a model instance from trusted data without validating it.
+
+    Args:
+        model_cls: Model class to build
+        data: Decoded JSON object, keyed by field alias or name
+
+    Returns:
+        Model instance, with nested models and datetimes converted
+    """
+    plan = _plan(model_cls)
+    values = {}
+    for key, value in data.items():
+        entry = plan.get(key)
+        if entry is None:
+            continue
+        name, convert = entry
+        values[name] = value if convert is None or value is None else convert(value)
+    return model_cls.model_construct(**values)
+
+
+def construct_list(model_cls: Type[M], data: List[Dict[str, Any]]) -> List[M]:
+    """Build a list of model instances from trusted data without validating them.
+
+    Args:
+        model_cls: Model class to build
+        data: Decoded JSON array of objects
+
+    Returns:
+        List of model instances
+    """
+    if not data:
+        return []
+
+    # The server emits every element with the same keys in the same order, so
+    # resolve the first element's keys once and walk later ones positionally
+    keys = tuple(data[0])
+    steps = _keyset_plan(model_cls, keys)
+    items = []
+    for item in data:
+        if tuple(item) != keys:
+            items.append(construct(model_cls, item))
+            continue
+        values = {}
+        for step, value in zip(steps, item.values()):
+            if step is not None:
+                name, convert = step
+                values[name] = value if convert is None or value is None else convert(value)
+        items.append(model_cls.model_construct(**values))
+    return items
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model_cls: Type[M]) -> "TypeAdapter[List[M]]":
+    """Return a cached ``TypeAdapter`` that validates a JSON array of ``model_cls``.
+
+    Args:
+        model_cls: Model class of the list items
+
+    Returns:
+        TypeAdapter for ``List[model_cls]``
+    """
+    return TypeAdapter(List[model_cls])  # type: ignore[valid-type]
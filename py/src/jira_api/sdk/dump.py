@@ -0,0 +1,30 @@
+"""Serialize flat request models for the API server without ``model_dump``."""
+
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Type
+
+from pydantic import BaseModel
+
+
+@lru_cache(maxsize=None)
+def _field_names(model_cls: Type[BaseModel]) -> Tuple[str, ...]:
+    """Return a model's field names in declaration order, computed once."""
+    return tuple(model_cls.model_fields)
+
+
+def dump_set_fields(model: BaseModel) -> Dict[str, Any]:
+    """Return the explicitly set fields of a flat model as a dict.
+
+    Equivalent to ``model.model_dump(exclude_unset=True)`` for models whose
+    fields are plain JSON values (no nested models, no aliases), such as
+    ``IssueCreate`` and ``IssueUpdate``, without walking the serializer.
+
+    Args:
+        model: Model instance to dump
+
+    Returns:
+        Field name to value mapping for the fields that were set
+    """
+    fields_set = model.model_fields_set
+    values = model.__dict__
+    return {name: values[name] for name in _field_names(type(model)) if name in fields_set}
@@ -0,0 +1,88 @@
+"""HTTP helpers shared by the synchronous and asynchronous SDK clients."""
+
+import base64
+from typing import Any, Dict, Optional
+
+import httpx
+import orjson
+
+from jira_api.exceptions import SDKError
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
+
+
+def request_headers(api_key: Optional[str] = None) -> Dict[str, str]:
+    """Build the default headers, with a precomputed Basic ``Authorization``.
+
+    The API key is sent as the username with an empty password. Setting the
+    header once avoids running httpx's auth flow on every request.
+
+    Args:
+        api_key: Optional API key for authentication
+
+    Returns:
+        New header dict including ``DEFAULT_HEADERS``
+    """
+    if not api_key:
+        return dict(DEFAULT_HEADERS)
+
+    token = base64.b64encode(f"{api_key}:".encode()).decode("ascii")
+    return {**DEFAULT_HEADERS, "Authorization": f"Basic {token}"}
+
+
+def response_content(response: httpx.Response) -> bytes:
+    """Check an API server response for errors and return its raw body.
+
+    Args:
+        response: Response returned by the API server
+
+    Returns:
+        Raw response body
+
+    Raises:
+        SDKError: For any error responses
+    """
+    if response.status_code >= 400:
+        error_msg = f"HTTP {response.status_code}"
+        error_data: Dict[str, Any] = {}
+        content_type = response.headers.get("content-type", "")
+        if content_type.startswith("application/json") and response.content:
+            try:
+                decoded = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                decoded = None
+            if isinstance(decoded, dict):
+                error_data = decoded
+                error_msg = error_data.get("detail", error_msg)
+
+        raise SDKError(
+            error_msg,
+            status_code=response.status_code,
+            response_data=error_data,
+        )
+
+    return response.content
+
+
+def parse_response(response: httpx.Response) -> Any:
+    """Check an API server response for errors and decode its JSON body.
+
+    Args:
+        response: Response returned by the API server
+
+    Returns:
+        Response data, or an empty dict for empty responses
+
+    Raises:
+        SDKError: For any error responses
+    """
+    content = response_content(response)
+
+    # Handle empty responses
+    if response.status_code == 204 or not content:
+        return {}
+
+    return orjson.loads(content)
@@ -1,15 +1,20 @@
 """FastAPI server for JIRA API operations."""
 
+import hashlib
+import hmac
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
-from fastapi import Depends, FastAPI, HTTPException, Query, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from pydantic import BaseModel
 
-from jira_api.config import Settings, get_config
+from jira_api.config import clear_config_cache, get_config, get_settings
 from jira_api.core.client import JiraClient
 from jira_api.exceptions import JiraAPIError
 from jira_api.models.issue import Issue, IssueCreate, IssueTransition, IssueUpdate
@@ -23,15 +28,21 @@ from jira_api.services.user_service import UserService
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global settings
-settings = Settings()
 security = HTTPBasic(auto_error=False)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan manager."""
+    """Application lifespan manager.
+
+    Creates the JIRA client shared by every request, so connections to JIRA
+    are kept alive and reused, and closes it on shutdown.
+    """
     logger.info("Starting JIRA API Server")
+    app.state.jira_client = None
+    app.state.jira_client_error = (
+        "JIRA configuration not found. Please configure the server with environment variables."
+    )
     
     # Validate configuration on startup
     config = get_config()
@@ -39,10 +50,21 @@ async def lifespan(app: FastAPI):
         logger.warning("No JIRA configuration found. Server will require per-request credentials.")
     else:
         logger.info(f"Using JIRA instance: {config.base_url}")
+        try:
+            app.state.jira_client = JiraClient(
+                base_url=config.base_url,
+                email=config.email,
+                api_token=config.api_token,
+            )
+        except Exception as e:
+            logger.error(f"Failed to create JIRA client: {e}")
+            app.state.jira_client_error = f"Failed to create JIRA client: {e}"
     
     yield
     
     logger.info("Shutting down JIRA API Server")
+    if app.state.jira_client is not None:
+        app.state.jira_client.close()
 
 
 app = FastAPI(
@@ -50,50 +72,118 @@ app = FastAPI(
     description="RESTful API for interacting with Jira Cloud REST API v3",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
+# Add CORS middleware. Explicit lists let browsers cache preflight responses
+# for max_age seconds; origins are read once, when the app is built.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=get_settings().cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
+# Compress larger responses (project and version lists) for SDK clients
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+
+def reload_config() -> None:
+    """Drop cached settings and JIRA configuration so they are read again.
+
+    Settings and configuration are cached for the life of the process and
+    looked up per request; call this (e.g. from tests) after changing them.
+    The shared JIRA client is created from configuration at startup.
+    """
+    clear_config_cache()
+
+
+def get_jira_client(request: Request) -> JiraClient:
+    """Get the JIRA client shared by all requests.
 
-def get_jira_client() -> JiraClient:
-    """Get a JIRA client instance.
+    Args:
+        request: Incoming request
 
     Returns:
-        JiraClient instance
+        JiraClient instance created at startup
 
     Raises:
-        HTTPException: If configuration is not available
+        HTTPException: If no client could be created at startup
     """
-    config = get_config()
-    if not config:
+    client = request.app.state.jira_client
+    if client is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="JIRA configuration not found. Please configure the server with environment variables.",
+            detail=request.app.state.jira_client_error,
         )
+    return client
+
+
+def get_user_service(client: JiraClient = Depends(get_jira_client)) -> UserService:
+    """Get a user service for the shared JIRA client."""
+    return UserService(client)
+
+
+def get_issue_service(client: JiraClient = Depends(get_jira_client)) -> IssueService:
+    """Get an issue service for the shared JIRA client."""
+    return IssueService(client)
+
+
+def get_project_service(client: JiraClient = Depends(get_jira_client)) -> ProjectService:
+    """Get a project service for the shared JIRA client."""
+    return ProjectService(client)
 
-    try:
-        return JiraClient(
-            base_url=config.base_url,
-            email=config.email,
-            api_token=config.api_token,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create JIRA client: {e}",
-        )
 
+def _model_response(
+    content: Union[BaseModel, List[BaseModel]],
+    request: Optional[Request] = None,
+) -> Response:
+    """Serialize models for a response without validating them again.
 
-def verify_api_key(credentials: Optional[HTTPBasicCredentials] = Depends(security)) -> bool:
+    Endpoints still declare ``response_model`` for the OpenAPI schema, but
+    returning a response directly bypasses it: FastAPI would otherwise dump,
+    re-validate and dump again models that were validated when parsed from
+    JIRA. The output is the same (aliased keys, ``None`` values included).
+
+    When the request is given, the response carries an ``ETag`` hashed from
+    its body, and a request whose ``If-None-Match`` matches it is answered
+    with ``304 Not Modified`` so the SDK can reuse what it parsed before.
+
+    Args:
+        content: Model or list of models to send
+        request: Incoming request, to support conditional GETs
+
+    Returns:
+        JSON response, or an empty 304 response
+    """
+    if isinstance(content, list):
+        response = ORJSONResponse([item.model_dump(mode="json", by_alias=True) for item in content])
+    else:
+        response = ORJSONResponse(content.model_dump(mode="json", by_alias=True))
+    if request is None:
+        return response
+
+    etag = f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
+async def verify_api_key(
+    credentials: Optional[HTTPBasicCredentials] = Depends(security),
+) -> bool:
     """Verify API key if configured.
 
+    Declared ``async`` because it never blocks, so FastAPI runs it on the
+    event loop instead of handing it to the thread pool on every request.
+
     Args:
         credentials: HTTP Basic credentials
 
@@ -103,6 +193,7 @@ def verify_api_key(credentials: Optional[HTTPBasicCredentials] = Depends(securit
     Raises:
         HTTPException: If authentication fails
     """
+    settings = get_settings()
     if not settings.server_api_key:
         # No API key configured, allow access
         return True
@@ -114,8 +205,11 @@ def verify_api_key(credentials: Optional[HTTPBasicCredentials] = Depends(securit
             headers={"WWW-Authenticate": "Basic"},
         )
 
-    # Use username field for API key (password can be empty)
-    if credentials.username != settings.server_api_key:
+    # Use username field for API key (password can be empty); compare in
+    # constant time so the key cannot be guessed from response timings
+    if not hmac.compare_digest(
+        credentials.username.encode(), settings.server_api_key.encode()
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -125,6 +219,9 @@ def verify_api_key(credentials: Optional[HTTPBasicCredentials] = Depends(securit
     return True
 
 
+# Endpoints that call JIRA are plain ``def`` functions: the client blocks, so
+# FastAPI runs them in its thread pool instead of stalling the event loop.
+
 # Health Check
 
 @app.get("/health", tags=["Health"])
@@ -136,38 +233,36 @@ async def health_check() -> dict:
 # User Endpoints
 
 @app.get("/users/search", response_model=List[User], tags=["Users"])
-async def search_users(
+def search_users(
     query: str = Query(..., description="Search query for users"),
     max_results: int = Query(50, ge=1, le=100, description="Maximum number of results"),
     _: bool = Depends(verify_api_key),
-) -> List[User]:
+    user_service: UserService = Depends(get_user_service),
+) -> Response:
     """Search for users."""
     try:
-        with get_jira_client() as client:
-            user_service = UserService(client)
-            return user_service.search_users(query, max_results)
+        return _model_response(user_service.search_users(query, max_results))
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
 
 @app.get("/users/{identifier}", response_model=User, tags=["Users"])
-async def get_user(
+def get_user(
     identifier: str,
     _: bool = Depends(verify_api_key),
-) -> User:
+    user_service: UserService = Depends(get_user_service),
+) -> Response:
     """Get a user by account ID or email."""
     try:
-        with get_jira_client() as client:
-            user_service = UserService(client)
-            user = user_service.get_user_by_identifier(identifier)
-            
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"User '{identifier}' not found",
-                )
-            
-            return user
+        user = user_service.get_user_by_identifier(identifier)
+        
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User '{identifier}' not found",
+            )
+        
+        return _model_response(user)
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
@@ -175,16 +270,55 @@ async def get_user(
 # Issue Endpoints
 
 @app.post("/issues", response_model=Issue, tags=["Issues"])
-async def create_issue(
+def create_issue(
     issue_data: IssueCreate,
     _: bool = Depends(verify_api_key),
-) -> Issue:
+    issue_service: IssueService = Depends(get_issue_service),
+) -> Response:
     """Create a new issue."""
     try:
-        with get_jira_client() as client:
-            issue_service = IssueService(client)
-            return issue_service.create_issue(
+        issue = issue_service.create_issue(
+            project_id=issue_data.project_id,
+            project_key=issue_data.project_key,
+            summary=issue_data.summary,
+            issue_type_id=issue_data.issue_type_id,
+            description=issue_data.description,
+            priority_id=issue_data.priority_id,
+            assignee_email=None,  # Use account ID directly
+            labels=issue_data.labels,
+        )
+        return _model_response(issue)
+    except JiraAPIError as e:
+        raise HTTPException(status_code=e.status_code or 400, detail=str(e))
+
+
+class BatchIssueResult(BaseModel):
+    """Outcome of one item of a batch issue creation."""
+    
+    index: int
+    status_code: int
+    issue: Optional[Issue] = None
+    error: Optional[str] = None
+
+
+@app.post("/issues:batch", response_model=List[BatchIssueResult], tags=["Issues"])
+def create_issues_batch(
+    issues_data: List[IssueCreate],
+    _: bool = Depends(verify_api_key),
+    issue_service: IssueService = Depends(get_issue_service),
+) -> Response:
+    """Create several issues concurrently over the shared client.
+
+    Items are created independently; each result reports its own success or
+    error in request order.
+    """
+
+    def create(item: Tuple[int, IssueCreate]) -> BatchIssueResult:
+        index, issue_data = item
+        try:
+            issue = issue_service.create_issue(
                 project_id=issue_data.project_id,
+                project_key=issue_data.project_key,
                 summary=issue_data.summary,
                 issue_type_id=issue_data.issue_type_id,
                 description=issue_data.description,
@@ -192,76 +326,93 @@ async def create_issue(
                 assignee_email=None,  # Use account ID directly
                 labels=issue_data.labels,
             )
-    except JiraAPIError as e:
-        raise HTTPException(status_code=e.status_code or 400, detail=str(e))
+        except JiraAPIError as e:
+            return BatchIssueResult(index=index, status_code=e.status_code or 400, error=str(e))
+        return BatchIssueResult(index=index, status_code=status.HTTP_201_CREATED, issue=issue)
+
+    if not issues_data:
+        return _model_response([])
+
+    workers = min(get_settings().server_batch_workers, len(issues_data))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return _model_response(list(executor.map(create, enumerate(issues_data))))
 
 
 @app.get("/issues/{issue_key}", response_model=Issue, tags=["Issues"])
-async def get_issue(
+def get_issue(
     issue_key: str,
+    fresh: bool = Query(False, description="Bypass the short-lived issue cache"),
     _: bool = Depends(verify_api_key),
-) -> Issue:
+    issue_service: IssueService = Depends(get_issue_service),
+) -> Response:
     """Get an issue by key."""
     try:
-        with get_jira_client() as client:
-            issue_service = IssueService(client)
-            return issue_service.get_issue(issue_key)
+        return _model_response(issue_service.get_issue(issue_key, fresh=fresh))
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
 
-@app.patch("/issues/{issue_key}", tags=["Issues"])
-async def update_issue(
+@app.patch(
+    "/issues/{issue_key}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    tags=["Issues"],
+)
+def update_issue(
     issue_key: str,
     update_data: IssueUpdate,
     _: bool = Depends(verify_api_key),
-) -> dict:
+    issue_service: IssueService = Depends(get_issue_service),
+) -> Response:
     """Update an issue."""
     try:
-        with get_jira_client() as client:
-            issue_service = IssueService(client)
-            
-            if update_data.summary:
-                issue_service.update_issue_summary(issue_key, update_data.summary)
-            
-            if update_data.labels_add:
-                issue_service.add_labels_to_issue(issue_key, update_data.labels_add)
-            
-            if update_data.labels_remove:
-                issue_service.remove_labels_from_issue(issue_key, update_data.labels_remove)
-            
-            return {"message": f"Issue {issue_key} updated successfully"}
+        
+        # One request for all changes; separate concurrent label edits
+        # to the same issue could overwrite each other
+        issue_service.update_issue_fields(
+            issue_key,
+            summary=update_data.summary,
+            description=update_data.description,
+            priority_id=update_data.priority_id,
+            labels_add=update_data.labels_add,
+            labels_remove=update_data.labels_remove,
+        )
+
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
 
-@app.put("/issues/{issue_key}/assign/{email}", tags=["Issues"])
-async def assign_issue(
+@app.put(
+    "/issues/{issue_key}/assign/{email}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    tags=["Issues"],
+)
+def assign_issue(
     issue_key: str,
     email: str,
     _: bool = Depends(verify_api_key),
-) -> dict:
+    issue_service: IssueService = Depends(get_issue_service),
+) -> Response:
     """Assign an issue to a user."""
     try:
-        with get_jira_client() as client:
-            issue_service = IssueService(client)
-            issue_service.assign_issue_by_email(issue_key, email)
-            
-            return {"message": f"Issue {issue_key} assigned to {email}"}
+        issue_service.assign_issue_by_email(issue_key, email)
+        
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
 
 @app.get("/issues/{issue_key}/transitions", response_model=List[IssueTransition], tags=["Issues"])
-async def get_issue_transitions(
+def get_issue_transitions(
     issue_key: str,
     _: bool = Depends(verify_api_key),
-) -> List[IssueTransition]:
+    issue_service: IssueService = Depends(get_issue_service),
+) -> Response:
     """Get available transitions for an issue."""
     try:
-        with get_jira_client() as client:
-            issue_service = IssueService(client)
-            return issue_service.get_available_transitions(issue_key)
+        return _model_response(issue_service.get_available_transitions(issue_key))
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
@@ -274,24 +425,28 @@ class TransitionRequest(BaseModel):
     resolution_name: Optional[str] = None
 
 
-@app.post("/issues/{issue_key}/transitions", tags=["Issues"])
-async def transition_issue(
+@app.post(
+    "/issues/{issue_key}/transitions",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    tags=["Issues"],
+)
+def transition_issue(
     issue_key: str,
     transition_request: TransitionRequest,
     _: bool = Depends(verify_api_key),
-) -> dict:
+    issue_service: IssueService = Depends(get_issue_service),
+) -> Response:
     """Transition an issue to a new status."""
     try:
-        with get_jira_client() as client:
-            issue_service = IssueService(client)
-            issue_service.transition_issue_by_name(
-                issue_key,
-                transition_request.transition_name,
-                transition_request.comment,
-                transition_request.resolution_name,
-            )
-            
-            return {"message": f"Issue {issue_key} transitioned using '{transition_request.transition_name}'"}
+        issue_service.transition_issue_by_name(
+            issue_key,
+            transition_request.transition_name,
+            transition_request.comment,
+            transition_request.resolution_name,
+        )
+        
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
@@ -299,30 +454,33 @@ async def transition_issue(
 # Project Endpoints
 
 @app.get("/projects/{project_key}", response_model=Project, tags=["Projects"])
-async def get_project(
+def get_project(
     project_key: str,
+    request: Request,
     _: bool = Depends(verify_api_key),
-) -> Project:
+    project_service: ProjectService = Depends(get_project_service),
+) -> Response:
     """Get a project by key."""
     try:
-        with get_jira_client() as client:
-            project_service = ProjectService(client)
-            return project_service.get_project(project_key)
+        return _model_response(project_service.get_project(project_key), request)
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
 
 @app.get("/projects/{project_key}/versions", response_model=List[ProjectVersion], tags=["Projects"])
-async def get_project_versions(
+def get_project_versions(
     project_key: str,
+    request: Request,
     released: Optional[bool] = Query(None, description="Filter by release status"),
     _: bool = Depends(verify_api_key),
-) -> List[ProjectVersion]:
+    project_service: ProjectService = Depends(get_project_service),
+) -> Response:
     """Get project versions."""
     try:
-        with get_jira_client() as client:
-            project_service = ProjectService(client)
-            return project_service.get_project_versions(project_key, released_only=released)
+        return _model_response(
+            project_service.get_project_versions(project_key, released_only=released),
+            request,
+        )
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
@@ -335,33 +493,40 @@ class VersionCreateRequest(BaseModel):
 
 
 @app.post("/projects/{project_key}/versions", response_model=ProjectVersion, tags=["Projects"])
-async def create_project_version(
+def create_project_version(
     project_key: str,
     version_request: VersionCreateRequest,
     _: bool = Depends(verify_api_key),
-) -> ProjectVersion:
+    project_service: ProjectService = Depends(get_project_service),
+) -> Response:
     """Create a new project version."""
     try:
-        with get_jira_client() as client:
-            project_service = ProjectService(client)
-            return project_service.create_version(
-                project_key,
-                version_request.name,
-                version_request.description,
-            )
+        version = project_service.create_version(
+            project_key,
+            version_request.name,
+            version_request.description,
+        )
+        return _model_response(version)
     except JiraAPIError as e:
         raise HTTPException(status_code=e.status_code or 400, detail=str(e))
 
 
 def start_server() -> None:
-    """Start the FastAPI server (entry point for CLI)."""
+    """Start the FastAPI server (entry point for CLI).
+
+    uvicorn picks uvloop and httptools on its own when they are installed,
+    as they are with ``uvicorn[standard]``. Each worker is a separate process
+    with its own JIRA client and caches.
+    """
     import uvicorn
     
+    settings = get_settings()
     uvicorn.run(
         "jira_api.server:app",
         host=settings.server_host,
         port=settings.server_port,
         reload=settings.server_reload,
+        workers=None if settings.server_reload else settings.server_workers,
     )
 
 
@@ -0,0 +1,100 @@
+"""Small in-process caches shared by the services."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+from weakref import WeakKeyDictionary
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_REGISTRY_LOCK = threading.Lock()
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded mapping whose entries expire a fixed time after being stored.
+
+    Safe to share between threads. When full, the oldest entry is dropped.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expires_at, value), oldest first
+        self._data: Dict[K, Tuple[float, V]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value stored for a key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            with self._lock:
+                if self._data.get(key) is entry:
+                    del self._data[key]
+            return None
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value for a key, dropping the oldest entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: K) -> None:
+        """Remove a key if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+
+def cache_for(registry: "WeakKeyDictionary[Any, V]", owner: Any, factory: Callable[[], V]) -> V:
+    """Return the cache kept for an owner, creating it on first use.
+
+    Services are cheap and often built per request, so caches are kept in a
+    registry keyed weakly by the client they wrap. Every service on one
+    client shares them, and they go away with the client.
+
+    Args:
+        registry: Mapping of owner to cache
+        owner: Object the cache belongs to, usually a JiraClient
+        factory: Builds a new cache for an owner that has none
+
+    Returns:
+        The owner's cache
+    """
+    with _REGISTRY_LOCK:
+        cache = registry.get(owner)
+        if cache is None:
+            cache = factory()
+            registry[owner] = cache
+        return cache
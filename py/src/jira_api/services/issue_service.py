@@ -1,8 +1,12 @@
 """Issue service for JIRA operations."""
 
-from typing import List, Optional
+import threading
+from functools import cached_property
+from typing import Dict, List, NamedTuple, Optional, Sequence
+from weakref import WeakKeyDictionary
 
 from jira_api.core.client import JiraClient
+from jira_api.exceptions import JiraValidationError
 from jira_api.models.issue import (
     Issue,
     IssueAssignment,
@@ -11,8 +15,103 @@ from jira_api.models.issue import (
     IssueTransitionRequest,
     IssueUpdate,
 )
+from jira_api.services.cache import TTLCache, cache_for
 from jira_api.services.user_service import UserService
 
+# Most issues whose transitions are remembered, and for how many seconds
+TRANSITIONS_CACHE_SIZE = 512
+TRANSITIONS_CACHE_TTL = 60.0
+# Most issues remembered by get_issue, and for how many seconds
+ISSUE_CACHE_SIZE = 2048
+ISSUE_CACHE_TTL = 10.0
+# Seconds a write is remembered, to keep fetches started before it uncached
+ISSUE_GENERATION_TTL = 300.0
+
+
+class _CachedTransitions(NamedTuple):
+    """An issue's available transitions with an index built when fetched."""
+
+    transitions: List[IssueTransition]
+    by_name: Dict[str, str]
+
+
+# Issue key -> available transitions, cached per client; see ``cache_for``
+_TRANSITION_CACHES: "WeakKeyDictionary[JiraClient, TTLCache[str, _CachedTransitions]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _new_transitions_cache() -> "TTLCache[str, _CachedTransitions]":
+    """Create an empty transitions cache."""
+    return TTLCache(TRANSITIONS_CACHE_SIZE, TRANSITIONS_CACHE_TTL)
+
+
+class _IssueCache:
+    """Issues with all fields by key, guarded against fetches racing writes.
+
+    Each write stores a new generation token for the issue before dropping
+    it. A fetch only stores its result if the token is still the one seen
+    before fetching, so a read that started before a write cannot put the
+    pre-write issue back after the write dropped it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._issues: "TTLCache[str, Issue]" = TTLCache(ISSUE_CACHE_SIZE, ISSUE_CACHE_TTL)
+        # Kept well past the issue TTL so tokens outlive any fetch in flight
+        self._generations: "TTLCache[str, object]" = TTLCache(
+            ISSUE_CACHE_SIZE, ISSUE_GENERATION_TTL
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Issue]:
+        """Return the cached issue for a key, or None.
+
+        Args:
+            key: Issue key
+
+        Returns:
+            Cached issue, or None
+        """
+        return self._issues.get(key)
+
+    def generation(self, key: str) -> Optional[object]:
+        """Return the token of the last write to a key, to pass to ``set``.
+
+        Args:
+            key: Issue key
+
+        Returns:
+            Generation token, or None if no recent write
+        """
+        return self._generations.get(key)
+
+    def set(self, key: str, issue: Issue, generation: Optional[object]) -> None:
+        """Store an issue unless the key was written since ``generation``.
+
+        Args:
+            key: Issue key
+            issue: Issue fetched after taking ``generation``
+            generation: Token returned by ``generation`` before fetching
+        """
+        with self._lock:
+            if self._generations.get(key) is generation:
+                self._issues.set(key, issue)
+
+    def pop(self, key: str) -> None:
+        """Drop a key after a write and start a new generation for it.
+
+        Args:
+            key: Issue key
+        """
+        with self._lock:
+            self._generations.set(key, object())
+            self._issues.pop(key)
+
+
+# Issue key -> issue with all fields, cached per client; see ``cache_for``
+_ISSUE_CACHES: "WeakKeyDictionary[JiraClient, _IssueCache]" = WeakKeyDictionary()
+
 
 class IssueService:
     """Service for issue-related operations."""
@@ -24,40 +123,47 @@ class IssueService:
             client: JIRA API client instance
         """
         self.client = client
-        self.user_service = UserService(client)
+        self._transitions = cache_for(_TRANSITION_CACHES, client, _new_transitions_cache)
+        self._issues = cache_for(_ISSUE_CACHES, client, _IssueCache)
+
+    @cached_property
+    def user_service(self) -> UserService:
+        """User service on the same client, created on first use."""
+        return UserService(self.client)
 
     def create_issue(
         self,
-        project_id: str,
+        project_id: Optional[str],
         summary: str,
         issue_type_id: str,
         description: Optional[str] = None,
         priority_id: Optional[str] = None,
         assignee_email: Optional[str] = None,
         labels: Optional[List[str]] = None,
+        project_key: Optional[str] = None,
     ) -> Issue:
         """Create a new issue with simplified parameters.
 
         Args:
-            project_id: ID of the project
+            project_id: ID of the project, or None to identify it by ``project_key``
             summary: Summary of the issue
             issue_type_id: ID of the issue type
             description: Optional description
             priority_id: Optional priority ID
             assignee_email: Optional email of the assignee
             labels: Optional list of labels
+            project_key: Key of the project, used when ``project_id`` is None
 
         Returns:
             Created Issue object
         """
         assignee_account_id = None
         if assignee_email:
-            assignee = self.user_service.get_user_by_email(assignee_email)
-            if assignee:
-                assignee_account_id = assignee.account_id
+            assignee_account_id = self.user_service.account_id_for(assignee_email)
 
         issue_data = IssueCreate(
             project_id=project_id,
+            project_key=project_key,
             summary=summary,
             description=description,
             issue_type_id=issue_type_id,
@@ -95,15 +201,13 @@ class IssueService:
         Raises:
             JiraValidationError: If issue type name is not found in project
         """
-        # Get the project to find the project ID
-        project = self.client.get_project(project_key)
-        project_id = project.id
-        
         # Get issue type ID by name
         issue_type_id = self.client.get_issue_type_id_by_name(project_key, issue_type_name)
-        
+
+        # JIRA accepts the project key directly, so the project is not fetched
         return self.create_issue(
-            project_id=project_id,
+            project_id=None,
+            project_key=project_key,
             summary=summary,
             issue_type_id=issue_type_id,
             description=description,
@@ -112,16 +216,35 @@ class IssueService:
             labels=labels,
         )
 
-    def get_issue(self, issue_key: str) -> Issue:
+    def get_issue(
+        self,
+        issue_key: str,
+        fields: Optional[Sequence[str]] = None,
+        fresh: bool = False,
+    ) -> Issue:
         """Get an issue by its key.
 
+        Issues fetched with all fields are remembered per client for
+        ``ISSUE_CACHE_TTL`` seconds. Changes made through this service drop
+        the issue from the cache; changes made elsewhere may be seen late.
+
         Args:
             issue_key: The issue key (e.g., PROJ-123)
+            fields: Issue fields to return; all navigable fields if omitted
+            fresh: Fetch from JIRA even if the issue is cached
 
         Returns:
             Issue object
         """
-        return self.client.get_issue(issue_key)
+        if fields is not None:
+            return self.client.get_issue(issue_key, fields=fields)
+
+        issue = None if fresh else self._issues.get(issue_key)
+        if issue is None:
+            generation = self._issues.generation(issue_key)
+            issue = self.client.get_issue(issue_key)
+            self._issues.set(issue_key, issue, generation)
+        return issue
 
     def update_issue_summary(self, issue_key: str, summary: str) -> None:
         """Update an issue's summary.
@@ -132,6 +255,7 @@ class IssueService:
         """
         update_data = IssueUpdate(summary=summary)
         self.client.update_issue(issue_key, update_data)
+        self._issues.pop(issue_key)
 
     def update_issue_description(self, issue_key: str, description: str) -> None:
         """Update an issue's description.
@@ -142,6 +266,47 @@ class IssueService:
         """
         update_data = IssueUpdate(description=description)
         self.client.update_issue(issue_key, update_data)
+        self._issues.pop(issue_key)
+
+    def update_issue_fields(
+        self,
+        issue_key: str,
+        *,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        priority_id: Optional[str] = None,
+        labels_add: Optional[List[str]] = None,
+        labels_remove: Optional[List[str]] = None,
+    ) -> None:
+        """Apply several field changes to an issue in one request.
+
+        Args:
+            issue_key: The issue key (e.g., PROJ-123)
+            summary: Optional new summary text
+            description: Optional new description text
+            priority_id: Optional new priority ID
+            labels_add: Optional list of labels to add
+            labels_remove: Optional list of labels to remove
+        """
+        if (
+            summary is None
+            and description is None
+            and priority_id is None
+            and not labels_add
+            and not labels_remove
+        ):
+            # Nothing to change; skip the request and keep the cached issue
+            return
+
+        update_data = IssueUpdate(
+            summary=summary,
+            description=description,
+            priority_id=priority_id,
+            labels_add=labels_add or [],
+            labels_remove=labels_remove or [],
+        )
+        self.client.update_issue(issue_key, update_data)
+        self._issues.pop(issue_key)
 
     def add_labels_to_issue(self, issue_key: str, labels: List[str]) -> None:
         """Add labels to an issue.
@@ -152,6 +317,7 @@ class IssueService:
         """
         update_data = IssueUpdate(labels_add=labels)
         self.client.update_issue(issue_key, update_data)
+        self._issues.pop(issue_key)
 
     def remove_labels_from_issue(self, issue_key: str, labels: List[str]) -> None:
         """Remove labels from an issue.
@@ -162,6 +328,7 @@ class IssueService:
         """
         update_data = IssueUpdate(labels_remove=labels)
         self.client.update_issue(issue_key, update_data)
+        self._issues.pop(issue_key)
 
     def assign_issue_by_email(self, issue_key: str, assignee_email: str) -> None:
         """Assign an issue to a user by email.
@@ -170,12 +337,13 @@ class IssueService:
             issue_key: The issue key (e.g., PROJ-123)
             assignee_email: Email of the user to assign the issue to
         """
-        assignee = self.user_service.get_user_by_email(assignee_email)
-        if not assignee:
+        account_id = self.user_service.account_id_for(assignee_email)
+        if not account_id:
             raise ValueError(f"User with email '{assignee_email}' not found")
 
-        assignment = IssueAssignment(account_id=assignee.account_id)
+        assignment = IssueAssignment(account_id=account_id)
         self.client.assign_issue(issue_key, assignment)
+        self._issues.pop(issue_key)
 
     def unassign_issue(self, issue_key: str) -> None:
         """Unassign an issue.
@@ -185,6 +353,7 @@ class IssueService:
         """
         assignment = IssueAssignment(account_id=None)
         self.client.assign_issue(issue_key, assignment)
+        self._issues.pop(issue_key)
 
     def get_available_transitions(self, issue_key: str) -> List[IssueTransition]:
         """Get available transitions for an issue.
@@ -215,28 +384,63 @@ class IssueService:
         Raises:
             ValueError: If transition name is not found
         """
-        transitions = self.get_available_transitions(issue_key)
-        
-        transition_id = None
-        for transition in transitions:
-            if transition.name.lower() == transition_name.lower():
-                transition_id = transition.id
-                break
-
-        if not transition_id:
-            available_names = [t.name for t in transitions]
-            raise ValueError(
-                f"Transition '{transition_name}' not found. "
-                f"Available transitions: {', '.join(available_names)}"
+        # Reuse recently fetched transitions; they only change with the status.
+        # The status may have changed elsewhere since, so a cached list that
+        # lacks the name or has its transition ID rejected is fetched once more.
+        cached = self._transitions.get(issue_key)
+        fresh = cached is None
+        while True:
+            if cached is None:
+                cached = self._fetch_transitions(issue_key)
+
+            transition_id = cached.by_name.get(transition_name.lower())
+            if not transition_id:
+                if not fresh:
+                    cached, fresh = None, True
+                    continue
+                available_names = [t.name for t in cached.transitions]
+                raise ValueError(
+                    f"Transition '{transition_name}' not found. "
+                    f"Available transitions: {', '.join(available_names)}"
+                )
+
+            transition_request = IssueTransitionRequest(
+                transition_id=transition_id,
+                comment=comment,
+                resolution_name=resolution_name,
             )
+            try:
+                self.client.transition_issue(issue_key, transition_request)
+            except JiraValidationError:
+                # JIRA rejects a stale transition ID with a 400; other errors
+                # propagate, as the POST may have been applied already
+                self._transitions.pop(issue_key)
+                if fresh:
+                    raise
+                cached, fresh = None, True
+                continue
+            break
+
+        self._transitions.pop(issue_key)
+        self._issues.pop(issue_key)
+
+    def _fetch_transitions(self, issue_key: str) -> _CachedTransitions:
+        """Fetch an issue's transitions, index them by name and cache them.
 
-        transition_request = IssueTransitionRequest(
-            transition_id=transition_id,
-            comment=comment,
-            resolution_name=resolution_name,
-        )
-        
-        self.client.transition_issue(issue_key, transition_request)
+        Args:
+            issue_key: The issue key (e.g., PROJ-123)
+
+        Returns:
+            The fetched transitions with their name index
+        """
+        transitions = self.get_available_transitions(issue_key)
+        by_name: Dict[str, str] = {}
+        for transition in transitions:
+            # Keep the first match, as the previous linear scan did
+            by_name.setdefault(transition.name.lower(), transition.id)
+        cached = _CachedTransitions(transitions, by_name)
+        self._transitions.set(issue_key, cached)
+        return cached
 
     def transition_issue_by_id(
         self,
@@ -259,4 +463,6 @@ class IssueService:
             resolution_name=resolution_name,
         )
         
-        self.client.transition_issue(issue_key, transition_request)
\ No newline at end of file
+        self.client.transition_issue(issue_key, transition_request)
+        self._transitions.pop(issue_key)
+        self._issues.pop(issue_key)
\ No newline at end of file
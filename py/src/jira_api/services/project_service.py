@@ -1,9 +1,35 @@
 """Project service for JIRA operations."""
 
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional
+from weakref import WeakKeyDictionary
 
 from jira_api.core.client import JiraClient
 from jira_api.models.project import Project, ProjectVersion, ProjectVersionCreate
+from jira_api.services.cache import TTLCache, cache_for
+
+# Most projects whose versions are remembered, and for how many seconds
+VERSIONS_CACHE_SIZE = 256
+VERSIONS_CACHE_TTL = 60.0
+
+
+class _CachedVersions(NamedTuple):
+    """A project's versions with the indexes built from them when fetched."""
+
+    versions: List[ProjectVersion]
+    by_name: Dict[str, ProjectVersion]
+    released: List[ProjectVersion]
+    unreleased: List[ProjectVersion]
+
+
+# Project key -> versions and their indexes, cached per client; see ``cache_for``
+_VERSION_CACHES: "WeakKeyDictionary[JiraClient, TTLCache[str, _CachedVersions]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _new_versions_cache() -> "TTLCache[str, _CachedVersions]":
+    """Create an empty versions cache."""
+    return TTLCache(VERSIONS_CACHE_SIZE, VERSIONS_CACHE_TTL)
 
 
 class ProjectService:
@@ -16,6 +42,33 @@ class ProjectService:
             client: JIRA API client instance
         """
         self.client = client
+        self._versions_cache = cache_for(_VERSION_CACHES, client, _new_versions_cache)
+
+    def _get_cached_versions(self, project_key: str) -> _CachedVersions:
+        """Return a project's versions and their indexes, fetching when stale.
+
+        Args:
+            project_key: The project key
+
+        Returns:
+            Cached versions with name and release-status indexes
+        """
+        cached = self._versions_cache.get(project_key)
+        if cached is not None:
+            return cached
+
+        versions = self.client.get_project_versions(project_key)
+        by_name: Dict[str, ProjectVersion] = {}
+        released: List[ProjectVersion] = []
+        unreleased: List[ProjectVersion] = []
+        for version in versions:
+            # Keep the first match, as the previous linear scan did
+            by_name.setdefault(version.name, version)
+            (released if version.released else unreleased).append(version)
+
+        cached = _CachedVersions(versions, by_name, released, unreleased)
+        self._versions_cache.set(project_key, cached)
+        return cached
 
     def get_project(self, project_key: str) -> Project:
         """Get a project by its key.
@@ -35,6 +88,9 @@ class ProjectService:
     ) -> List[ProjectVersion]:
         """Get all versions for a project.
 
+        Versions are cached per client and project for ``VERSIONS_CACHE_TTL``
+        seconds, already split by release status and indexed by name.
+
         Args:
             project_key: The project key
             released_only: If True, return only released versions.
@@ -44,14 +100,14 @@ class ProjectService:
         Returns:
             List of ProjectVersion objects
         """
-        versions = self.client.get_project_versions(project_key)
+        cached = self._get_cached_versions(project_key)
         
         if released_only is None:
-            return versions
+            return list(cached.versions)
         elif released_only:
-            return [v for v in versions if v.released]
+            return list(cached.released)
         else:
-            return [v for v in versions if not v.released]
+            return list(cached.unreleased)
 
     def create_version(
         self,
@@ -91,7 +147,9 @@ class ProjectService:
             archived=archived,
         )
 
-        return self.client.create_project_version(version_data)
+        version = self.client.create_project_version(version_data)
+        self._versions_cache.pop(project_key)
+        return version
 
     def get_version_by_name(self, project_key: str, version_name: str) -> Optional[ProjectVersion]:
         """Get a specific version by name.
@@ -103,13 +161,7 @@ class ProjectService:
         Returns:
             ProjectVersion object if found, None otherwise
         """
-        versions = self.get_project_versions(project_key)
-        
-        for version in versions:
-            if version.name == version_name:
-                return version
-        
-        return None
+        return self._get_cached_versions(project_key).by_name.get(version_name)
 
     def get_released_versions(self, project_key: str) -> List[ProjectVersion]:
         """Get all released versions for a project.
@@ -1,9 +1,43 @@
 """User service for JIRA operations."""
 
-from typing import List, Optional
+from typing import Iterator, List, NamedTuple, Optional
+from weakref import WeakKeyDictionary
 
 from jira_api.core.client import JiraClient
+from jira_api.exceptions import JiraNotFoundError
 from jira_api.models.user import User
+from jira_api.services.cache import TTLCache, cache_for
+
+# Most users remembered per lookup kind, and for how many seconds
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL = 300.0
+# Seconds an identifier that matched no user is answered without a request
+USER_MISS_CACHE_TTL = 60.0
+
+
+class _UserCaches(NamedTuple):
+    """Users looked up through one client.
+
+    ``by_email`` is keyed by lowercased email and ``by_id`` by account ID;
+    ``missing`` holds identifiers that recently matched no user.
+    """
+
+    by_email: "TTLCache[str, User]"
+    by_id: "TTLCache[str, User]"
+    missing: "TTLCache[str, bool]"
+
+
+# Users cached per client; see ``cache_for``
+_USER_CACHES: "WeakKeyDictionary[JiraClient, _UserCaches]" = WeakKeyDictionary()
+
+
+def _new_user_caches() -> _UserCaches:
+    """Create empty user caches."""
+    return _UserCaches(
+        TTLCache(USER_CACHE_SIZE, USER_CACHE_TTL),
+        TTLCache(USER_CACHE_SIZE, USER_CACHE_TTL),
+        TTLCache(USER_CACHE_SIZE, USER_MISS_CACHE_TTL),
+    )
 
 
 class UserService:
@@ -16,36 +50,66 @@ class UserService:
             client: JIRA API client instance
         """
         self.client = client
+        self._caches = cache_for(_USER_CACHES, client, _new_user_caches)
 
     def get_user_by_id(self, account_id: str) -> User:
         """Get a user by their account ID.
 
+        Users are remembered per client for ``USER_CACHE_TTL`` seconds.
+
         Args:
             account_id: The account ID of the user
 
         Returns:
             User object
         """
-        return self.client.get_user(account_id)
+        user = self._caches.by_id.get(account_id)
+        if user is None:
+            user = self.client.get_user(account_id)
+            self._caches.by_id.set(account_id, user)
+        return user
 
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get a user by their email address.
 
+        Matches are remembered per client for ``USER_CACHE_TTL`` seconds, so
+        repeated lookups of one email (e.g. bulk assignment) search only
+        once. Misses are not remembered.
+
         Args:
             email: The email address of the user
 
         Returns:
             User object if found, None otherwise
         """
+        key = email.lower()
+        cached = self._caches.by_email.get(key)
+        if cached is not None:
+            return cached
+
         users = self.client.search_users(email, max_results=1)
-        
-        # Find exact email match
-        for user in users:
-            if user.email_address and user.email_address.lower() == email.lower():
-                return user
-        
+        if not users:
+            return None
+
+        # Only one result is requested; accept it if the email matches exactly
+        user = users[0]
+        if user.email_address and user.email_address.lower() == key:
+            self._caches.by_email.set(key, user)
+            return user
         return None
 
+    def account_id_for(self, email: str) -> Optional[str]:
+        """Get the account ID of the user with an email address.
+
+        Args:
+            email: The email address of the user
+
+        Returns:
+            Account ID if a user was found, None otherwise
+        """
+        user = self.get_user_by_email(email)
+        return user.account_id if user else None
+
     def search_users(self, query: str, max_results: int = 50) -> List[User]:
         """Search for users by query string.
 
@@ -58,6 +122,28 @@ class UserService:
         """
         return self.client.search_users(query, max_results)
 
+    def search_users_iter(
+        self, query: str, max_results: int = 50, page_size: int = 50
+    ) -> Iterator[User]:
+        """Search for users, fetching results one page at a time.
+
+        Args:
+            query: Query string to search for users
+            max_results: Maximum number of results to yield
+            page_size: Number of users requested per page
+
+        Yields:
+            User objects matching the search, in result order
+        """
+        start_at = 0
+        while start_at < max_results:
+            limit = min(page_size, max_results - start_at)
+            page = self.client.search_users(query, max_results=limit, start_at=start_at)
+            yield from page
+            if len(page) < limit:
+                return
+            start_at += len(page)
+
     def find_assignable_users_for_projects(
         self, 
         project_keys: List[str], 
@@ -79,8 +165,10 @@ class UserService:
     def get_user_by_identifier(self, identifier: str) -> Optional[User]:
         """Get a user by either account ID or email address.
 
-        This method first tries to get the user by account ID,
-        and if that fails, it searches by email address.
+        Identifiers containing ``@`` are looked up by email only. Anything
+        else is tried as an account ID first and, if no such account exists,
+        searched by email. Identifiers that match nobody are remembered for
+        ``USER_MISS_CACHE_TTL`` seconds.
 
         Args:
             identifier: Either account ID or email address
@@ -88,9 +176,17 @@ class UserService:
         Returns:
             User object if found, None otherwise
         """
-        # First try as account ID
-        try:
-            return self.get_user_by_id(identifier)
-        except Exception:
-            # If that fails, try as email
-            return self.get_user_by_email(identifier)
\ No newline at end of file
+        if self._caches.missing.get(identifier):
+            return None
+
+        if "@" in identifier:
+            user = self.get_user_by_email(identifier)
+        else:
+            try:
+                user = self.get_user_by_id(identifier)
+            except JiraNotFoundError:
+                user = self.get_user_by_email(identifier)
+
+        if user is None:
+            self._caches.missing.set(identifier, True)
+        return user
@@ -0,0 +1,53 @@
+"""Shared fixtures for the unit tests.
+
+Session-scoped fixtures live here so every test module shares one instance.
+Response models are frozen, so the builders below cache what they return and
+hand the same instance to every caller with the same arguments.
+"""
+
+from functools import lru_cache
+
+import pytest
+
+from jira_api.models.issue import Issue, IssueFields, IssueStatus, IssueType
+from jira_api.models.project import Project
+
+
+@lru_cache(maxsize=None)
+def _make_project(project_id="10000", key="PROJ", name="Test Project"):
+    """Build a project, once per distinct set of arguments."""
+    return Project(id=project_id, key=key, name=name)
+
+
+@lru_cache(maxsize=None)
+def _make_issue(issue_type_id, issue_type_name):
+    """Build a minimal issue of the given type in project PROJ."""
+    return Issue(
+        id="10100",
+        key="PROJ-1",
+        self="https://test.atlassian.net/rest/api/3/issue/10100",
+        fields=IssueFields(
+            summary="Test issue",
+            status=IssueStatus(id="1", name="Open", description="Open"),
+            issue_type=IssueType(id=issue_type_id, name=issue_type_name, description=issue_type_name),
+            project=_make_project(),
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def bug_issue():
+    """Provide a Bug issue, built once; tests only read it."""
+    return _make_issue("10001", "Bug")
+
+
+@pytest.fixture(scope="session")
+def story_issue():
+    """Provide a Story issue, built once; tests only read it."""
+    return _make_issue("10001", "Story")
+
+
+@pytest.fixture(scope="session")
+def task_issue():
+    """Provide a Task issue, built once; tests only read it."""
+    return _make_issue("10002", "Task")
@@ -0,0 +1,80 @@
+"""Unit tests for the asynchronous JIRA client."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+
+from jira_api.core.async_client import JiraAsyncClient
+from jira_api.exceptions import JiraValidationError
+
+
+def _issue_data(key):
+    return {
+        "id": key.split("-")[1],
+        "key": key,
+        "self": f"https://test.atlassian.net/rest/api/3/issue/{key}",
+        "fields": {
+            "summary": f"Summary of {key}",
+            "issuetype": {"id": "10001", "name": "Task", "description": "A task", "subtask": False},
+            "project": {"id": "10000", "key": "PROJ", "name": "Test Project"},
+            "status": {"id": "1", "name": "To Do", "description": "Not started"},
+        },
+    }
+
+
+class TestJiraAsyncClient:
+    """Test asynchronous JIRA client functionality."""
+
+    def test_get_issues_preserves_order(self):
+        """Test that get_issues returns issues in the requested order."""
+
+        async def fake_request(method, endpoint, params=None, json_data=None):
+            key = endpoint.rsplit("/", 1)[1]
+            # Finish later keys first to prove results are not completion-ordered
+            await asyncio.sleep(0.01 / int(key.split("-")[1]))
+            return orjson.dumps(_issue_data(key))
+
+        async def run():
+            async with JiraAsyncClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token",
+            ) as client:
+                with patch.object(client, "_make_request_raw", side_effect=fake_request) as mock:
+                    issues = await client.get_issues(["PROJ-1", "PROJ-2", "PROJ-3"])
+                    return issues, mock.call_count
+
+        issues, call_count = asyncio.run(run())
+
+        assert [issue.key for issue in issues] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+        assert call_count == 3
+
+    def test_get_issue_type_id_by_name_not_found(self):
+        """Test issue type lookup failure lists the available types."""
+        mock_project_data = {
+            "issueTypes": [
+                {"id": "10000", "name": "Epic"},
+                {"id": "10001", "name": "Story"},
+            ]
+        }
+
+        async def run():
+            client = JiraAsyncClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token",
+            )
+            try:
+                with patch.object(
+                    client, "_make_request", new=AsyncMock(return_value=mock_project_data)
+                ):
+                    await client.get_issue_type_id_by_name("PROJ", "Bug")
+            finally:
+                await client.close()
+
+        with pytest.raises(JiraValidationError) as exc_info:
+            asyncio.run(run())
+
+        assert "Available types: Epic, Story" in str(exc_info.value)
@@ -0,0 +1,33 @@
+"""Unit tests for the service caches."""
+
+from jira_api.services import cache
+from jira_api.services.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behavior."""
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Test that a stored value is returned until its TTL has passed."""
+        now = [100.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        ttl_cache = TTLCache(maxsize=10, ttl=5)
+
+        ttl_cache.set("key", "value")
+        now[0] = 104.0
+        assert ttl_cache.get("key") == "value"
+
+        now[0] = 105.0
+        assert ttl_cache.get("key") is None
+
+    def test_oldest_entry_is_dropped_when_full(self):
+        """Test that storing past maxsize evicts the oldest entry."""
+        ttl_cache = TTLCache(maxsize=2, ttl=60)
+
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+        ttl_cache.set("c", 3)
+
+        assert ttl_cache.get("a") is None
+        assert ttl_cache.get("b") == 2
+        assert ttl_cache.get("c") == 3
@@ -1,11 +1,14 @@
 """Unit tests for JIRA client functionality."""
 
+import base64
 import pytest
 from unittest.mock import Mock, patch
 import httpx
+import time
 
-from jira_api.core.client import JiraClient
-from jira_api.exceptions import JiraValidationError
+from jira_api.core.client import ISSUE_TYPES_CACHE_TTL, JiraClient
+from jira_api.exceptions import JiraRateLimitError, JiraValidationError
+from jira_api.models.issue import CreatedIssue, IssueCreate
 
 
 class TestJiraClient:
@@ -113,4 +116,235 @@ class TestJiraClient:
             )
             
             issue_types = client.get_project_issue_types("PROJ")
-            assert issue_types == []
\ No newline at end of file
+            assert issue_types == []
+
+    def test_project_issue_types_are_cached(self):
+        """Test that issue types are fetched once per project until the TTL expires."""
+        mock_project_data = {"issueTypes": [{"id": "10004", "name": "Bug"}]}
+
+        with patch.object(JiraClient, '_make_request', return_value=mock_project_data) as mock_request:
+            client = JiraClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token"
+            )
+
+            assert client.get_issue_type_id_by_name("PROJ", "Bug") == "10004"
+            assert client.get_issue_type_id_by_name("PROJ", "bug") == "10004"
+            assert client.get_project_issue_types("PROJ") == mock_project_data["issueTypes"]
+            assert mock_request.call_count == 1
+
+            client.get_project_issue_types("OTHER")
+            assert mock_request.call_count == 2
+
+            with patch("jira_api.core.client.time.monotonic", return_value=time.monotonic() + ISSUE_TYPES_CACHE_TTL):
+                client.get_project_issue_types("PROJ")
+            assert mock_request.call_count == 3
+
+    def test_invalidate_issue_types(self):
+        """Test that invalidated projects are fetched again on the next lookup."""
+        mock_project_data = {"issueTypes": [{"id": "10004", "name": "Bug"}]}
+
+        with patch.object(JiraClient, '_make_request', return_value=mock_project_data) as mock_request:
+            client = JiraClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token"
+            )
+
+            client.get_project_issue_types("PROJ")
+            client.get_project_issue_types("OTHER")
+            client.invalidate_issue_types("PROJ")
+            client.get_project_issue_types("PROJ")
+            client.get_project_issue_types("OTHER")
+            assert mock_request.call_count == 3
+
+            client.invalidate_issue_types()
+            client.get_project_issue_types("OTHER")
+            assert mock_request.call_count == 4
+
+    def test_search_users_validates_raw_json(self):
+        """Test that user search results are validated straight from the response body."""
+        raw = (
+            b'[{"accountId": "1", "displayName": "Ada", "active": true},'
+            b' {"accountId": "2", "displayName": "Grace", "active": false}]'
+        )
+
+        with patch.object(JiraClient, '_make_request_raw', return_value=raw) as mock_request:
+            client = JiraClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token"
+            )
+
+            users = client.search_users("a", max_results=2)
+
+        mock_request.assert_called_once_with(
+            "GET", "user/search", params={"query": "a", "maxResults": 2}
+        )
+        assert [user.account_id for user in users] == ["1", "2"]
+        assert users[1].active is False
+
+    def test_create_issue_without_fetch(self):
+        """Test that fetch_full=False returns the create response without a GET."""
+        created = {
+            "id": "10010",
+            "key": "PROJ-10",
+            "self": "https://test.atlassian.net/rest/api/3/issue/10010",
+        }
+        issue_data = IssueCreate(project_id="10000", summary="New", issue_type_id="10001")
+
+        with patch.object(JiraClient, '_make_request', return_value=created) as mock_request:
+            client = JiraClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token"
+            )
+
+            result = client.create_issue(issue_data, fetch_full=False)
+
+        assert isinstance(result, CreatedIssue)
+        assert result.key == "PROJ-10"
+        mock_request.assert_called_once_with("POST", "issue", json_data=issue_data.to_jira_format())
+
+    def test_request_url_is_built_from_base_url(self):
+        """Test that endpoints are appended to the REST API base URL."""
+        client = JiraClient(
+            base_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="test-token"
+        )
+        response = httpx.Response(200, content=b"{}")
+
+        with patch.object(client._client, "send", return_value=response) as mock_send:
+            client._make_request("GET", "/project/PROJ")
+
+        assert client.base_url == "https://test.atlassian.net/rest/api/3/"
+        assert mock_send.call_args.args[0].url == "https://test.atlassian.net/rest/api/3/project/PROJ"
+
+    def test_search_issues(self):
+        """Test that JQL search results are parsed into IssueSearchResult."""
+        raw = (
+            b'{"startAt": 0, "maxResults": 1, "total": 7, "issues": [{'
+            b'"id": "10010", "key": "PROJ-10", '
+            b'"self": "https://test.atlassian.net/rest/api/3/issue/10010", '
+            b'"fields": {"summary": "Found", '
+            b'"issuetype": {"id": "10001", "name": "Task", "description": "A task"}, '
+            b'"project": {"id": "10000", "key": "PROJ", "name": "Test Project"}, '
+            b'"status": {"id": "1", "name": "To Do", "description": "Not started"}}}]}'
+        )
+
+        with patch.object(JiraClient, '_make_request_raw', return_value=raw) as mock_request:
+            client = JiraClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token"
+            )
+
+            result = client.search_issues("project = PROJ", max_results=1, fields=["summary", "status"])
+
+        mock_request.assert_called_once_with(
+            "GET",
+            "search",
+            params={"jql": "project = PROJ", "startAt": 0, "maxResults": 1, "fields": "summary,status"},
+        )
+        assert result.total == 7
+        assert result.max_results == 1
+        assert [issue.key for issue in result.issues] == ["PROJ-10"]
+
+    def test_get_issue_requests_selected_fields(self):
+        """Test that get_issue forwards a field selection as a query parameter."""
+        raw = (
+            b'{"id": "10010", "key": "PROJ-10", '
+            b'"self": "https://test.atlassian.net/rest/api/3/issue/10010", '
+            b'"fields": {"summary": "Found", '
+            b'"issuetype": {"id": "10001", "name": "Task", "description": "A task"}, '
+            b'"project": {"id": "10000", "key": "PROJ", "name": "Test Project"}, '
+            b'"status": {"id": "1", "name": "To Do", "description": "Not started"}}}'
+        )
+
+        with patch.object(JiraClient, '_make_request_raw', return_value=raw) as mock_request:
+            client = JiraClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token"
+            )
+
+            issue = client.get_issue("PROJ-10", fields=("summary", "status"))
+
+        mock_request.assert_called_once_with(
+            "GET", "issue/PROJ-10", params={"fields": "summary,status"}
+        )
+        assert issue.fields.summary == "Found"
+
+    def test_auth_header_is_precomputed(self):
+        """Test that Basic credentials are sent as a static header."""
+        client = JiraClient(
+            base_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="test-token"
+        )
+
+        expected = "Basic " + base64.b64encode(b"test@example.com:test-token").decode()
+        assert client._client.headers["Authorization"] == expected
+        assert client._client.auth is None
+
+
+    def test_rate_limited_request_is_retried(self):
+        """Test that 429 responses are retried after the Retry-After delay."""
+        client = JiraClient(
+            base_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="test-token"
+        )
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(503),
+            httpx.Response(200, content=b'{"ok": true}'),
+        ]
+
+        with patch.object(client._client, "send", side_effect=responses) as mock_send, \
+                patch("jira_api.core.client.time.sleep") as mock_sleep:
+            assert client._make_request("POST", "issue", json_data={"a": 1}) == {"ok": True}
+
+        assert mock_send.call_count == 3
+        # Retry-After is honoured, then exponential backoff (0.5 * 2**1)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 1.0]
+        # The same encoded request is resent
+        assert mock_send.call_args_list[0].args[0] is mock_send.call_args_list[2].args[0]
+
+    def test_rate_limit_error_after_max_retries(self):
+        """Test that JiraRateLimitError is raised once retries are exhausted."""
+        client = JiraClient(
+            base_url="https://test.atlassian.net",
+            email="test@example.com",
+            api_token="test-token",
+            max_retries=1,
+        )
+
+        with patch.object(client._client, "send", side_effect=lambda request: httpx.Response(429)), \
+                patch("jira_api.core.client.time.sleep"):
+            with pytest.raises(JiraRateLimitError):
+                client._make_request("GET", "myself")
+
+    def test_issue_type_not_found_lists_types_sorted(self):
+        """Test that the available types are listed alphabetically."""
+        mock_project_data = {
+            "issueTypes": [
+                {"id": "10002", "name": "Task"},
+                {"id": "10004", "name": "Bug"},
+                {"id": "10000", "name": "Epic"},
+            ]
+        }
+
+        with patch.object(JiraClient, '_make_request', return_value=mock_project_data):
+            client = JiraClient(
+                base_url="https://test.atlassian.net",
+                email="test@example.com",
+                api_token="test-token"
+            )
+
+            with pytest.raises(JiraValidationError) as exc_info:
+                client.get_issue_type_id_by_name("PROJ", "Story")
+
+        assert "Available types: Bug, Epic, Task" in str(exc_info.value)
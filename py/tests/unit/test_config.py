@@ -0,0 +1,177 @@
+"""Unit tests for configuration loading."""
+
+import json
+import os
+
+import pytest
+
+from jira_api import config as config_module
+from jira_api.config import (
+    JiraConfig,
+    clear_config_cache,
+    get_config,
+    get_config_from_env,
+    load_config,
+    save_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Point the config directory at a temp dir and clear JIRA_* env vars."""
+    config_dir = tmp_path / ".jira-api"
+    monkeypatch.setattr(config_module, "_CONFIG_DIR", config_dir)
+    monkeypatch.setattr(config_module, "_CONFIG_FILE", config_dir / "config.json")
+    monkeypatch.setattr(config_module, "_config_dir_created", False)
+    monkeypatch.chdir(tmp_path)
+    for name in ("JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN"):
+        monkeypatch.delenv(name, raising=False)
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def _set_env(monkeypatch, base_url="https://env.atlassian.net"):
+    monkeypatch.setenv("JIRA_BASE_URL", base_url)
+    monkeypatch.setenv("JIRA_EMAIL", "env@example.com")
+    monkeypatch.setenv("JIRA_API_TOKEN", "env-token")
+
+
+class TestGetConfig:
+    """Test get_config caching."""
+
+    def test_no_config(self):
+        """Test that None is returned when nothing is configured."""
+        assert get_config() is None
+
+    def test_env_config_is_cached(self, monkeypatch):
+        """Test that repeated calls reuse the cached configuration."""
+        _set_env(monkeypatch)
+
+        first = get_config()
+        second = get_config()
+
+        assert first is not None
+        assert first.base_url == "https://env.atlassian.net"
+        assert first is second
+
+    def test_env_change_invalidates_cache(self, monkeypatch):
+        """Test that changing environment variables is picked up."""
+        _set_env(monkeypatch)
+        assert get_config().base_url == "https://env.atlassian.net"
+
+        _set_env(monkeypatch, base_url="https://other.atlassian.net")
+        assert get_config().base_url == "https://other.atlassian.net"
+
+    def test_file_change_invalidates_cache(self):
+        """Test that rewriting the config file is picked up."""
+        save_config(JiraConfig(base_url="https://a.atlassian.net", email="a@example.com", api_token="a"))
+        assert get_config().base_url == "https://a.atlassian.net"
+
+        config_file = config_module.get_config_file()
+        with open(config_file, "w") as f:
+            json.dump({"base_url": "https://b.atlassian.net", "email": "b@example.com", "api_token": "b"}, f)
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert get_config().base_url == "https://b.atlassian.net"
+
+    def test_env_takes_precedence_over_file(self, monkeypatch):
+        """Test that environment variables win over the config file."""
+        save_config(JiraConfig(base_url="https://file.atlassian.net", email="f@example.com", api_token="f"))
+        _set_env(monkeypatch)
+
+        assert get_config().base_url == "https://env.atlassian.net"
+
+
+class TestGetConfigFromEnv:
+    """Test reading configuration from the environment."""
+
+    def test_reads_process_environment(self, monkeypatch):
+        """Test that JIRA_* variables are read directly."""
+        _set_env(monkeypatch)
+
+        config = get_config_from_env()
+
+        assert config == JiraConfig(
+            base_url="https://env.atlassian.net", email="env@example.com", api_token="env-token"
+        )
+
+    def test_falls_back_to_dotenv(self, tmp_path):
+        """Test that a .env file is used when the variables are not exported."""
+        (tmp_path / ".env").write_text(
+            "JIRA_BASE_URL=https://dotenv.atlassian.net\n"
+            "JIRA_EMAIL=dotenv@example.com\n"
+            "JIRA_API_TOKEN=dotenv-token\n"
+        )
+
+        config = get_config_from_env()
+
+        assert config is not None
+        assert config.base_url == "https://dotenv.atlassian.net"
+
+    def test_partial_environment(self, monkeypatch):
+        """Test that None is returned when a variable is missing."""
+        monkeypatch.setenv("JIRA_BASE_URL", "https://env.atlassian.net")
+
+        assert get_config_from_env() is None
+
+
+class TestConfigPaths:
+    """Test configuration path handling."""
+
+    def test_reading_does_not_create_directory(self):
+        """Test that looking up config does not create the config directory."""
+        assert get_config() is None
+        assert not config_module.get_config_file().parent.exists()
+
+    def test_save_creates_directory(self):
+        """Test that saving creates the config directory on demand."""
+        save_config(JiraConfig(base_url="https://a.atlassian.net", email="a@example.com", api_token="a"))
+
+        assert config_module.get_config_file().exists()
+
+
+class TestLoadConfig:
+    """Test load_config caching."""
+
+    def test_missing_file_is_cached(self, monkeypatch):
+        """Test that a missing file is not re-read on every call."""
+        assert load_config() is None
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("config file should not be opened")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        assert load_config() is None
+
+    def test_saved_file_is_picked_up(self):
+        """Test that creating the file invalidates a cached miss."""
+        assert load_config() is None
+
+        save_config(JiraConfig(base_url="https://a.atlassian.net", email="a@example.com", api_token="a"))
+        first = load_config()
+
+        assert first is not None
+        assert first.base_url == "https://a.atlassian.net"
+        assert load_config() is first
+
+    def test_saved_file_is_private(self):
+        """Test that the saved file is owner-only and newline-terminated."""
+        config_file = config_module.get_config_file()
+        config_file.parent.mkdir()
+        config_file.write_text("{}")
+        os.chmod(config_file, 0o644)
+
+        save_config(JiraConfig(base_url="https://a.atlassian.net", email="a@example.com", api_token="a"))
+
+        assert config_file.stat().st_mode & 0o777 == 0o600
+        assert config_file.read_bytes().endswith(b"}\n")
+
+    def test_save_without_fchmod(self, monkeypatch):
+        """Test that saving works where os.fchmod is missing, as on older Windows."""
+        monkeypatch.delattr(os, "fchmod", raising=False)
+
+        save_config(JiraConfig(base_url="https://a.atlassian.net", email="a@example.com", api_token="a"))
+
+        assert config_module.get_config_file().stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,97 @@
+"""Unit tests for shared HTTP helpers."""
+
+import httpx
+import pytest
+
+from jira_api.core.http import MAX_RETRY_DELAY, api_root_url, parse_response, retry_delay
+from jira_api.exceptions import (
+    JiraAPIError,
+    JiraAuthenticationError,
+    JiraNotFoundError,
+    JiraPermissionError,
+    JiraRateLimitError,
+    JiraServerError,
+    JiraValidationError,
+)
+
+
+class TestParseResponse:
+    """Test parse_response status handling and decoding."""
+
+    def test_success_decodes_json(self):
+        """Test that a 200 response body is decoded."""
+        response = httpx.Response(200, content=b'{"key": "PROJ-1"}')
+        assert parse_response(response) == {"key": "PROJ-1"}
+
+    def test_empty_body_returns_empty_dict(self):
+        """Test that 204 No Content yields an empty dict."""
+        assert parse_response(httpx.Response(204)) == {}
+
+    @pytest.mark.parametrize(
+        "status_code, exc_cls",
+        [
+            (401, JiraAuthenticationError),
+            (403, JiraPermissionError),
+            (404, JiraNotFoundError),
+            (429, JiraRateLimitError),
+            (500, JiraServerError),
+            (503, JiraServerError),
+        ],
+    )
+    def test_status_code_mapping(self, status_code, exc_cls):
+        """Test that error status codes raise the matching exception."""
+        with pytest.raises(exc_cls):
+            parse_response(httpx.Response(status_code))
+
+    def test_bad_request_uses_error_messages(self):
+        """Test that 400 responses surface JIRA's errorMessages."""
+        response = httpx.Response(400, content=b'{"errorMessages": ["Field a", "Field b"]}')
+
+        with pytest.raises(JiraValidationError) as exc_info:
+            parse_response(response)
+
+        assert "Field a; Field b" in str(exc_info.value)
+
+    def test_other_client_error_keeps_status_code(self):
+        """Test that unmapped 4xx responses raise a generic JiraAPIError."""
+        with pytest.raises(JiraAPIError) as exc_info:
+            parse_response(httpx.Response(409, content=b"not json"))
+
+        assert exc_info.value.status_code == 409
+        assert "HTTP 409" in str(exc_info.value)
+
+
+class TestApiRootUrl:
+    """Test base URL normalization."""
+
+    @pytest.mark.parametrize(
+        "base_url",
+        ["https://test.atlassian.net", "https://test.atlassian.net/"],
+    )
+    def test_appends_rest_root(self, base_url):
+        """Test that the REST root is appended with a single slash."""
+        assert api_root_url(base_url) == "https://test.atlassian.net/rest/api/3/"
+
+    def test_rejects_missing_scheme(self):
+        """Test that URLs without an http(s) scheme are rejected."""
+        with pytest.raises(JiraValidationError):
+            api_root_url("test.atlassian.net")
+
+
+class TestRetryDelay:
+    """Test retry delay calculation."""
+
+    def test_retry_after_seconds(self):
+        """Test that a numeric Retry-After header is used as-is."""
+        response = httpx.Response(429, headers={"Retry-After": "3"})
+        assert retry_delay(response, attempt=0, backoff_factor=0.5) == 3.0
+
+    def test_exponential_backoff_without_header(self):
+        """Test exponential backoff when Retry-After is absent."""
+        response = httpx.Response(503)
+        assert [retry_delay(response, attempt, 0.5) for attempt in range(3)] == [0.5, 1.0, 2.0]
+
+    def test_delay_is_capped(self):
+        """Test that very long Retry-After values are capped."""
+        response = httpx.Response(429, headers={"Retry-After": "3600"})
+        assert retry_delay(response, attempt=0, backoff_factor=0.5) == MAX_RETRY_DELAY
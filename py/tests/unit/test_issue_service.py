@@ -1,167 +1,326 @@
 """Unit tests for IssueService functionality."""
 
-import pytest
 from unittest.mock import Mock, patch
 
+import pytest
+
+from jira_api.exceptions import JiraAPIError, JiraServerError, JiraValidationError
 from jira_api.services.issue_service import IssueService
-from jira_api.core.client import JiraClient
-from jira_api.models.project import Project
-from jira_api.models.issue import Issue, IssueFields, IssueType, IssueStatus, ProjectRef
+from jira_api.models.issue import IssueStatus, IssueTransition, IssueUpdate
+
+
+class _StubJiraClient:
+    """Stand-in for JiraClient with a mock for each method these tests touch.
+
+    Cheaper than ``Mock(spec=JiraClient)``, which walks the whole class. The
+    slots still turn a call to any other method into an AttributeError.
+    ``__weakref__`` lets the services key their caches by client.
+    """
+
+    __slots__ = (
+        "assign_issue",
+        "create_issue",
+        "get_issue",
+        "get_issue_transitions",
+        "get_issue_type_id_by_name",
+        "get_project",
+        "transition_issue",
+        "update_issue",
+        "__weakref__",
+    )
+
+    def __init__(self):
+        for name in self.__slots__[:-1]:
+            setattr(self, name, Mock())
+
+
+@pytest.fixture
+def mock_client():
+    """Provide a stub JiraClient.
+
+    Built per test: a copy of a shared stub would share its mocks, and
+    return values set by one test would leak into the next.
+    """
+    return _StubJiraClient()
+
+
+@pytest.fixture
+def issue_service(mock_client):
+    """Provide an IssueService on the mock client."""
+    return IssueService(mock_client)
+
+
+@pytest.fixture
+def patched_create_issue(issue_service, monkeypatch):
+    """Replace the service's create_issue with a mock and return the mock."""
+    mock_create = Mock()
+    monkeypatch.setattr(issue_service, "create_issue", mock_create)
+    return mock_create
 
 
 class TestIssueService:
     """Test IssueService functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_client = Mock(spec=JiraClient)
-        self.issue_service = IssueService(self.mock_client)
-
-    def test_create_issue_by_type_name_success(self):
-        """Test successful issue creation by type name."""
-        # Mock project
-        mock_project = Project(
-            id="10000",
-            key="PROJ",
-            name="Test Project",
-            project_type_key="software"
-        )
-        
-        # Mock issue
-        mock_issue = Issue(
-            id="10100",
-            key="PROJ-1",
-            fields=IssueFields(
-                summary="Test issue",
-                status=IssueStatus(id="1", name="Open", description="Open"),
-                issue_type=IssueType(id="10001", name="Bug", description="Bug"),
-                project=ProjectRef(id="10000", key="PROJ", name="Test Project")
-            )
-        )
-        
-        # Set up mocks
-        self.mock_client.get_project.return_value = mock_project
-        self.mock_client.get_issue_type_id_by_name.return_value = "10001"
-        
-        # Mock the create_issue method that will be called internally
-        with patch.object(self.issue_service, 'create_issue', return_value=mock_issue) as mock_create:
-            result = self.issue_service.create_issue_by_type_name(
-                project_key="PROJ",
-                summary="Test issue",
-                issue_type_name="Bug",
-                description="Test description",
-            )
-            
-            # Verify the result
-            assert result == mock_issue
-            
-            # Verify method calls
-            self.mock_client.get_project.assert_called_once_with("PROJ")
-            self.mock_client.get_issue_type_id_by_name.assert_called_once_with("PROJ", "Bug")
-            
-            # Verify create_issue was called with correct parameters
-            mock_create.assert_called_once_with(
-                project_id="10000",
-                summary="Test issue",
-                issue_type_id="10001",
-                description="Test description",
-                priority_id=None,
-                assignee_email=None,
-                labels=[],
-            )
-
-    def test_create_issue_by_type_name_with_all_params(self):
-        """Test issue creation by type name with all optional parameters."""
-        # Mock project
-        mock_project = Project(
-            id="10000",
-            key="PROJ",
-            name="Test Project",
-            project_type_key="software"
+    @pytest.mark.parametrize(
+        "issue_fixture, issue_type_id, kwargs, expected_call",
+        [
+            pytest.param(
+                "bug_issue",
+                "10001",
+                {
+                    "summary": "Test issue",
+                    "issue_type_name": "Bug",
+                    "description": "Test description",
+                },
+                {
+                    "project_id": None,
+                    "project_key": "PROJ",
+                    "summary": "Test issue",
+                    "issue_type_id": "10001",
+                    "description": "Test description",
+                    "priority_id": None,
+                    "assignee_email": None,
+                    "labels": None,
+                },
+                id="success",
+            ),
+            pytest.param(
+                "story_issue",
+                "10001",
+                {
+                    "summary": "Test story",
+                    "issue_type_name": "Story",
+                    "description": "Story description",
+                    "priority_id": "2",
+                    "assignee_email": "user@example.com",
+                    "labels": ["frontend", "urgent"],
+                },
+                {
+                    "project_id": None,
+                    "project_key": "PROJ",
+                    "summary": "Test story",
+                    "issue_type_id": "10001",
+                    "description": "Story description",
+                    "priority_id": "2",
+                    "assignee_email": "user@example.com",
+                    "labels": ["frontend", "urgent"],
+                },
+                id="all-params",
+            ),
+            # The type name is passed on as given; the client matches it
+            # case-insensitively
+            pytest.param(
+                "task_issue",
+                "10002",
+                {"summary": "Test task", "issue_type_name": "TASK"},
+                {
+                    "project_id": None,
+                    "project_key": "PROJ",
+                    "summary": "Test task",
+                    "issue_type_id": "10002",
+                    "description": None,
+                    "priority_id": None,
+                    "assignee_email": None,
+                    "labels": None,
+                },
+                id="case-insensitive",
+            ),
+        ],
+    )
+    def test_create_issue_by_type_name(
+        self,
+        request,
+        mock_client,
+        issue_service,
+        patched_create_issue,
+        issue_fixture,
+        issue_type_id,
+        kwargs,
+        expected_call,
+    ):
+        """Test issue creation by type name."""
+        issue = request.getfixturevalue(issue_fixture)
+        mock_client.get_issue_type_id_by_name.return_value = issue_type_id
+        patched_create_issue.return_value = issue
+
+        result = issue_service.create_issue_by_type_name(project_key="PROJ", **kwargs)
+
+        assert result == issue
+
+        # The project is passed by key, so it is never fetched
+        mock_client.get_project.assert_not_called()
+        mock_client.get_issue_type_id_by_name.assert_called_once_with(
+            "PROJ", kwargs["issue_type_name"]
         )
-        
-        # Mock issue
-        mock_issue = Issue(
-            id="10100",
-            key="PROJ-1",
-            fields=IssueFields(
-                summary="Test issue",
-                status=IssueStatus(id="1", name="Open", description="Open"),
-                issue_type=IssueType(id="10001", name="Story", description="Story"),
-                project=ProjectRef(id="10000", key="PROJ", name="Test Project")
-            )
+        assert patched_create_issue.call_count == 1
+        assert patched_create_issue.call_args.args == ()
+        assert patched_create_issue.call_args.kwargs == expected_call
+
+    def test_update_issue_fields_sends_one_request(self, mock_client, issue_service):
+        """Test that all field changes are combined into one update."""
+        issue_service.update_issue_fields(
+            "PROJ-1",
+            summary="Renamed",
+            description="Details",
+            priority_id="2",
+            labels_add=["new"],
+            labels_remove=["old"],
         )
-        
-        # Set up mocks
-        self.mock_client.get_project.return_value = mock_project
-        self.mock_client.get_issue_type_id_by_name.return_value = "10001"
-        
-        # Mock the create_issue method that will be called internally
-        with patch.object(self.issue_service, 'create_issue', return_value=mock_issue) as mock_create:
-            result = self.issue_service.create_issue_by_type_name(
-                project_key="PROJ",
-                summary="Test story",
-                issue_type_name="Story",
-                description="Story description",
-                priority_id="2",
-                assignee_email="user@example.com",
-                labels=["frontend", "urgent"],
-            )
-            
-            # Verify the result
-            assert result == mock_issue
-            
-            # Verify method calls
-            self.mock_client.get_project.assert_called_once_with("PROJ")
-            self.mock_client.get_issue_type_id_by_name.assert_called_once_with("PROJ", "Story")
-            
-            # Verify create_issue was called with correct parameters
-            mock_create.assert_called_once_with(
-                project_id="10000",
-                summary="Test story",
-                issue_type_id="10001",
-                description="Story description",
+
+        mock_client.update_issue.assert_called_once_with(
+            "PROJ-1",
+            IssueUpdate(
+                summary="Renamed",
+                description="Details",
                 priority_id="2",
-                assignee_email="user@example.com",
-                labels=["frontend", "urgent"],
-            )
-
-    def test_create_issue_by_type_name_case_insensitive(self):
-        """Test issue creation by type name is case insensitive."""
-        # Mock project
-        mock_project = Project(
-            id="10000",
-            key="PROJ",
-            name="Test Project",
-            project_type_key="software"
-        )
-        
-        # Mock issue
-        mock_issue = Issue(
-            id="10100",
-            key="PROJ-1",
-            fields=IssueFields(
-                summary="Test issue",
-                status=IssueStatus(id="1", name="Open", description="Open"),
-                issue_type=IssueType(id="10002", name="Task", description="Task"),
-                project=ProjectRef(id="10000", key="PROJ", name="Test Project")
-            )
+                labels_add=["new"],
+                labels_remove=["old"],
+            ),
         )
-        
-        # Set up mocks
-        self.mock_client.get_project.return_value = mock_project
-        self.mock_client.get_issue_type_id_by_name.return_value = "10002"
-        
-        # Mock the create_issue method that will be called internally
-        with patch.object(self.issue_service, 'create_issue', return_value=mock_issue) as mock_create:
-            result = self.issue_service.create_issue_by_type_name(
-                project_key="PROJ",
-                summary="Test task",
-                issue_type_name="TASK",  # Uppercase
-            )
-            
-            # Verify the result
-            assert result == mock_issue
-            
-            # Verify get_issue_type_id_by_name was called with the original case
-            self.mock_client.get_issue_type_id_by_name.assert_called_once_with("PROJ", "TASK")
\ No newline at end of file
+
+    def test_update_issue_fields_defaults_to_no_label_changes(self, mock_client, issue_service):
+        """Test that omitted label lists are sent as empty operations."""
+        issue_service.update_issue_fields("PROJ-1", summary="Renamed")
+
+        update_data = mock_client.update_issue.call_args.args[1]
+        assert update_data.to_jira_format() == {"update": {"summary": [{"set": "Renamed"}]}}
+
+    def test_update_issue_fields_without_changes_is_skipped(
+        self, mock_client, issue_service, bug_issue
+    ):
+        """Test that an empty update sends nothing and keeps the cached issue."""
+        mock_client.get_issue.return_value = bug_issue
+        issue_service.get_issue("PROJ-1")
+
+        issue_service.update_issue_fields("PROJ-1", labels_add=[])
+        issue_service.get_issue("PROJ-1")
+
+        mock_client.update_issue.assert_not_called()
+        assert mock_client.get_issue.call_count == 1
+
+    def test_transition_issue_by_name_reuses_transitions(self, mock_client, issue_service):
+        """Test that transitions are fetched once and refetched after a transition."""
+        done = IssueStatus(id="3", name="Done", description="Done")
+        mock_client.get_issue_transitions.return_value = [
+            IssueTransition(id="31", name="Done", to=done),
+        ]
+
+        issue_service.transition_issue_by_name("PROJ-1", "done")
+        IssueService(mock_client).transition_issue_by_name("PROJ-1", "Done")
+        assert mock_client.get_issue_transitions.call_count == 2
+
+        with patch.object(issue_service._transitions, "pop"):
+            issue_service.transition_issue_by_name("PROJ-1", "Done")
+            issue_service.transition_issue_by_name("PROJ-1", "Done")
+        assert mock_client.get_issue_transitions.call_count == 3
+
+    def test_transition_issue_by_name_refetches_stale_transitions(self, mock_client, issue_service):
+        """Test that a name missing from cached transitions is looked up again."""
+        in_progress = IssueStatus(id="2", name="In Progress", description="In Progress")
+        done_status = IssueStatus(id="3", name="Done", description="Done")
+        start = IssueTransition(id="11", name="Start", to=in_progress)
+        done = IssueTransition(id="31", name="Done", to=done_status)
+        mock_client.get_issue_transitions.side_effect = [[start], [done], [done]]
+
+        with pytest.raises(ValueError, match="Available transitions: Start"):
+            issue_service.transition_issue_by_name("PROJ-1", "Strat")
+
+        # The issue moved on elsewhere; the cached [Start] no longer applies
+        issue_service.transition_issue_by_name("PROJ-1", "Done")
+        assert mock_client.get_issue_transitions.call_count == 2
+        assert mock_client.transition_issue.call_args.args[1].transition_id == "31"
+
+        with pytest.raises(ValueError, match="Available transitions: Done"):
+            issue_service.transition_issue_by_name("PROJ-1", "Start")
+        assert mock_client.get_issue_transitions.call_count == 3
+
+    def test_transition_issue_by_name_retries_after_failed_cached_transition(
+        self, mock_client, issue_service
+    ):
+        """Test that a transition failing on a cached ID is retried with fresh transitions."""
+        done_status = IssueStatus(id="3", name="Done", description="Done")
+        old = IssueTransition(id="31", name="Done", to=done_status)
+        new = IssueTransition(id="41", name="Done", to=done_status)
+        mock_client.get_issue_transitions.side_effect = [[old], [new]]
+        mock_client.transition_issue.side_effect = [JiraValidationError("Invalid transition"), None]
+
+        issue_service._fetch_transitions("PROJ-1")
+        issue_service.transition_issue_by_name("PROJ-1", "Done")
+
+        assert mock_client.get_issue_transitions.call_count == 2
+        assert mock_client.transition_issue.call_args.args[1].transition_id == "41"
+
+    def test_transition_issue_by_name_failure_with_fresh_transitions(
+        self, mock_client, issue_service
+    ):
+        """Test that a failing transition on just-fetched transitions raises and is not cached."""
+        done_status = IssueStatus(id="3", name="Done", description="Done")
+        done = IssueTransition(id="31", name="Done", to=done_status)
+        mock_client.get_issue_transitions.return_value = [done]
+        mock_client.transition_issue.side_effect = JiraValidationError("Invalid transition")
+
+        with pytest.raises(JiraValidationError):
+            issue_service.transition_issue_by_name("PROJ-1", "Done")
+        assert mock_client.transition_issue.call_count == 1
+        assert issue_service._transitions.get("PROJ-1") is None
+
+    @pytest.mark.parametrize(
+        "error",
+        [JiraServerError("Internal server error"), JiraAPIError("Request failed: timed out")],
+    )
+    def test_transition_issue_by_name_does_not_resend_after_other_errors(
+        self, mock_client, issue_service, error
+    ):
+        """Test that errors other than a rejected transition ID are not retried."""
+        done_status = IssueStatus(id="3", name="Done", description="Done")
+        mock_client.get_issue_transitions.return_value = [
+            IssueTransition(id="31", name="Done", to=done_status),
+        ]
+        mock_client.transition_issue.side_effect = error
+
+        issue_service._fetch_transitions("PROJ-1")
+        with pytest.raises(type(error)):
+            issue_service.transition_issue_by_name("PROJ-1", "Done")
+        assert mock_client.transition_issue.call_count == 1
+        assert mock_client.get_issue_transitions.call_count == 1
+
+    def test_user_service_created_on_first_use(self, mock_client, issue_service):
+        """Test that the user service is built lazily and then reused."""
+        assert "user_service" not in vars(issue_service)
+
+        user_service = issue_service.user_service
+        assert user_service.client is mock_client
+        assert issue_service.user_service is user_service
+
+    def test_get_issue_cached_until_changed(self, mock_client, issue_service, bug_issue):
+        """Test that full issues are cached until updated or fetched fresh."""
+        mock_client.get_issue.return_value = bug_issue
+
+        assert issue_service.get_issue("PROJ-1") is bug_issue
+        assert IssueService(mock_client).get_issue("PROJ-1") is bug_issue
+        assert mock_client.get_issue.call_count == 1
+
+        issue_service.get_issue("PROJ-1", fields=["summary"])
+        issue_service.get_issue("PROJ-1", fresh=True)
+        assert mock_client.get_issue.call_count == 3
+
+        issue_service.update_issue_summary("PROJ-1", "Renamed")
+        issue_service.get_issue("PROJ-1")
+        assert mock_client.get_issue.call_count == 4
+
+    def test_get_issue_racing_a_write_is_not_cached(self, mock_client, issue_service, bug_issue):
+        """Test that an issue fetched while it was being changed is not stored."""
+
+        def get_issue_during_write(issue_key):
+            # Another request changes the issue after this fetch read it
+            IssueService(mock_client).update_issue_summary(issue_key, "Renamed")
+            return bug_issue
+
+        mock_client.get_issue.side_effect = get_issue_during_write
+        assert issue_service.get_issue("PROJ-1") is bug_issue
+
+        mock_client.get_issue.side_effect = None
+        mock_client.get_issue.return_value = bug_issue
+        issue_service.get_issue("PROJ-1")
+        issue_service.get_issue("PROJ-1")
+        assert mock_client.get_issue.call_count == 2
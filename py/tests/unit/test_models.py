@@ -1,266 +1,359 @@
 """Unit tests for Pydantic models."""
 
 import pytest
-from datetime import datetime
 
 from jira_api.models.user import User, UserSearch
 from jira_api.models.project import Project, ProjectVersion, ProjectVersionCreate
 from jira_api.models.issue import (
-    Issue,
     IssueCreate,
     IssueUpdate,
-    IssueFields,
     IssueStatus,
     IssueTransition,
     IssueTransitionRequest,
+    _adf,
 )
 
 
-class TestUserModels:
-    """Test user-related models."""
-
-    def test_user_model_creation(self):
-        """Test User model creation with required fields."""
-        user = User(
-            account_id="12345",
-            display_name="John Doe",
-            active=True,
-        )
-        
-        assert user.account_id == "12345"
-        assert user.display_name == "John Doe"
-        assert user.active is True
-        assert user.email_address is None
-
-    def test_user_model_with_all_fields(self):
-        """Test User model with all optional fields."""
-        user = User(
-            account_id="12345",
-            email_address="john@example.com",
-            display_name="John Doe",
-            active=True,
-            avatar_urls={"48x48": "https://example.com/avatar.png"},
-            time_zone="UTC",
-            locale="en_US",
-        )
-        
-        assert user.email_address == "john@example.com"
-        assert user.avatar_urls == {"48x48": "https://example.com/avatar.png"}
-        assert user.time_zone == "UTC"
-        assert user.locale == "en_US"
-
-    def test_user_search_model(self):
-        """Test UserSearch model."""
-        search = UserSearch(query="john", max_results=25)
-        
-        assert search.query == "john"
-        assert search.max_results == 25
-        assert search.start_at == 0
-        assert search.project_keys is None
-
-
-class TestProjectModels:
-    """Test project-related models."""
-
-    def test_project_version_model(self):
-        """Test ProjectVersion model creation."""
-        version = ProjectVersion(
-            id="10000",
-            name="Version 1.0",
-            project_id=1000,
-            archived=False,
-            released=True,
-        )
-        
-        assert version.id == "10000"
-        assert version.name == "Version 1.0"
-        assert version.project_id == 1000
-        assert version.archived is False
-        assert version.released is True
-        assert version.description is None
-
-    def test_project_version_create_model(self):
-        """Test ProjectVersionCreate model."""
-        version_create = ProjectVersionCreate(
-            name="Version 2.0",
-            project_id=1000,
-            description="New version",
-            start_date="2023-01-01",
-            release_date="2023-12-31",
-        )
-        
-        assert version_create.name == "Version 2.0"
-        assert version_create.project_id == 1000
-        assert version_create.description == "New version"
-        assert version_create.start_date == "2023-01-01"
-        assert version_create.release_date == "2023-12-31"
-
-    def test_project_model(self):
-        """Test Project model creation."""
-        project = Project(
-            id="10000",
-            key="TEST",
-            name="Test Project",
-            project_type_key="software",
-        )
-        
-        assert project.id == "10000"
-        assert project.key == "TEST"
-        assert project.name == "Test Project"
-        assert project.project_type_key == "software"
-        assert project.description is None
-
-
-class TestIssueModels:
-    """Test issue-related models."""
-
-    def test_issue_status_model(self):
-        """Test IssueStatus model."""
-        status = IssueStatus(
-            id="1",
-            name="Open",
-            description="Issue is open",
-        )
-        
-        assert status.id == "1"
-        assert status.name == "Open"
-        assert status.description == "Issue is open"
-
-    def test_issue_transition_model(self):
-        """Test IssueTransition model."""
-        status = IssueStatus(id="2", name="In Progress", description="Work in progress")
-        transition = IssueTransition(
-            id="11",
-            name="Start Progress",
-            to=status,
-            has_screen=True,
-        )
-        
-        assert transition.id == "11"
-        assert transition.name == "Start Progress"
-        assert transition.to.name == "In Progress"
-        assert transition.has_screen is True
-
-    def test_issue_create_model(self):
-        """Test IssueCreate model."""
-        issue_create = IssueCreate(
-            project_id="10000",
-            summary="Test issue",
-            issue_type_id="10001",
-            description="Test description",
-            labels=["bug", "urgent"],
-        )
-        
-        assert issue_create.project_id == "10000"
-        assert issue_create.summary == "Test issue"
-        assert issue_create.issue_type_id == "10001"
-        assert issue_create.description == "Test description"
-        assert issue_create.labels == ["bug", "urgent"]
-
-    def test_issue_create_to_jira_format(self):
-        """Test IssueCreate to_jira_format method."""
-        issue_create = IssueCreate(
-            project_id="10000",
-            summary="Test issue",
-            issue_type_id="10001",
-            description="Test description",
-            priority_id="3",
-            assignee_account_id="12345",
-            labels=["bug"],
-        )
-        
-        jira_format = issue_create.to_jira_format()
-        
-        assert jira_format["fields"]["project"]["id"] == "10000"
-        assert jira_format["fields"]["summary"] == "Test issue"
-        assert jira_format["fields"]["issuetype"]["id"] == "10001"
-        assert jira_format["fields"]["priority"]["id"] == "3"
-        assert jira_format["fields"]["assignee"]["accountId"] == "12345"
-        assert jira_format["fields"]["labels"] == ["bug"]
-        
-        # Check description format (ADF)
-        description = jira_format["fields"]["description"]
-        assert description["type"] == "doc"
-        assert description["version"] == 1
-        assert description["content"][0]["type"] == "paragraph"
-        assert description["content"][0]["content"][0]["text"] == "Test description"
-
-    def test_issue_update_model(self):
-        """Test IssueUpdate model."""
-        issue_update = IssueUpdate(
-            summary="Updated summary",
-            labels_add=["new-label"],
-            labels_remove=["old-label"],
-        )
-        
-        assert issue_update.summary == "Updated summary"
-        assert issue_update.labels_add == ["new-label"]
-        assert issue_update.labels_remove == ["old-label"]
-
-    def test_issue_update_to_jira_format(self):
-        """Test IssueUpdate to_jira_format method."""
-        issue_update = IssueUpdate(
-            summary="Updated summary",
-            description="Updated description",
-            labels_add=["new"],
-            labels_remove=["old"],
-        )
-        
-        jira_format = issue_update.to_jira_format()
-        
-        assert jira_format["update"]["summary"] == [{"set": "Updated summary"}]
-        assert {"add": "new"} in jira_format["update"]["labels"]
-        assert {"remove": "old"} in jira_format["update"]["labels"]
-        
-        # Check description format
-        description_update = jira_format["update"]["description"][0]["set"]
-        assert description_update["type"] == "doc"
-
-    def test_issue_transition_request_model(self):
-        """Test IssueTransitionRequest model."""
-        transition_request = IssueTransitionRequest(
-            transition_id="11",
-            comment="Moving to in progress",
-            resolution_name="Fixed",
-        )
-        
-        assert transition_request.transition_id == "11"
-        assert transition_request.comment == "Moving to in progress"
-        assert transition_request.resolution_name == "Fixed"
-
-    def test_issue_transition_request_to_jira_format(self):
-        """Test IssueTransitionRequest to_jira_format method."""
-        transition_request = IssueTransitionRequest(
-            transition_id="11",
-            comment="Resolving issue",
-            resolution_name="Fixed",
-        )
-        
-        jira_format = transition_request.to_jira_format()
-        
-        assert jira_format["transition"]["id"] == "11"
-        assert jira_format["fields"]["resolution"]["name"] == "Fixed"
-        
-        # Check comment format
-        comment_update = jira_format["update"]["comment"][0]["add"]["body"]
-        assert comment_update["type"] == "doc"
-        assert comment_update["content"][0]["content"][0]["text"] == "Resolving issue"
-
-
-class TestModelValidation:
-    """Test model validation."""
-
-    def test_user_missing_required_fields(self):
-        """Test User model validation with missing required fields."""
-        with pytest.raises(ValueError):
-            User()
-
-    def test_issue_create_missing_required_fields(self):
-        """Test IssueCreate model validation with missing required fields."""
-        with pytest.raises(ValueError):
-            IssueCreate()
-
-    def test_project_version_create_missing_required_fields(self):
-        """Test ProjectVersionCreate validation with missing required fields."""
-        with pytest.raises(ValueError):
-            ProjectVersionCreate()
\ No newline at end of file
+# Payloads are built once per module; the tests below only read them
+
+
+@pytest.fixture(scope="module")
+def issue_create_jira_format():
+    """Provide the JIRA payload of a fully populated IssueCreate."""
+    return IssueCreate(
+        project_id="10000",
+        summary="Test issue",
+        issue_type_id="10001",
+        description="Test description",
+        priority_id="3",
+        assignee_account_id="12345",
+        labels=["bug"],
+    ).to_jira_format()
+
+
+@pytest.fixture(scope="module")
+def issue_update_jira_format():
+    """Provide the JIRA payload of an IssueUpdate touching every field kind."""
+    return IssueUpdate(
+        summary="Updated summary",
+        description="Updated description",
+        labels_add=["new"],
+        labels_remove=["old"],
+    ).to_jira_format()
+
+
+@pytest.fixture(scope="module")
+def transition_request_jira_format():
+    """Provide the JIRA payload of an IssueTransitionRequest with comment."""
+    return IssueTransitionRequest(
+        transition_id="11",
+        comment="Resolving issue",
+        resolution_name="Fixed",
+    ).to_jira_format()
+
+
+@pytest.fixture(scope="module")
+def expected_issue_create_jira_format():
+    """Provide the payload expected from ``issue_create_jira_format``."""
+    return {
+        "fields": {
+            "project": {"id": "10000"},
+            "summary": "Test issue",
+            "issuetype": {"id": "10001"},
+            "description": _adf("Test description"),
+            "priority": {"id": "3"},
+            "assignee": {"accountId": "12345"},
+            "labels": ["bug"],
+        }
+    }
+
+
+@pytest.fixture(scope="module")
+def expected_issue_update_jira_format():
+    """Provide the payload expected from ``issue_update_jira_format``."""
+    return {
+        "update": {
+            "summary": [{"set": "Updated summary"}],
+            "description": [{"set": _adf("Updated description")}],
+            "labels": [{"add": "new"}, {"remove": "old"}],
+        }
+    }
+
+
+@pytest.fixture(scope="module")
+def expected_transition_request_jira_format():
+    """Provide the payload expected from ``transition_request_jira_format``."""
+    return {
+        "transition": {"id": "11"},
+        "fields": {"resolution": {"name": "Fixed"}},
+        "update": {"comment": [{"add": {"body": _adf("Resolving issue")}}]},
+    }
+
+
+# User models
+
+
+def test_user_model_creation():
+    """Test User model creation with required fields."""
+    user = User(
+        account_id="12345",
+        display_name="John Doe",
+        active=True,
+    )
+    
+    assert user.account_id == "12345"
+    assert user.display_name == "John Doe"
+    assert user.active is True
+    assert user.email_address is None
+
+
+def test_user_model_with_all_fields():
+    """Test User model with all optional fields."""
+    user = User(
+        account_id="12345",
+        email_address="john@example.com",
+        display_name="John Doe",
+        active=True,
+        avatar_urls={"48x48": "https://example.com/avatar.png"},
+        time_zone="UTC",
+        locale="en_US",
+    )
+    
+    assert user.email_address == "john@example.com"
+    assert user.avatar_urls == {"48x48": "https://example.com/avatar.png"}
+    assert user.time_zone == "UTC"
+    assert user.locale == "en_US"
+
+
+def test_user_model_is_frozen():
+    """Test that User rejects mutation."""
+    user = User(account_id="12345", display_name="John Doe")
+
+    with pytest.raises(ValueError):
+        user.display_name = "Jane Doe"
+
+
+def test_user_search_model():
+    """Test UserSearch model."""
+    search = UserSearch(query="john", max_results=25)
+    
+    assert search.query == "john"
+    assert search.max_results == 25
+    assert search.start_at == 0
+    assert search.project_keys is None
+
+
+# Project models
+
+
+def test_project_version_model():
+    """Test ProjectVersion model creation."""
+    version = ProjectVersion(
+        id="10000",
+        name="Version 1.0",
+        project_id=1000,
+        archived=False,
+        released=True,
+    )
+    
+    assert version.id == "10000"
+    assert version.name == "Version 1.0"
+    assert version.project_id == 1000
+    assert version.archived is False
+    assert version.released is True
+    assert version.description is None
+
+
+def test_project_version_create_model():
+    """Test ProjectVersionCreate model."""
+    version_create = ProjectVersionCreate(
+        name="Version 2.0",
+        project_id=1000,
+        description="New version",
+        start_date="2023-01-01",
+        release_date="2023-12-31",
+    )
+    
+    assert version_create.name == "Version 2.0"
+    assert version_create.project_id == 1000
+    assert version_create.description == "New version"
+    assert version_create.start_date == "2023-01-01"
+    assert version_create.release_date == "2023-12-31"
+
+
+def test_project_model():
+    """Test Project model creation."""
+    project = Project(
+        id="10000",
+        key="TEST",
+        name="Test Project",
+        project_type_key="software",
+    )
+    
+    assert project.id == "10000"
+    assert project.key == "TEST"
+    assert project.name == "Test Project"
+    assert project.project_type_key == "software"
+    assert project.description is None
+
+
+# Issue models
+
+
+def test_adf_wraps_text_in_paragraph():
+    """Test that _adf builds a single-paragraph ADF document."""
+    assert _adf("Test description") == {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": "Test description"}]}
+        ],
+    }
+
+
+def test_adf_returns_new_document_per_call():
+    """Test that payloads never share an ADF document callers could modify."""
+    first = _adf("Test description")
+    second = _adf("Test description")
+
+    assert first == second
+    assert first is not second
+    assert first["content"] is not second["content"]
+
+
+def test_issue_status_model():
+    """Test IssueStatus model."""
+    status = IssueStatus(
+        id="1",
+        name="Open",
+        description="Issue is open",
+    )
+    
+    assert status.id == "1"
+    assert status.name == "Open"
+    assert status.description == "Issue is open"
+
+
+def test_issue_transition_model():
+    """Test IssueTransition model."""
+    # Only the transition is under test, so its target skips validation
+    status = IssueStatus.model_construct(
+        id="2", name="In Progress", description="Work in progress"
+    )
+    transition = IssueTransition(
+        id="11",
+        name="Start Progress",
+        to=status,
+        has_screen=True,
+    )
+    
+    assert transition.id == "11"
+    assert transition.name == "Start Progress"
+    assert transition.to.name == "In Progress"
+    assert transition.has_screen is True
+
+
+def test_issue_create_model():
+    """Test IssueCreate model."""
+    issue_create = IssueCreate(
+        project_id="10000",
+        summary="Test issue",
+        issue_type_id="10001",
+        description="Test description",
+        labels=["bug", "urgent"],
+    )
+    
+    assert issue_create.project_id == "10000"
+    assert issue_create.summary == "Test issue"
+    assert issue_create.issue_type_id == "10001"
+    assert issue_create.description == "Test description"
+    assert issue_create.labels == ["bug", "urgent"]
+
+
+def test_issue_create_to_jira_format(issue_create_jira_format, expected_issue_create_jira_format):
+    """Test IssueCreate to_jira_format method."""
+    assert issue_create_jira_format == expected_issue_create_jira_format
+
+
+def test_issue_create_by_project_key():
+    """Test that IssueCreate identifies the project by key when no ID is given."""
+    issue_create = IssueCreate(project_key="PROJ", summary="Test issue", issue_type_id="10001")
+
+    assert issue_create.to_jira_format()["fields"]["project"] == {"key": "PROJ"}
+
+
+def test_issue_update_model():
+    """Test IssueUpdate model."""
+    issue_update = IssueUpdate(
+        summary="Updated summary",
+        labels_add=["new-label"],
+        labels_remove=["old-label"],
+    )
+    
+    assert issue_update.summary == "Updated summary"
+    assert issue_update.labels_add == ["new-label"]
+    assert issue_update.labels_remove == ["old-label"]
+
+
+def test_issue_update_to_jira_format(issue_update_jira_format, expected_issue_update_jira_format):
+    """Test IssueUpdate to_jira_format method."""
+    assert issue_update_jira_format == expected_issue_update_jira_format
+
+
+def test_issue_transition_request_model():
+    """Test IssueTransitionRequest model."""
+    transition_request = IssueTransitionRequest(
+        transition_id="11",
+        comment="Moving to in progress",
+        resolution_name="Fixed",
+    )
+    
+    assert transition_request.transition_id == "11"
+    assert transition_request.comment == "Moving to in progress"
+    assert transition_request.resolution_name == "Fixed"
+
+
+def test_issue_transition_request_to_jira_format(
+    transition_request_jira_format, expected_transition_request_jira_format
+):
+    """Test IssueTransitionRequest to_jira_format method."""
+    assert transition_request_jira_format == expected_transition_request_jira_format
+
+
+# Validation
+
+
+@pytest.mark.parametrize("model_cls", [User, IssueCreate, ProjectVersionCreate])
+def test_missing_required_fields(model_cls):
+    """Test model validation with missing required fields."""
+    with pytest.raises(ValueError):
+        model_cls()
+
+
+def test_issue_create_requires_project():
+    """Test that IssueCreate needs either a project ID or key."""
+    with pytest.raises(ValueError, match="project_id or project_key"):
+        IssueCreate(summary="Test issue", issue_type_id="10001")
+
+
+def test_project_response_models_are_frozen():
+    """Test that project response models reject mutation."""
+    version = ProjectVersion(id="10000", name="v1.0", project_id=10000)
+
+    with pytest.raises(ValueError):
+        version.released = True
+
+
+def test_issue_response_models_are_frozen():
+    """Test that issue response models reject mutation."""
+    status = IssueStatus(id="1", name="Open", description="Issue is open")
+
+    with pytest.raises(ValueError):
+        status.name = "Closed"
+
+
+def test_issue_response_models_ignore_unknown_fields():
+    """Test that unexpected response fields are dropped."""
+    status = IssueStatus(id="1", name="Open", description="Issue is open", iconUrl="x")
+
+    assert not hasattr(status, "iconUrl")
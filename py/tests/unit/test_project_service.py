@@ -0,0 +1,53 @@
+"""Unit tests for ProjectService functionality."""
+
+from unittest.mock import Mock
+
+from jira_api.core.client import JiraClient
+from jira_api.models.project import Project, ProjectVersion
+from jira_api.services.project_service import ProjectService
+
+
+def _version(version_id, name, released=False):
+    return ProjectVersion(id=version_id, name=name, released=released, project_id=10000)
+
+
+class TestProjectService:
+    """Test ProjectService functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client = Mock(spec=JiraClient)
+        self.mock_client.get_project_versions.return_value = [
+            _version("1", "1.0", released=True),
+            _version("2", "2.0"),
+        ]
+        self.project_service = ProjectService(self.mock_client)
+
+    def test_version_lookups_share_one_fetch(self):
+        """Test that name and release lookups reuse the cached version list."""
+        assert self.project_service.get_version_by_name("PROJ", "2.0").id == "2"
+        assert self.project_service.get_version_by_name("PROJ", "3.0") is None
+        assert [v.name for v in self.project_service.get_released_versions("PROJ")] == ["1.0"]
+        assert [v.name for v in self.project_service.get_unreleased_versions("PROJ")] == ["2.0"]
+
+        self.mock_client.get_project_versions.assert_called_once_with("PROJ")
+
+    def test_create_version_invalidates_cache(self):
+        """Test that creating a version forces the next lookup to refetch."""
+        self.mock_client.get_project.return_value = Project(
+            id="10000", key="PROJ", name="Test Project", project_type_key="software"
+        )
+        self.mock_client.create_project_version.return_value = _version("3", "3.0")
+
+        self.project_service.get_project_versions("PROJ")
+        self.project_service.create_version("PROJ", "3.0")
+        self.project_service.get_version_by_name("PROJ", "3.0")
+
+        assert self.mock_client.get_project_versions.call_count == 2
+
+    def test_services_on_one_client_share_versions(self):
+        """Test that a service built per request reuses versions fetched by another."""
+        self.project_service.get_project_versions("PROJ")
+        ProjectService(self.mock_client).get_version_by_name("PROJ", "2.0")
+
+        self.mock_client.get_project_versions.assert_called_once_with("PROJ")
@@ -0,0 +1,313 @@
+"""Unit tests for the SDK clients."""
+
+import asyncio
+import base64
+from unittest.mock import patch
+
+import httpx
+import orjson
+import pytest
+
+from jira_api.exceptions import SDKError
+from jira_api.models.issue import Issue, IssueCreate, IssueUpdate
+from jira_api.models.project import Project, ProjectVersion
+from jira_api.sdk import AsyncJiraSDKClient, JiraSDKClient
+from jira_api.sdk.construct import construct, construct_list, list_adapter
+from jira_api.sdk.dump import dump_set_fields
+
+
+def _issue_data(key):
+    return {
+        "id": key.split("-")[1],
+        "key": key,
+        "self": f"https://test.atlassian.net/rest/api/3/issue/{key}",
+        "fields": {
+            "summary": f"Summary of {key}",
+            "issuetype": {"id": "10001", "name": "Task", "description": "A task"},
+            "project": {"id": "10000", "key": "PROJ", "name": "Test Project"},
+            "status": {"id": "1", "name": "To Do", "description": "Not started"},
+        },
+    }
+
+
+class TestJiraSDKClient:
+    """Test synchronous SDK client functionality."""
+
+    def test_error_response_raises_sdk_error(self):
+        """Test that error responses surface the server's detail message."""
+        client = JiraSDKClient(base_url="http://localhost:8000")
+        response = httpx.Response(404, json={"detail": "Issue not found"})
+
+        with patch.object(client._client, "request", return_value=response):
+            with pytest.raises(SDKError) as exc_info:
+                client.get_issue("PROJ-1")
+
+        assert exc_info.value.status_code == 404
+        assert "Issue not found" in str(exc_info.value)
+        client.close()
+
+    def test_non_json_error_response_uses_status(self):
+        """Test that non-JSON error bodies fall back to the status code."""
+        client = JiraSDKClient(base_url="http://localhost:8000")
+        response = httpx.Response(502, text="<html>Bad Gateway</html>")
+
+        with patch.object(client._client, "request", return_value=response):
+            with pytest.raises(SDKError) as exc_info:
+                client.get_issue("PROJ-1")
+
+        assert exc_info.value.message == "HTTP 502"
+        assert exc_info.value.response_data == {}
+        client.close()
+
+    def test_request_body_is_encoded_with_orjson(self):
+        """Test that JSON bodies are sent as pre-encoded bytes."""
+        client = JiraSDKClient(base_url="http://localhost:8000")
+        response = httpx.Response(204)
+
+        with patch.object(client._client, "request", return_value=response) as mock_request:
+            result = client.transition_issue("PROJ-1", "Done")
+
+        assert result is None
+        assert orjson.loads(mock_request.call_args.kwargs["content"]) == {
+            "transition_name": "Done",
+            "comment": None,
+            "resolution_name": None,
+        }
+        client.close()
+
+    def test_trusted_responses_match_validated(self):
+        """Test that trust_server builds the same models without validating."""
+        key = "PROJ-1"
+        data = dict(_issue_data(key))
+        data["fields"] = dict(data["fields"], created="2024-01-15T10:30:00Z", labels=["a"])
+
+        trusted = JiraSDKClient(base_url="http://localhost:8000", trust_server=True)
+        validating = JiraSDKClient(base_url="http://localhost:8000", trust_server=False)
+        with patch.object(JiraSDKClient, "_make_request_raw", return_value=orjson.dumps(data)):
+            assert trusted.get_issue(key) == validating.get_issue(key)
+
+    def test_trusted_project_renames_nested_aliases(self):
+        """Test that camelCase keys are mapped at every nesting level."""
+        data = {
+            "id": "10000",
+            "key": "PROJ",
+            "name": "Test Project",
+            "projectTypeKey": "software",
+            "lead": {"accountId": "abc", "displayName": "Lead"},
+            "issueTypes": [{"id": "1", "name": "Bug", "description": "A bug"}],
+            "versions": [{"id": "2", "name": "1.0", "project_id": 10000, "release_date": "2024-01-15T00:00:00Z"}],
+        }
+
+        assert construct(Project, data) == Project.model_validate(data)
+
+    def test_trusted_list_handles_mixed_key_orders(self):
+        """Test that list elements with a different key layout are still built correctly."""
+        data = [
+            {"id": "1", "name": "1.0", "project_id": 10000, "released": True},
+            {"name": "2.0", "id": "2", "project_id": 10000},
+            {"id": "3", "name": "3.0", "project_id": 10000, "released": False, "extra": 1},
+        ]
+
+        assert construct_list(ProjectVersion, data) == list_adapter(ProjectVersion).validate_python(data)
+
+    def test_trusted_construction_interns_type_names(self):
+        """Test that repeated low-cardinality values share one str object."""
+        first, second = (
+            construct(Issue, orjson.loads(orjson.dumps(_issue_data(key))))
+            for key in ("PROJ-1", "PROJ-2")
+        )
+
+        assert first.fields.issue_type.name is second.fields.issue_type.name
+        assert first.fields.status.name is second.fields.status.name
+
+    def test_trust_server_from_environment(self, monkeypatch):
+        """Test that JIRA_SDK_TRUST_SERVER=1 enables trusted parsing."""
+        monkeypatch.setenv("JIRA_SDK_TRUST_SERVER", "1")
+        assert JiraSDKClient(base_url="http://localhost:8000").trust_server is True
+
+        monkeypatch.delenv("JIRA_SDK_TRUST_SERVER")
+        assert JiraSDKClient(base_url="http://localhost:8000").trust_server is False
+
+    def test_get_project_versions_validates_raw_json(self):
+        """Test that list responses are validated straight from the body."""
+        raw = b'[{"id": "1", "name": "1.0", "project_id": 10000}, {"id": "2", "name": "2.0", "project_id": 10000}]'
+        client = JiraSDKClient(base_url="http://localhost:8000", trust_server=False)
+
+        with patch.object(client._client, "request", return_value=httpx.Response(200, content=raw)):
+            versions = client.get_project_versions("PROJ")
+
+        assert [v.name for v in versions] == ["1.0", "2.0"]
+
+    def test_invalid_response_raises_sdk_error(self):
+        """Test that validation failures are reported as SDKError."""
+        client = JiraSDKClient(base_url="http://localhost:8000", trust_server=False)
+
+        response = httpx.Response(200, content=b'[{"id": "1"}]')
+        with patch.object(client._client, "request", return_value=response):
+            with pytest.raises(SDKError, match="Failed to parse project versions"):
+                client.get_project_versions("PROJ")
+
+    def test_clients_share_pooled_connections(self):
+        """Test that equal configurations reuse one HTTP client that close() keeps open."""
+        first = JiraSDKClient(base_url="http://pool.test", api_key="secret")
+        second = JiraSDKClient(base_url="http://pool.test/", api_key="secret")
+        other = JiraSDKClient(base_url="http://pool.test", api_key="other")
+
+        assert first._client is second._client
+        assert other._client is not first._client
+
+        first.close()
+        assert not second._client.is_closed
+
+    def test_unpooled_client_is_closed(self):
+        """Test that pooled=False gives the client its own connections."""
+        with JiraSDKClient(base_url="http://pool.test", pooled=False) as client:
+            assert client._client is not JiraSDKClient(base_url="http://pool.test")._client
+
+        assert client._client.is_closed
+
+    def test_api_key_sets_basic_authorization_header(self):
+        """Test that the API key is sent as a precomputed Basic auth header."""
+        client = JiraSDKClient(base_url="http://localhost:8000", api_key="secret")
+        expected = "Basic " + base64.b64encode(b"secret:").decode()
+
+        assert client._client.headers["Authorization"] == expected
+        assert client._client.auth is None
+        client.close()
+
+    @pytest.mark.parametrize("base_url", ["http://localhost:8000/api", "http://localhost:8000/api/"])
+    def test_request_url_is_joined_to_base(self, base_url):
+        """Test that endpoints are appended to the base URL path."""
+        client = JiraSDKClient(base_url=base_url)
+
+        with patch.object(client._client, "request", return_value=httpx.Response(200)) as mock_request:
+            client.health_check()
+
+        assert mock_request.call_args.kwargs["url"] == "http://localhost:8000/api/health"
+        client.close()
+
+    def test_not_modified_reuses_cached_project(self):
+        """Test that a 304 reply returns the previously parsed project."""
+        client = JiraSDKClient(base_url="http://localhost:8000")
+        body = orjson.dumps(_issue_data("PROJ-1")["fields"]["project"])
+        responses = [
+            httpx.Response(200, content=body, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+
+        with patch.object(client._client, "request", side_effect=responses) as mock_request:
+            first = client.get_project("PROJ")
+            second = client.get_project("PROJ")
+
+        assert second is first
+        assert mock_request.call_args_list[0].kwargs["headers"] is None
+        assert mock_request.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+        client.close()
+
+    def test_responses_without_etag_are_not_cached(self):
+        """Test that responses lacking an ETag are fetched unconditionally."""
+        client = JiraSDKClient(base_url="http://localhost:8000")
+        response = httpx.Response(200, content=b"[]")
+
+        with patch.object(client._client, "request", return_value=response) as mock_request:
+            client.get_project_versions("PROJ")
+            client.get_project_versions("PROJ")
+
+        assert all(call.kwargs["headers"] is None for call in mock_request.call_args_list)
+        client.close()
+
+    def test_not_modified_issue_types_are_not_shared(self):
+        """Test that cached issue types come back as separate dicts on each call."""
+        client = JiraSDKClient(base_url="http://localhost:8000")
+        body = orjson.dumps([{"id": "10001", "name": "Task", "fields": {"summary": {}}}])
+        responses = [
+            httpx.Response(200, content=body, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+
+        with patch.object(client._client, "request", side_effect=responses):
+            first = client.get_project_issue_types("PROJ")
+            first[0]["fields"]["summary"]["required"] = True
+            second = client.get_project_issue_types("PROJ")
+
+        assert second == orjson.loads(body)
+        client.close()
+
+    def test_get_issues_fetches_through_async_client(self):
+        """Test that the bulk sync call returns issues in the requested order."""
+
+        async def fake_request(method, endpoint, params=None, json_data=None):
+            return orjson.dumps(_issue_data(endpoint.rsplit("/", 1)[1]))
+
+        client = JiraSDKClient(base_url="http://localhost:8000")
+        with patch.object(AsyncJiraSDKClient, "_make_request_raw", side_effect=fake_request):
+            issues = client.get_issues(["PROJ-2", "PROJ-1"])
+
+        assert [issue.key for issue in issues] == ["PROJ-2", "PROJ-1"]
+
+
+class TestAsyncJiraSDKClient:
+    """Test asynchronous SDK client functionality."""
+
+    def test_get_issues_runs_concurrently_in_order(self):
+        """Test that get_issues returns issues in the requested order."""
+
+        async def fake_request(method, endpoint, params=None, json_data=None):
+            key = endpoint.rsplit("/", 1)[1]
+            await asyncio.sleep(0.01 / int(key.split("-")[1]))
+            return orjson.dumps(_issue_data(key))
+
+        async def run():
+            async with AsyncJiraSDKClient(base_url="http://localhost:8000") as client:
+                with patch.object(client, "_make_request_raw", side_effect=fake_request):
+                    return await client.get_issues(["PROJ-1", "PROJ-2", "PROJ-3"])
+
+        issues = asyncio.run(run())
+
+        assert [issue.key for issue in issues] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+
+    def test_get_issues_limits_concurrency(self):
+        """Test that no more than ``concurrency`` requests are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(method, endpoint, params=None, json_data=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return orjson.dumps(_issue_data(endpoint.rsplit("/", 1)[1]))
+
+        async def run():
+            async with AsyncJiraSDKClient(base_url="http://localhost:8000") as client:
+                with patch.object(client, "_make_request_raw", side_effect=fake_request):
+                    return await client.get_issues([f"PROJ-{i}" for i in range(1, 11)], concurrency=3)
+
+        issues = asyncio.run(run())
+
+        assert len(issues) == 10
+        assert peak == 3
+
+
+class TestDumpSetFields:
+    """Test request body serialization."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            IssueCreate(project_id="10000", summary="New", issue_type_id="10001"),
+            IssueCreate(
+                project_id="10000",
+                summary="New",
+                issue_type_id="10001",
+                description=None,
+                labels=["a", "b"],
+            ),
+            IssueUpdate(),
+            IssueUpdate(summary="Renamed", labels_remove=["old"]),
+        ],
+    )
+    def test_matches_model_dump_exclude_unset(self, model):
+        """Test that the fast dump matches pydantic's exclude_unset dump."""
+        assert dump_set_fields(model) == model.model_dump(exclude_unset=True)
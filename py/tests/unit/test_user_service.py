@@ -0,0 +1,90 @@
+"""Unit tests for UserService functionality."""
+
+from unittest.mock import Mock, call
+
+from jira_api.core.client import JiraClient
+from jira_api.exceptions import JiraNotFoundError
+from jira_api.models.user import User
+from jira_api.services.user_service import UserService
+
+
+def _users(start, count):
+    return [User(accountId=str(i), displayName=f"User {i}") for i in range(start, start + count)]
+
+
+class TestUserService:
+    """Test UserService functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client = Mock(spec=JiraClient)
+        self.user_service = UserService(self.mock_client)
+
+    def test_search_users_iter_pages_until_max_results(self):
+        """Test that results are fetched page by page up to max_results."""
+        self.mock_client.search_users.side_effect = [_users(0, 2), _users(2, 1)]
+
+        users = list(self.user_service.search_users_iter("user", max_results=3, page_size=2))
+
+        assert [user.account_id for user in users] == ["0", "1", "2"]
+        assert self.mock_client.search_users.call_args_list == [
+            call("user", max_results=2, start_at=0),
+            call("user", max_results=1, start_at=2),
+        ]
+
+    def test_search_users_iter_stops_on_short_page(self):
+        """Test that a partial page ends the search without another request."""
+        self.mock_client.search_users.return_value = _users(0, 1)
+
+        users = list(self.user_service.search_users_iter("user", max_results=50, page_size=10))
+
+        assert len(users) == 1
+        self.mock_client.search_users.assert_called_once()
+
+    def test_get_user_by_email_reuses_match(self):
+        """Test that a found user is not searched for again."""
+        user = User(accountId="1", displayName="John", emailAddress="john@example.com")
+        self.mock_client.search_users.return_value = [user]
+
+        assert self.user_service.get_user_by_email("john@example.com") is user
+        assert self.user_service.account_id_for("JOHN@example.com") == "1"
+        self.mock_client.search_users.assert_called_once()
+
+    def test_get_user_by_email_does_not_remember_misses(self):
+        """Test that a search without a match is repeated on the next lookup."""
+        self.mock_client.search_users.return_value = []
+
+        assert self.user_service.account_id_for("nobody@example.com") is None
+        assert self.user_service.account_id_for("nobody@example.com") is None
+        assert self.mock_client.search_users.call_count == 2
+
+    def test_user_lookups_are_shared_per_client(self):
+        """Test that services built on the same client share cached users."""
+        user = User(accountId="1", displayName="John")
+        self.mock_client.get_user.return_value = user
+
+        assert self.user_service.get_user_by_id("1") is user
+        assert UserService(self.mock_client).get_user_by_id("1") is user
+        self.mock_client.get_user.assert_called_once_with("1")
+
+        other_client = Mock(spec=JiraClient)
+        UserService(other_client).get_user_by_id("1")
+        other_client.get_user.assert_called_once_with("1")
+
+    def test_get_user_by_identifier_searches_emails_directly(self):
+        """Test that email-shaped identifiers skip the account ID lookup."""
+        user = User(accountId="1", displayName="John", emailAddress="john@example.com")
+        self.mock_client.search_users.return_value = [user]
+
+        assert self.user_service.get_user_by_identifier("john@example.com") is user
+        self.mock_client.get_user.assert_not_called()
+
+    def test_get_user_by_identifier_remembers_unknown_identifiers(self):
+        """Test that an identifier matching nobody is not looked up again."""
+        self.mock_client.get_user.side_effect = JiraNotFoundError()
+        self.mock_client.search_users.return_value = []
+
+        assert self.user_service.get_user_by_identifier("missing-id") is None
+        assert self.user_service.get_user_by_identifier("missing-id") is None
+        self.mock_client.get_user.assert_called_once_with("missing-id")
+        self.mock_client.search_users.assert_called_once()